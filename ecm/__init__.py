@@ -1,16 +1,25 @@
 """Easy Cassandra MCP Server - ECM Package"""
 
-from .cassandra_connection import CassandraConnection
-from .cassandra_service import CassandraService
-from .cassandra_table import CassandraTable
-from .cassandra_utility import CassandraUtility
-from .compaction_analyzer import CompactionAnalyzer
-from .configuration_analyzer import ConfigurationAnalyzer
-from .exceptions import CassandraConnectionError
-from .mcp_server import create_mcp_server
-from .recommendation import Recommendation, RecommendationCategory, RecommendationPriority
-from .thread_pool_analyzer import ThreadPoolAnalyzer
-from .thread_pool_stats import ThreadPoolStats, ThreadPoolStat
+import importlib
+
+# Public names are imported from their submodule on first access (PEP 562), so
+# importing one module (e.g. ecm.config) doesn't load the driver and fastmcp
+_LAZY_IMPORTS = {
+    "CassandraConnection": "cassandra_connection",
+    "CassandraService": "cassandra_service",
+    "CassandraTable": "cassandra_table",
+    "CassandraUtility": "cassandra_utility",
+    "CompactionAnalyzer": "compaction_analyzer",
+    "ConfigurationAnalyzer": "configuration_analyzer",
+    "CassandraConnectionError": "exceptions",
+    "create_mcp_server": "mcp_server",
+    "Recommendation": "recommendation",
+    "RecommendationCategory": "recommendation",
+    "RecommendationPriority": "recommendation",
+    "ThreadPoolAnalyzer": "thread_pool_analyzer",
+    "ThreadPoolStats": "thread_pool_stats",
+    "ThreadPoolStat": "thread_pool_stats",
+}
 
 __all__ = [
     "CassandraConnection",
@@ -27,4 +36,18 @@ __all__ = [
     "ThreadPoolAnalyzer",
     "ThreadPoolStats",
     "ThreadPoolStat",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
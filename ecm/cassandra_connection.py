@@ -1,20 +1,281 @@
 import asyncio
+import hmac
 import logging
-from typing import Any, Dict, List, Optional, Set
-
-from cassandra import ConsistencyLevel
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import (Any, AsyncIterator, Dict, Iterable, List, Optional,
+                    Sequence, Tuple)
+from weakref import WeakKeyDictionary
+
+from cassandra import ConsistencyLevel, OperationTimedOut
 from cassandra.auth import PlainTextAuthProvider
-from cassandra.cluster import (EXEC_PROFILE_DEFAULT, Cluster, ExecutionProfile,
-                               Session)
-from cassandra.policies import (DCAwareRoundRobinPolicy,
+from cassandra.cluster import (_NOT_SET, EXEC_PROFILE_DEFAULT, Cluster,
+                               ExecutionProfile, ResponseFuture, Session)
+from cassandra.concurrent import execute_concurrent_with_args
+from cassandra.policies import (DCAwareRoundRobinPolicy, HostStateListener,
                                 WhiteListRoundRobinPolicy)
+from cassandra.query import BoundStatement, PreparedStatement
 
-from .constants import CONNECTION_TIMEOUT, QUERY_TIMEOUT
+from .constants import (BLOCKING_EXECUTOR_WORKERS, BULK_QUERY_CONCURRENCY,
+                        CONNECTION_TIMEOUT, MAX_CACHED_BOUND_STATEMENTS,
+                        MAX_HOST_EXECUTION_PROFILES, MAX_QUERY_LOG_LENGTH,
+                        QUERY_TIMEOUT)
 from .exceptions import CassandraConnectionError, CassandraQueryError
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _SharedCluster:
+    """A driver Cluster and Session shared by connections with identical parameters.
+
+    Each Cluster owns a control connection, metadata refresh and reconnection
+    machinery, and each Session its own per-host connection pools, so
+    connections to the same cluster share one of each. Per-host execution
+    profiles live on the Cluster, so their LRU bookkeeping is shared as well.
+    """
+
+    cluster: Cluster
+    refcount: int = 0
+    session: Optional[Session] = None
+    # Driver connect() that creates the shared session, started by the first
+    # connection; a concurrent future so connections on any event loop can wait
+    connecting: Optional["Future[Session]"] = None
+    execution_profiles: "OrderedDict[str, str]" = field(default_factory=OrderedDict)
+    # Runs the session's connect and blocking calls made through the bare
+    # session (see prepare_for_session); owned here rather than by a connection
+    # so it outlives any one of them
+    executor: ThreadPoolExecutor = field(
+        default_factory=lambda: ThreadPoolExecutor(
+            max_workers=BLOCKING_EXECUTOR_WORKERS,
+            thread_name_prefix="cassandra-session",
+        )
+    )
+    # Bumped after every driver schema refresh; used to invalidate schema caches
+    schema_epoch: int = 0
+    # Bumped whenever a host is added, removed, or goes up or down (e.g. a
+    # rolling upgrade); used to invalidate caches of per-node facts
+    topology_epoch: int = 0
+
+    def __post_init__(self) -> None:
+        self._track_schema_changes()
+        self.cluster.register_listener(_TopologyListener(self))
+
+    def _track_schema_changes(self) -> None:
+        """Bump schema_epoch whenever the driver refreshes its schema metadata.
+
+        The driver has no public schema-change listener, but every refresh,
+        whether pushed by a SCHEMA_CHANGE event or a full rebuild, goes through
+        Metadata.refresh on its own threads.
+        """
+        metadata = self.cluster.metadata
+        refresh = metadata.refresh
+
+        def refresh_and_bump_epoch(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return refresh(*args, **kwargs)
+            finally:
+                self.schema_epoch += 1
+
+        metadata.refresh = refresh_and_bump_epoch
+
+
+class _TopologyListener(HostStateListener):
+    """Driver host listener that bumps a shared cluster's topology epoch."""
+
+    def __init__(self, shared: _SharedCluster) -> None:
+        self._shared = shared
+
+    def _bump(self, host: Any) -> None:
+        self._shared.topology_epoch += 1
+
+    on_up = on_down = on_add = on_remove = _bump
+
+
+# Shared clusters keyed by connection parameters, see CassandraConnection._cluster_key
+_shared_clusters: Dict[Tuple[Any, ...], _SharedCluster] = {}
+# Guards the registry and session creation. Connections may run on different
+# event loops, so this is a thread lock and is never held across an await.
+_shared_clusters_lock = threading.Lock()
+# Per-process key for fingerprinting credentials in registry keys, so the
+# registry never holds a plaintext password
+_credentials_key = os.urandom(32)
+
+# Blocking executor of the shared cluster that owns each session, so helpers
+# given a bare Session (see prepare_for_session) still keep blocking calls off
+# the default executor
+_session_executors: "WeakKeyDictionary[Session, ThreadPoolExecutor]" = (
+    WeakKeyDictionary()
+)
+# CQL text -> statement prepared on that session; dropped along with the session
+_session_prepared_statements: (
+    "WeakKeyDictionary[Session, Dict[str, PreparedStatement]]"
+) = WeakKeyDictionary()
+
+
+def _statement_text(statement: Any) -> str:
+    """Return the CQL text of a raw string, simple, prepared or bound statement."""
+    if isinstance(statement, str):
+        return statement
+    prepared = getattr(statement, "prepared_statement", None)
+    if prepared is not None:
+        return prepared.query_string
+    return getattr(statement, "query_string", None) or str(statement)
+
+
+def _completed_result(response_future: ResponseFuture) -> Any:
+    """Return the result of an already-finished ResponseFuture without blocking.
+
+    Raises the driver's exception if the request already failed, and returns
+    the _NOT_SET sentinel if the request is still in flight.
+    """
+    if response_future._final_result is not _NOT_SET:
+        return response_future._final_result
+    if response_future._final_exception is not None:
+        raise response_future._final_exception
+    return _NOT_SET
+
+
+def _set_future_result(future: asyncio.Future, result: Any) -> None:
+    """Resolve an asyncio future unless it was already cancelled (e.g. timed out)."""
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_future_exception(future: asyncio.Future, exc: BaseException) -> None:
+    """Fail an asyncio future unless it was already cancelled (e.g. timed out)."""
+    if not future.done():
+        future.set_exception(exc)
+
+
+def _on_response_success(
+    result: Any,
+    loop: asyncio.AbstractEventLoop,
+    future: asyncio.Future,
+    loop_thread_id: Optional[int],
+) -> None:
+    """ResponseFuture callback: hand the result back to the event loop thread.
+
+    When the driver runs the callback on the loop thread itself (the response
+    landed while callbacks were being registered) the future is resolved
+    directly instead of waking the loop through its self-pipe.
+    """
+    if threading.get_ident() == loop_thread_id:
+        _set_future_result(future, result)
+    else:
+        loop.call_soon_threadsafe(_set_future_result, future, result)
+
+
+def _on_response_error(
+    exc: BaseException,
+    loop: asyncio.AbstractEventLoop,
+    future: asyncio.Future,
+    loop_thread_id: Optional[int],
+) -> None:
+    """ResponseFuture errback: hand the exception back to the event loop thread."""
+    if threading.get_ident() == loop_thread_id:
+        _set_future_exception(future, exc)
+    else:
+        loop.call_soon_threadsafe(_set_future_exception, future, exc)
+
+
+def _bridge_response_future(
+    response_future: ResponseFuture,
+    loop: asyncio.AbstractEventLoop,
+    loop_thread_id: Optional[int],
+) -> asyncio.Future:
+    """Register callbacks resolving a new asyncio future on loop from response_future.
+
+    Module-level callbacks are registered with positional args rather than
+    per-call closures.
+    """
+    future = loop.create_future()
+    response_future.add_callbacks(
+        _on_response_success,
+        _on_response_error,
+        callback_args=(loop, future, loop_thread_id),
+        errback_args=(loop, future, loop_thread_id),
+    )
+    return future
+
+
+async def await_response_future(response_future: ResponseFuture) -> Any:
+    """Await a driver ResponseFuture without blocking the running event loop.
+
+    For callers that hold a bare Session rather than a CassandraConnection.
+    Like CassandraConnection.execute_async, this returns the first page of rows.
+
+    Args:
+        response_future: Future returned by Session.execute_async
+
+    Returns:
+        Rows of the first result page
+    """
+    # Skip the loop round-trip entirely if the driver already has the answer
+    result = _completed_result(response_future)
+    if result is not _NOT_SET:
+        return result
+    return await _bridge_response_future(
+        response_future, asyncio.get_running_loop(), threading.get_ident()
+    )
+
+
+async def await_all_pages(response_future: ResponseFuture) -> List[Any]:
+    """Await every result page of a driver ResponseFuture without blocking the loop.
+
+    For callers that hold a bare Session rather than a CassandraConnection.
+    Later pages are requested with start_fetching_next_page(), as in
+    CassandraConnection.execute_paged.
+
+    Args:
+        response_future: Future returned by Session.execute_async
+
+    Returns:
+        Rows from all result pages, in server order
+    """
+    rows = await await_response_future(response_future)
+    if not response_future.has_more_pages:
+        return rows
+
+    rows = list(rows)
+    while response_future.has_more_pages:
+        # Callbacks persist across pages; drop the previous page's first
+        response_future.clear_callbacks()
+        response_future.start_fetching_next_page()
+        rows.extend(await await_response_future(response_future))
+    return rows
+
+
+async def prepare_for_session(session: Session, query: str) -> PreparedStatement:
+    """Return query prepared on session, preparing it only on first use.
+
+    For callers that hold a bare Session rather than a CassandraConnection and
+    are built per request, so the statement is cached per session instead.
+
+    Args:
+        session: Session to prepare the statement on
+        query: CQL text to prepare
+
+    Returns:
+        Prepared statement for query
+    """
+    prepared_statements = _session_prepared_statements.setdefault(session, {})
+    prepared = prepared_statements.get(query)
+    if prepared is None:
+        # Session.prepare blocks on a round trip to the cluster; run it on the
+        # owning connection's cassandra-blocking executor
+        prepared = await asyncio.get_running_loop().run_in_executor(
+            _session_executors.get(session), session.prepare, query
+        )
+        prepared_statements[query] = prepared
+    return prepared
+
+
 class CassandraConnection:
     """Manages async connection to Cassandra cluster.
 
@@ -26,7 +287,7 @@ class CassandraConnection:
 
     def __init__(
         self,
-        contact_points: List[str],
+        contact_points: Sequence[str],
         port: int = 9042,
         datacenter: str = "datacenter1",
         username: Optional[str] = None,
@@ -42,8 +303,149 @@ class CassandraConnection:
         self.cluster: Optional[Cluster] = None
         self.session: Optional[Session] = None
         self.prepared_statements: Dict[str, Any] = {}
-        self._execution_profiles: Set[str] = set()  # Track created profiles
+        # Frozen attribute view of prepared_statements for hot-path lookups,
+        # e.g. connection.stmts.select_tables
+        self.stmts: SimpleNamespace = SimpleNamespace()
+        # (statement name, parameters) -> prepared statement already bound to
+        # them, kept in LRU order so they can be evicted
+        self._bound_statements: (
+            "OrderedDict[Tuple[str, Tuple[Any, ...]], BoundStatement]"
+        ) = OrderedDict()
+        # Host address -> profile name for created per-host profiles, kept in
+        # LRU order so they can be evicted
+        self._execution_profiles: "OrderedDict[str, str]" = OrderedDict()
         self._is_connected: bool = False
+        # Event loop captured at connect() time and reused on the query path
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        # Dedicated pool for blocking driver calls so they don't contend with
+        # other users of the loop's default executor
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Registry key of the shared cluster this connection holds a reference to
+        self._cluster_key: Optional[Tuple[Any, ...]] = None
+        self._shared_cluster: Optional[_SharedCluster] = None
+
+    def _cluster_key_for_params(self) -> Tuple[Any, ...]:
+        """Key identifying connections that can share one driver Cluster."""
+        return (
+            tuple(self.contact_points),
+            self.port,
+            self.datacenter,
+            self.username,
+            self._password_fingerprint(),
+            self.protocol_version,
+        )
+
+    def _password_fingerprint(self) -> Optional[bytes]:
+        """Keyed digest of the password, so keys differ without storing it."""
+        if self.password is None:
+            return None
+        return hmac.digest(_credentials_key, self.password.encode(), "sha256")
+
+    async def _acquire_cluster(
+        self, loop: asyncio.AbstractEventLoop, cluster_kwargs: Dict[str, Any]
+    ) -> None:
+        """Attach to the shared Cluster for our parameters, creating it if needed."""
+        key = self._cluster_key_for_params()
+        with _shared_clusters_lock:
+            shared = _shared_clusters.get(key)
+            if shared is not None:
+                shared.refcount += 1
+        if shared is None:
+            cluster = await asyncio.wait_for(
+                loop.run_in_executor(self._executor, lambda: Cluster(**cluster_kwargs)),
+                timeout=CONNECTION_TIMEOUT,
+            )
+            with _shared_clusters_lock:
+                shared = _shared_clusters.get(key)
+                if shared is None:
+                    shared = _shared_clusters[key] = _SharedCluster(cluster)
+                    cluster = None
+                shared.refcount += 1
+            if cluster is not None:
+                # A concurrent connect registered its Cluster first; ours never
+                # connected, so just discard it
+                cluster.shutdown()
+        else:
+            logger.debug("Reusing existing Cluster for this connection")
+        self._cluster_key = key
+        self._shared_cluster = shared
+        self.cluster = shared.cluster
+        self._execution_profiles = shared.execution_profiles
+
+    def _release_cluster(self) -> None:
+        """Drop our reference to the shared Cluster; the last one out shuts it down."""
+        key, self._cluster_key = self._cluster_key, None
+        self._shared_cluster = None
+        if key is None:
+            return
+        with _shared_clusters_lock:
+            shared = _shared_clusters.get(key)
+            if shared is None:
+                return
+            shared.refcount -= 1
+            if shared.refcount > 0:
+                return
+            del _shared_clusters[key]
+            if shared.session is not None:
+                _session_executors.pop(shared.session, None)
+        shared.execution_profiles.clear()
+        if shared.session is not None:
+            shared.session.shutdown()
+        shared.executor.shutdown(wait=False)
+        shared.cluster.shutdown()
+
+    async def _acquire_session(self, loop: asyncio.AbstractEventLoop) -> Session:
+        """Return the shared cluster's Session, connecting it on first use."""
+        shared = self._shared_cluster
+        with _shared_clusters_lock:
+            connecting = shared.connecting
+            if connecting is None:
+                # Open every host pool up front so the first per-host query
+                # doesn't pay the TCP and protocol handshake
+                connecting = shared.connecting = shared.executor.submit(
+                    shared.cluster.connect, wait_for_all_pools=True
+                )
+            else:
+                logger.debug("Reusing existing Session for this connection")
+        try:
+            # Shielded so one caller timing out doesn't cancel the shared connect
+            session = await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(connecting, loop=loop)),
+                timeout=CONNECTION_TIMEOUT,
+            )
+        except BaseException:
+            with _shared_clusters_lock:
+                # Let the next connect retry a connect that failed outright
+                if shared.connecting is connecting and connecting.done():
+                    shared.connecting = None
+            raise
+        with _shared_clusters_lock:
+            if shared.session is None:
+                shared.session = session
+                _session_executors[session] = shared.executor
+        return session
+
+    @property
+    def schema_epoch(self) -> int:
+        """Counter that changes whenever the driver refreshes schema metadata.
+
+        Callers caching schema-derived results can store the epoch observed
+        before querying and treat the entry as stale once it differs.
+        """
+        shared = self._shared_cluster
+        return shared.schema_epoch if shared is not None else 0
+
+    @property
+    def topology_epoch(self) -> int:
+        """Counter that changes whenever a host is added, removed, or goes up or down.
+
+        Callers caching per-node facts such as the release version can store
+        the epoch observed before querying and treat the entry as stale once
+        it differs.
+        """
+        shared = self._shared_cluster
+        return shared.topology_epoch if shared is not None else 0
 
     async def connect(self) -> None:
         """Establish connection to Cassandra cluster asynchronously.
@@ -55,7 +457,7 @@ class CassandraConnection:
             logger.debug("Already connected to Cassandra")
             return
 
-        logger.info(f"Connecting to Cassandra at {self.contact_points}:{self.port}")
+        logger.info("Connecting to Cassandra at %s:%s", self.contact_points, self.port)
 
         profile = ExecutionProfile(
             load_balancing_policy=DCAwareRoundRobinPolicy(local_dc=self.datacenter)
@@ -75,52 +477,106 @@ class CassandraConnection:
 
         try:
             # Create cluster and session in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            self.cluster = await asyncio.wait_for(
-                loop.run_in_executor(None, lambda: Cluster(**cluster_kwargs)),
-                timeout=CONNECTION_TIMEOUT,
-            )
-            self.session = await asyncio.wait_for(
-                loop.run_in_executor(None, self.cluster.connect),
-                timeout=CONNECTION_TIMEOUT,
-            )
+            loop = self._loop = asyncio.get_running_loop()
+            self._loop_thread_id = threading.get_ident()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=BLOCKING_EXECUTOR_WORKERS,
+                    thread_name_prefix="cassandra-blocking",
+                )
+            await self._acquire_cluster(loop, cluster_kwargs)
+            self.session = await self._acquire_session(loop)
             self._is_connected = True
             logger.info("Successfully connected to Cassandra")
             await self._prepare_statements()
         except asyncio.TimeoutError:
+            self._release_cluster()
             raise CassandraConnectionError(
                 f"Connection timeout after {CONNECTION_TIMEOUT} seconds"
             )
         except Exception as e:
-            logger.error(f"Failed to connect to Cassandra: {e}")
+            logger.error("Failed to connect to Cassandra: %s", e)
+            self._release_cluster()
             raise CassandraConnectionError(f"Failed to connect: {e}") from e
 
     async def _prepare_statements(self) -> None:
         """Prepare CQL statements for reuse asynchronously."""
         logger.info("Preparing CQL statements")
         # Prepare statements - prepare() is synchronous, so run in executor
-        loop = asyncio.get_event_loop()
+        loop = self._loop or asyncio.get_running_loop()
 
         # Prepare common system queries
         statements_to_prepare = {
             "select_tables": "SELECT table_name FROM system_schema.tables WHERE keyspace_name = ?",
-            "select_keyspaces": "SELECT keyspace_name FROM system_schema.keyspaces",
+            "select_release_version": "SELECT release_version FROM system.local",
             "select_columns": (
                 "SELECT * FROM system_schema.columns "
                 "WHERE keyspace_name = ? AND table_name = ?"
             ),
         }
 
-        for name, query in statements_to_prepare.items():
-            try:
-                self.prepared_statements[name] = await loop.run_in_executor(
-                    None,
-                    self.session.prepare,
-                    query,
-                )
-                logger.debug(f"Prepared statement: {name}")
-            except Exception as e:
-                logger.warning(f"Failed to prepare statement {name}: {e}")
+        # Prepare all statements concurrently rather than one round-trip at a time
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(self._executor, self.session.prepare, query)
+                for query in statements_to_prepare.values()
+            ),
+            return_exceptions=True,
+        )
+
+        for name, result in zip(statements_to_prepare, results):
+            if isinstance(result, Exception):
+                logger.warning("Failed to prepare statement %s: %s", name, result)
+                continue
+            self.prepared_statements[name] = result
+            logger.debug("Prepared statement: %s", name)
+
+        self.stmts = SimpleNamespace(**self.prepared_statements)
+
+    async def prepare(self, query: str) -> PreparedStatement:
+        """Prepare a CQL statement without blocking the event loop.
+
+        Args:
+            query: CQL text to prepare
+
+        Returns:
+            PreparedStatement that can be passed to execute_async or execute_on_host
+
+        Raises:
+            CassandraQueryError: If not connected
+        """
+        if not self.session or not self._is_connected:
+            raise CassandraQueryError("Not connected to Cassandra")
+
+        loop = self._loop or asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.session.prepare, query)
+
+    def bound_statement(self, name: str, parameters: Tuple[Any, ...]) -> BoundStatement:
+        """Return the named prepared statement bound to parameters, reusing binds.
+
+        Binding serializes every parameter through the driver's codecs, so hot
+        lookups with a small set of distinct values (e.g. tables per keyspace)
+        bind once and execute the cached BoundStatement afterwards.
+
+        Args:
+            name: Key of the statement in prepared_statements
+            parameters: Values to bind, as a hashable tuple
+
+        Returns:
+            BoundStatement ready to pass to execute_async or execute_paged
+        """
+        key = (name, parameters)
+        bound = self._bound_statements.get(key)
+        if bound is not None:
+            self._bound_statements.move_to_end(key)
+            return bound
+        bound = self._bound_statements[key] = self.prepared_statements[name].bind(
+            parameters
+        )
+        if len(self._bound_statements) > MAX_CACHED_BOUND_STATEMENTS:
+            # Evict the least recently used bind
+            self._bound_statements.popitem(last=False)
+        return bound
 
     async def execute_async(
         self, statement: Any, parameters: Optional[Any] = None
@@ -141,93 +597,202 @@ class CassandraConnection:
             raise CassandraQueryError("Not connected to Cassandra")
 
         try:
-            # Create a future that we can await
-            loop = asyncio.get_event_loop()
-            future = loop.create_future()
+            # The driver enforces the timeout and reports it through the errback,
+            # so no asyncio timer is needed per query
+            response_future = self.session.execute_async(
+                statement, parameters, timeout=QUERY_TIMEOUT
+            )
 
-            # Get the ResponseFuture from Cassandra
-            response_future = self.session.execute_async(statement, parameters)
+            # Skip the loop round-trip entirely if the driver already has the answer
+            result = _completed_result(response_future)
+            if result is not _NOT_SET:
+                return result
 
-            # Define callbacks for the ResponseFuture
-            def on_success(result):
-                loop.call_soon_threadsafe(future.set_result, result)
+            return await self._wrap_response_future(response_future)
+        except OperationTimedOut:
+            raise CassandraQueryError(f"Query timeout after {QUERY_TIMEOUT} seconds")
+        except Exception as e:
+            raise CassandraQueryError(f"Query execution failed: {e}") from e
 
-            def on_error(exc):
-                loop.call_soon_threadsafe(future.set_exception, exc)
+    async def execute_paged(
+        self, statement: Any, parameters: Optional[Any] = None
+    ) -> AsyncIterator[Any]:
+        """Execute a statement and yield rows across all result pages.
 
-            # Add callbacks to the ResponseFuture
-            response_future.add_callback(on_success)
-            response_future.add_errback(on_error)
+        Subsequent pages are requested with start_fetching_next_page() and
+        delivered through the driver callbacks, so paging never blocks the
+        event loop the way iterating a synchronous ResultSet would.
 
-            # Wait for the result with timeout
-            return await asyncio.wait_for(future, timeout=QUERY_TIMEOUT)
-        except asyncio.TimeoutError:
+        Args:
+            statement: CQL statement or prepared statement
+            parameters: Optional parameters for the statement
+
+        Yields:
+            Result rows in server order
+
+        Raises:
+            CassandraQueryError: If fetching any page fails
+        """
+        if not self._is_connected:
+            raise CassandraQueryError("Not connected to Cassandra")
+
+        try:
+            # The driver applies the timeout to every page it fetches
+            response_future = self.session.execute_async(
+                statement, parameters, timeout=QUERY_TIMEOUT
+            )
+            while True:
+                rows = _completed_result(response_future)
+                if rows is _NOT_SET:
+                    rows = await self._wrap_response_future(response_future)
+                for row in rows:
+                    yield row
+                if not response_future.has_more_pages:
+                    return
+                # Callbacks persist across pages; drop the previous page's
+                # before registering fresh ones for the next page
+                response_future.clear_callbacks()
+                response_future.start_fetching_next_page()
+        except OperationTimedOut:
             raise CassandraQueryError(f"Query timeout after {QUERY_TIMEOUT} seconds")
         except Exception as e:
             raise CassandraQueryError(f"Query execution failed: {e}") from e
 
-    def get_all_hosts(self) -> List[Any]:
-        """Get all hosts in the cluster.
+    async def execute_concurrent(
+        self,
+        statement: Any,
+        parameters_list: List[Tuple[Any, ...]],
+        concurrency: int = BULK_QUERY_CONCURRENCY,
+    ) -> List[List[Any]]:
+        """Execute one statement for many parameter sets using the driver's pipeline.
+
+        Uses execute_concurrent_with_args, which keeps up to `concurrency`
+        requests in flight, on the blocking executor. Rows are materialized in
+        the worker thread so that no page fetch happens on the event loop.
+
+        Args:
+            statement: CQL statement or prepared statement
+            parameters_list: One parameter tuple per execution
+            concurrency: Maximum number of requests in flight
 
         Returns:
-            List of host objects from cluster metadata
+            List of row lists, in the same order as parameters_list
+
+        Raises:
+            CassandraQueryError: If any execution fails
+        """
+        if not self._is_connected:
+            raise CassandraQueryError("Not connected to Cassandra")
+
+        def run() -> List[List[Any]]:
+            results = execute_concurrent_with_args(
+                self.session, statement, parameters_list, concurrency=concurrency
+            )
+            return [list(result) for _, result in results]
+
+        loop = self._loop or asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._executor, run)
+        except Exception as e:
+            raise CassandraQueryError(f"Query execution failed: {e}") from e
+
+    def _wrap_response_future(self, response_future: ResponseFuture) -> asyncio.Future:
+        """Bridge a driver ResponseFuture to an asyncio future on our event loop.
+
+        The driver normally invokes callbacks on its IO thread, so results are
+        handed back with call_soon_threadsafe.
+        """
+        loop = self._loop or asyncio.get_running_loop()
+        return _bridge_response_future(response_future, loop, self._loop_thread_id)
+
+    def iter_all_hosts(self) -> Iterable[Any]:
+        """Iterate over all hosts in the cluster without copying.
+
+        Returns:
+            Iterable of host objects from cluster metadata
         """
         if not self.cluster or not self._is_connected:
             logger.warning("Cannot get hosts: not connected to cluster")
-            return []
+            return ()
+
+        # The driver already returns a snapshot taken under its hosts lock
+        return self.cluster.metadata.all_hosts()
+
+    def get_all_hosts(self) -> List[Any]:
+        """Get all hosts in the cluster.
 
-        # Get all hosts from cluster metadata
-        return list(self.cluster.metadata.all_hosts())
+        Returns:
+            List of host objects from cluster metadata
+        """
+        hosts = self.iter_all_hosts()
+        # Avoid a second copy when the driver already handed back a list
+        return hosts if isinstance(hosts, list) else list(hosts)
 
     async def execute_on_host(
-        self, host_address: str, statement: str, parameters: Optional[Any] = None
+        self, host_address: str, statement: Any, parameters: Optional[Any] = None
     ) -> Any:
-        """Execute a statement on a specific host using a dedicated execution profile."""
-        # Create execution profile for specific host
-        profile_name = f"host_{host_address.replace('.', '_').replace(':', '_')}"
+        """Execute a statement on a specific host using a dedicated execution profile.
 
-        # Check if profile already exists
-        if profile_name not in self._execution_profiles:
+        The statement may be a raw CQL string or a prepared/bound statement, so
+        repeated node-local queries can skip server-side parsing.
+        """
+        # Reuse the profile if it already exists, marking it most recently used
+        profile_name = self._execution_profiles.get(host_address)
+        if profile_name is not None:
+            self._execution_profiles.move_to_end(host_address)
+        else:
             # Create new profile for this host
+            profile_name = sys.intern(
+                f"host_{host_address.replace('.', '_').replace(':', '_')}"
+            )
             profile = ExecutionProfile(
                 load_balancing_policy=WhiteListRoundRobinPolicy([host_address]),
                 consistency_level=ConsistencyLevel.ONE,
             )
             self.cluster.add_execution_profile(profile_name, profile)
-            self._execution_profiles.add(profile_name)
-            logger.debug(f"Created execution profile for host {host_address}")
+            self._execution_profiles[host_address] = profile_name
+            logger.debug("Created execution profile for host %s", host_address)
+            self._evict_execution_profiles()
 
         # Execute the statement using the host-specific profile
-        # Log query but truncate if too long
-        query_log = statement[:100] + "..." if len(statement) > 100 else statement
-        logger.debug(f"Executing query on host {host_address}: {query_log}")
+        # Log query but truncate if too long; skip the slicing unless DEBUG is on
+        if logger.isEnabledFor(logging.DEBUG):
+            query_text = _statement_text(statement)
+            query_log = (
+                query_text[:MAX_QUERY_LOG_LENGTH] + "..."
+                if len(query_text) > MAX_QUERY_LOG_LENGTH
+                else query_text
+            )
+            logger.debug("Executing query on host %s: %s", host_address, query_log)
         try:
-            # Create a future that we can await
-            loop = asyncio.get_event_loop()
-            future = loop.create_future()
-
             # Execute with specific profile
             response_future = self.session.execute_async(
                 statement, parameters, execution_profile=profile_name
             )
 
-            # Define callbacks for the ResponseFuture
-            def on_success(result):
-                loop.call_soon_threadsafe(future.set_result, result)
-
-            def on_error(exc):
-                loop.call_soon_threadsafe(future.set_exception, exc)
-
-            # Add callbacks to the ResponseFuture
-            response_future.add_callback(on_success)
-            response_future.add_errback(on_error)
+            # Skip the loop round-trip entirely if the driver already has the answer
+            result = _completed_result(response_future)
+            if result is not _NOT_SET:
+                return result
 
             # Wait for the result
-            return await future
+            return await self._wrap_response_future(response_future)
         except Exception as e:
-            logger.error(f"Error executing query on host {host_address}: {e}")
+            logger.error("Error executing query on host %s: %s", host_address, e)
             raise
 
+    def _evict_execution_profiles(self) -> None:
+        """Drop least recently used per-host profiles beyond the configured cap.
+
+        Hosts that are replaced or bounced with new addresses would otherwise
+        leave their profiles in the driver's profile manager forever.
+        """
+        while len(self._execution_profiles) > MAX_HOST_EXECUTION_PROFILES:
+            _, profile_name = self._execution_profiles.popitem(last=False)
+            # The driver has no public removal API; drop it from the profile manager
+            self.cluster.profile_manager.profiles.pop(profile_name, None)
+            logger.debug("Evicted execution profile %s", profile_name)
+
     def disconnect(self) -> None:
         """Close connection gracefully."""
         if not self._is_connected:
@@ -236,17 +801,33 @@ class CassandraConnection:
 
         logger.info("Disconnecting from Cassandra")
         try:
-            if self.session:
+            # A shared session is shut down with its cluster by the last
+            # connection releasing it
+            if self.session and self._cluster_key is None:
                 self.session.shutdown()
-            if self.cluster:
+        except Exception as e:
+            logger.error("Error during disconnect: %s", e)
+        try:
+            if self._cluster_key is not None:
+                # Shared cluster: only shut down once the last connection leaves
+                self._release_cluster()
+            elif self.cluster:
                 self.cluster.shutdown()
         except Exception as e:
-            logger.error(f"Error during disconnect: {e}")
+            logger.error("Error shutting down cluster: %s", e)
         finally:
             # Always mark as disconnected and clear resources, even on error
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
             self._is_connected = False
-            self._execution_profiles.clear()
+            self._loop = None
+            self._loop_thread_id = None
+            # The profile LRU may be shared with other connections; detach from it
+            self._execution_profiles = OrderedDict()
             self.prepared_statements.clear()
+            self.stmts = SimpleNamespace()
+            self._bound_statements.clear()
 
     async def __aenter__(self) -> "CassandraConnection":
         """Async context manager entry."""
@@ -1,21 +1,147 @@
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from cassandra.metadata import NetworkTopologyStrategy, SimpleStrategy
 
 from .cassandra_connection import CassandraConnection
-from .constants import MAX_CONCURRENT_QUERIES, MAX_DISPLAY_ROWS
+from .cassandra_version import CassandraVersion
+from .constants import (CREATE_TABLE_CACHE_SIZE, MAX_CONCURRENT_QUERIES,
+                        MAX_DISPLAY_ROWS, QUERY_TIMEOUT, TABLES_CACHE_SIZE)
 from .exceptions import CassandraMetadataError, CassandraVersionError
 
 logger = logging.getLogger(__name__)
 
 
+# Known table descriptions for common tables
+_SYSTEM_TABLE_DOCS = {
+    "system": {
+        "local": "Current node information (cluster name, DC, rack, tokens)",
+        "peers": "Information about other nodes in the cluster",
+        "peers_v2": "Extended peer information (Cassandra 4.0+)",
+        "size_estimates": "Table size estimates for each range",
+        "available_ranges": "Token ranges available on this node",
+        "transferred_ranges": "Token ranges being transferred",
+        "compaction_history": "History of completed compactions",
+        "sstable_activity": "Current SSTable activity",
+        "built_views": "Materialized views build status",
+        "view_builds_in_progress": "Currently building materialized views"
+    },
+    "system_views": {
+        "disk_usage": "Disk space usage per keyspace/table",
+        "local_read_latency": "Read latency statistics per table (count field shows number of reads)",
+        "local_write_latency": "Write latency statistics per table (count field shows number of writes)", 
+        "local_scan_latency": "Scan latency statistics per table (count field shows number of scans)",
+        "thread_pools": "Thread pool statistics and queue depths",
+        "sstable_tasks": "Active SSTable operations (compaction, cleanup, etc)",
+        "streaming": "Active streaming operations between nodes",
+        "clients": "Currently connected client sessions",
+        "caches": "Key cache, row cache, and counter cache statistics",
+        "settings": "Current database configuration settings",
+        "system_properties": "JVM system properties",
+        "internode_inbound": "Inbound internode messaging metrics",
+        "internode_outbound": "Outbound internode messaging metrics",
+        "coordinator_read_latency": "Coordinator read latency",
+        "coordinator_write_latency": "Coordinator write latency",
+        "coordinator_scan_latency": "Coordinator scan latency",
+        "tombstones_scanned": "Tombstone scan statistics",
+        "live_scanned": "Live cells scanned statistics",
+        "max_partition_size": "Maximum partition sizes per table",
+        "rows_per_partition": "Row count statistics per partition"
+    }
+}
+
+# Legacy system tables that aren't useful to operators, hidden from the description
+_HIDDEN_SYSTEM_TABLES = frozenset(
+    [
+        "IndexInfo", "batches", "paxos", "prepared_statements",
+        "schema_aggregates", "schema_columnfamilies", "schema_columns",
+        "schema_functions", "schema_keyspaces", "schema_triggers",
+        "schema_types", "schema_usertypes",
+    ]
+)
+
+# Package of Cassandra's built-in replication strategies
+_CASSANDRA_LOCATOR_PACKAGE = "org.apache.cassandra.locator."
+
+
+def _replication_options(strategy: Any) -> Dict[str, str]:
+    """Return a keyspace's replication options as a dict, e.g. {'class': ..., 'dc1': '3'}.
+
+    Virtual keyspaces have no replication strategy and yield an empty dict.
+    """
+    if strategy is None:
+        return {}
+    # The driver strips the built-in package from class names; restore the
+    # fully qualified name system_schema.keyspaces reports
+    name = strategy.name
+    options = {'class': name if '.' in name else _CASSANDRA_LOCATOR_PACKAGE + name}
+    if isinstance(strategy, SimpleStrategy):
+        options['replication_factor'] = str(strategy.replication_factor_info)
+    elif isinstance(strategy, NetworkTopologyStrategy):
+        options.update(
+            (dc, str(rf)) for dc, rf in strategy.dc_replication_factors_info.items()
+        )
+    else:
+        # Strategies the driver doesn't model keep their options as given
+        for key, value in (getattr(strategy, 'options_map', None) or {}).items():
+            options.setdefault(key, value)
+    return options
+
+
+@lru_cache(maxsize=8)
+def _render_system_table_description(
+    system_tables: Tuple[str, ...], system_views_tables: Tuple[str, ...]
+) -> str:
+    """Render the query_system_table description for sorted table name tuples."""
+    description_parts = ["Query database internal statistics from system keyspaces."]
+
+    # Add system tables section if available
+    if system_tables:
+        description_parts.append("\nAVAILABLE SYSTEM TABLES (cluster metadata):")
+        system_docs = _SYSTEM_TABLE_DOCS["system"]
+        for table in system_tables:
+            if table in system_docs:
+                description_parts.append(f"  - {table}: {system_docs[table]}")
+            elif table not in _HIDDEN_SYSTEM_TABLES:
+                # Only show tables we know are useful for operators
+                description_parts.append(f"  - {table}")
+
+    # Add system_views section if available
+    if system_views_tables:
+        description_parts.append("\nAVAILABLE SYSTEM_VIEWS TABLES (performance metrics):")
+        views_docs = _SYSTEM_TABLE_DOCS["system_views"]
+        for table in system_views_tables:
+            if table in views_docs:
+                description_parts.append(f"  - {table}: {views_docs[table]}")
+            else:
+                description_parts.append(f"  - {table}")
+
+    description_parts.append("\nAll tables return node-specific data. Use node_addresses parameter to query specific nodes.")
+
+    return "\n".join(description_parts)
+
+
 class CassandraService:
     """Service layer for async Cassandra operations."""
 
     def __init__(self, connection: CassandraConnection) -> None:
         self.connection = connection
-        self._system_tables_cache: Optional[Dict[str, List[str]]] = None
-        self._cassandra_version: Optional[tuple] = None
+        # (schema epoch when discovered, system keyspace -> table names)
+        self._system_tables_cache: Optional[Tuple[int, Dict[str, List[str]]]] = None
+        # (topology epoch when detected, version tuple)
+        self._cassandra_version: Optional[Tuple[int, tuple]] = None
+        # keyspace -> (schema epoch when fetched, table names)
+        self._tables_cache: Dict[str, Tuple[int, List[str]]] = {}
+        # (keyspace, schema epoch) -> table lookup currently in flight, shared by
+        # concurrent callers that observed the same epoch
+        self._tables_inflight: Dict[Tuple[str, int], "asyncio.Future[List[str]]"] = {}
+        # (keyspace, table) -> (schema epoch when rendered, CREATE TABLE statement)
+        self._create_table_cache: Dict[Tuple[str, str], Tuple[int, str]] = {}
+        # (keyspace, table) -> prepared SELECT * for per-node system table queries
+        self._prepared_system_queries: Dict[Tuple[str, str], Any] = {}
 
     async def get_keyspaces(self, include_system: bool = False) -> List[Dict[str, Any]]:
         """Get all keyspaces in the cluster with their metadata.
@@ -26,71 +152,124 @@ class CassandraService:
         Returns:
             List of dictionaries containing keyspace name and replication info
         """
-        logger.info(f"Retrieving keyspaces (include_system={include_system})")
-        
-        result = await self.connection.execute_async(
-            self.connection.prepared_statements["select_keyspaces"]
-        )
-        
+        logger.info("Retrieving keyspaces (include_system=%s)", include_system)
+
+        if not self.connection.cluster:
+            raise CassandraMetadataError("Cluster connection not established")
+
+        # The driver keeps keyspace metadata current from schema events, so
+        # no query is needed
         keyspaces = []
-        for row in result:
-            keyspace_name = row.keyspace_name
-            
+        for keyspace_name, keyspace_metadata in list(
+            self.connection.cluster.metadata.keyspaces.items()
+        ):
             # Filter system keyspaces if requested
             if not include_system and keyspace_name.startswith('system'):
                 continue
                 
             keyspace_info = {
                 'name': keyspace_name,
-                'replication': row.replication if hasattr(row, 'replication') else {},
-                'durable_writes': row.durable_writes if hasattr(row, 'durable_writes') else True
+                'replication': _replication_options(
+                    keyspace_metadata.replication_strategy
+                ),
+                'durable_writes': keyspace_metadata.durable_writes,
             }
             keyspaces.append(keyspace_info)
         
-        logger.info(f"Found {len(keyspaces)} keyspaces")
+        logger.info("Found %s keyspaces", len(keyspaces))
         return keyspaces
     
     async def get_tables(self, keyspace: str) -> List[str]:
-        """Get all tables in a keyspace asynchronously."""
-        logger.info(f"Retrieving tables for keyspace: {keyspace}")
-        result = await self.connection.execute_async(
-            self.connection.prepared_statements["select_tables"], [keyspace]
-        )
-        tables = [row.table_name for row in result]
-        logger.info(f"Found {len(tables)} tables in keyspace {keyspace}")
+        """Get all tables in a keyspace asynchronously.
+
+        Results are cached per keyspace until the driver observes a schema
+        change, so repeated calls skip the round-trip.
+        """
+        # Read the epoch before querying so a concurrent schema change invalidates
+        epoch = self.connection.schema_epoch
+        cached = self._tables_cache.get(keyspace)
+        if cached is not None and cached[0] == epoch:
+            logger.debug("Using cached tables for keyspace: %s", keyspace)
+            return list(cached[1])
+
+        # Concurrent callers for the same keyspace share a single query, unless
+        # it was started before a schema change this caller has already seen
+        key = (keyspace, epoch)
+        fetch = self._tables_inflight.get(key)
+        if fetch is None:
+            fetch = asyncio.ensure_future(self._fetch_tables(keyspace, epoch))
+            self._tables_inflight[key] = fetch
+            fetch.add_done_callback(lambda done: self._tables_inflight.pop(key, None))
+        # Shielded so one cancelled caller doesn't abort the others' query
+        return list(await asyncio.shield(fetch))
+
+    async def _fetch_tables(self, keyspace: str, epoch: int) -> List[str]:
+        """Query the tables of a keyspace and cache them under the given epoch."""
+        logger.info("Retrieving tables for keyspace: %s", keyspace)
+        # Page through the result so keyspaces larger than one fetch page are complete
+        tables = [
+            row.table_name
+            async for row in self.connection.execute_paged(
+                self.connection.bound_statement("select_tables", (keyspace,))
+            )
+        ]
+        logger.info("Found %s tables in keyspace %s", len(tables), keyspace)
+
+        if keyspace not in self._tables_cache and len(self._tables_cache) >= TABLES_CACHE_SIZE:
+            # Evict the oldest entry
+            del self._tables_cache[next(iter(self._tables_cache))]
+        self._tables_cache[keyspace] = (epoch, tables)
         return tables
 
     async def get_create_table(self, keyspace: str, table: str) -> Optional[str]:
-        """Get CREATE TABLE statement for a specific table asynchronously."""
-        logger.info(f"Retrieving CREATE TABLE definition for {keyspace}.{table}")
+        """Get CREATE TABLE statement for a specific table asynchronously.
+
+        Rendered statements are cached per table until the driver observes a
+        schema change, so repeated calls skip rebuilding the DDL.
+        """
+        epoch = self.connection.schema_epoch
+        cached = self._create_table_cache.get((keyspace, table))
+        if cached is not None and cached[0] == epoch:
+            logger.debug("Using cached CREATE TABLE for %s.%s", keyspace, table)
+            return cached[1]
+
+        logger.info("Retrieving CREATE TABLE definition for %s.%s", keyspace, table)
 
         try:
             # Get table metadata from cluster metadata
             if not self.connection.cluster:
                 raise CassandraMetadataError("Cluster connection not established")
 
-            # Check if keyspace exists in metadata
-            if keyspace not in self.connection.cluster.metadata.keyspaces:
+            # Look up keyspace and table in the driver's cached schema metadata
+            keyspace_metadata = self.connection.cluster.metadata.keyspaces.get(keyspace)
+            if keyspace_metadata is None:
                 raise CassandraMetadataError(f"Keyspace {keyspace} not found")
 
-            keyspace_metadata = self.connection.cluster.metadata.keyspaces[keyspace]
-
-            # Check if table exists in keyspace
-            if table not in keyspace_metadata.tables:
+            table_metadata = keyspace_metadata.tables.get(table)
+            if table_metadata is None:
                 raise CassandraMetadataError(f"Table {keyspace}.{table} not found")
 
-            table_metadata = keyspace_metadata.tables[table]
-
             # Use export_as_string() to get CREATE TABLE statement with indexes
             create_statement = table_metadata.export_as_string()
 
-            logger.info(f"Retrieved CREATE TABLE statement for {keyspace}.{table}")
+            logger.info("Retrieved CREATE TABLE statement for %s.%s", keyspace, table)
+
+            key = (keyspace, table)
+            if (
+                key not in self._create_table_cache
+                and len(self._create_table_cache) >= CREATE_TABLE_CACHE_SIZE
+            ):
+                # Evict the oldest entry
+                del self._create_table_cache[next(iter(self._create_table_cache))]
+            self._create_table_cache[key] = (epoch, create_statement)
             return create_statement
 
         except CassandraMetadataError:
             raise
         except Exception as e:
-            logger.error(f"Error retrieving CREATE TABLE for {keyspace}.{table}: {e}")
+            logger.error(
+                "Error retrieving CREATE TABLE for %s.%s: %s", keyspace, table, e
+            )
             raise CassandraMetadataError(
                 f"Error retrieving CREATE TABLE for {keyspace}.{table}: {e}"
             ) from e
@@ -99,71 +278,145 @@ class CassandraService:
         self, query: str, parameters: Optional[tuple] = None
     ) -> Any:
         """Execute arbitrary CQL for testing purposes asynchronously."""
-        logger.debug(f"Executing query: {query}")
+        logger.debug("Executing query: %s", query)
         return await self.connection.execute_async(query, parameters)
 
+    async def execute_query_stream(
+        self, query: str, parameters: Optional[tuple] = None
+    ) -> AsyncIterator[Any]:
+        """Execute arbitrary CQL and yield rows as each result page arrives.
+
+        Unlike execute_query, later pages are only fetched as the caller
+        consumes rows, so at most one page is held in memory.
+
+        Args:
+            query: CQL query to execute
+            parameters: Optional query parameters
+
+        Yields:
+            Result rows in server order
+        """
+        logger.debug("Streaming query: %s", query)
+        async for row in self.connection.execute_paged(query, parameters):
+            yield row
+
     async def execute_on_node(
         self, node_address: str, query: str, parameters: Optional[tuple] = None
     ) -> Any:
         """Execute a query on a specific node."""
-        logger.info(f"Executing query on node {node_address}")
+        logger.info("Executing query on node %s", node_address)
         try:
             result = await self.connection.execute_on_host(
                 node_address, query, parameters
             )
             return result
         except Exception as e:
-            logger.error(f"Error executing query on node {node_address}: {e}")
+            logger.error("Error executing query on node %s: %s", node_address, e)
             raise
 
     async def execute_on_all_nodes(
         self, query: str, parameters: Optional[tuple] = None
     ) -> Dict[str, Any]:
-        """Execute a query on all nodes in the cluster and return results per node."""
+        """Execute a query on all nodes in the cluster and return results per node.
+
+        Each node gets QUERY_TIMEOUT seconds once its query is sent; a node that
+        fails or times out maps to an {"error": ...} result. Results are keyed in
+        cluster host order, whichever node answers first.
+        """
         logger.info("Executing query on all nodes in the cluster")
 
+        hosts = self.connection.get_all_hosts()
+        arrived = {
+            host_address: result
+            async for host_address, result in self.execute_on_all_nodes_iter(
+                query, parameters
+            )
+        }
+        # Results arrive in completion order; key them in host order so the
+        # formatted output is stable from call to call
+        results = {h.address: arrived[h.address] for h in hosts if h.address in arrived}
+
+        logger.info("Completed query on %s nodes", len(results))
+        return results
+
+    async def execute_on_all_nodes_iter(
+        self,
+        query: str,
+        parameters: Optional[tuple] = None,
+        timeout: float = QUERY_TIMEOUT,
+        min_responses: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Execute a query on all nodes, yielding each node's result as it arrives.
+
+        Results come back in completion order, so callers that only need some
+        answers are not held up by a slow or partitioned node. Failed or timed
+        out nodes are yielded with an {"error": ...} result.
+
+        Args:
+            query: CQL query to execute
+            parameters: Optional query parameters
+            timeout: Seconds to wait for each node once its query is sent
+            min_responses: Stop and cancel the remaining nodes after this many
+                results have been yielded
+
+        Yields:
+            Tuples of (host address, rows or error dict)
+        """
         # Get all hosts
         hosts = self.connection.get_all_hosts()
         if not hosts:
             logger.warning("No hosts found in cluster")
-            return {}
+            return
 
-        results = {}
+        # Cap in-flight queries; a slot frees as soon as any host answers
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
 
         # Execute query on each host concurrently
         async def query_host(host):
             host_address = host.address
             try:
-                logger.debug(f"Querying host: {host_address}")
-                result = await self.connection.execute_on_host(
-                    host_address, query, parameters
-                )
-                # Convert result to list to avoid iterator issues
-                return host_address, list(result) if result else []
+                logger.debug("Querying host: %s", host_address)
+                async with semaphore:
+                    result = await asyncio.wait_for(
+                        self.connection.execute_on_host(
+                            host_address, query, parameters
+                        ),
+                        timeout=timeout,
+                    )
+                if not result:
+                    return host_address, []
+                # execute_on_host resolves to the driver callback's first-page
+                # row list; hand it through rather than copying every row
+                return host_address, result
+            except asyncio.TimeoutError:
+                logger.error("Timed out querying host %s", host_address)
+                return host_address, {"error": f"Timed out after {timeout} seconds"}
             except Exception as e:
-                logger.error(f"Failed to query host {host_address}: {e}")
+                logger.error("Failed to query host %s: %s", host_address, e)
                 return host_address, {"error": str(e)}
 
-        # Run queries concurrently with limit
-        # Process in batches to avoid overwhelming the cluster
-        batch_size = min(MAX_CONCURRENT_QUERIES, len(hosts))
-        query_results = []
+        # A single node needs no task scheduling; query it inline
+        if len(hosts) == 1:
+            yield await query_host(hosts[0])
+            return
 
-        for i in range(0, len(hosts), batch_size):
-            batch = hosts[i : i + batch_size]
-            tasks = [query_host(host) for host in batch]
-            batch_results = await asyncio.gather(*tasks, return_exceptions=False)
-            query_results.extend(batch_results)
-
-        # Build results dictionary
-        for host_address, result in query_results:
-            results[host_address] = result
-
-        logger.info(f"Completed query on {len(results)} nodes")
-        return results
+        # Start every host up front; the semaphore keeps a slow node from
+        # holding back the rest the way fixed-size batches did
+        tasks = [asyncio.ensure_future(query_host(host)) for host in hosts]
+        try:
+            for received, next_result in enumerate(asyncio.as_completed(tasks), 1):
+                yield await next_result
+                if min_responses is not None and received >= min_responses:
+                    break
+        finally:
+            # Don't leave queries running once the caller has what it needs
+            for task in tasks:
+                task.cancel()
 
     def format_node_results(self, results: Dict[str, Any], query: str = None) -> str:
         """Format results from multiple nodes for display.
+
+        At most MAX_DISPLAY_ROWS rows are rendered per node.
         
         Args:
             results: Dictionary mapping node addresses to query results
@@ -190,9 +443,13 @@ class CassandraService:
                 if not data:
                     formatted_results.append("No results")
                 else:
-                    # Convert rows to readable format
-                    for row in data:
-                        formatted_results.append(str(row))
+                    # Convert rows to readable format without a per-row Python loop,
+                    # capped so large results don't hold up the event loop
+                    formatted_results.extend(map(str, islice(data, MAX_DISPLAY_ROWS)))
+                    if len(data) > MAX_DISPLAY_ROWS:
+                        formatted_results.append(
+                            f"... and {len(data) - MAX_DISPLAY_ROWS} more rows"
+                        )
             else:
                 formatted_results.append(str(data))
                 
@@ -216,6 +473,8 @@ class CassandraService:
             
         formatted_results = []
         formatted_results.append(f"=== Query: SELECT * FROM {keyspace}.{table} ===")
+        # Bound once so rows are rendered by map() rather than a Python loop
+        format_row = "  {}".format
         
         for node, data in results.items():
             formatted_results.append(f"\n--- Node: {node} ---")
@@ -225,15 +484,19 @@ class CassandraService:
             elif isinstance(data, list):
                 if not data:
                     formatted_results.append("No results")
+                elif len(data) > MAX_DISPLAY_ROWS:
+                    # Queries are limited server side, so the full count is unknown
+                    formatted_results.append(
+                        f"Returned more than {MAX_DISPLAY_ROWS} rows"
+                    )
+                    formatted_results.extend(
+                        map(format_row, islice(data, MAX_DISPLAY_ROWS))
+                    )
+                    formatted_results.append("  ... more rows not shown")
                 else:
-                    # Show row count and first few rows
+                    # Show row count and rows
                     formatted_results.append(f"Returned {len(data)} rows")
-                    for i, row in enumerate(data[:MAX_DISPLAY_ROWS]):
-                        formatted_results.append(f"  {row}")
-                    if len(data) > MAX_DISPLAY_ROWS:
-                        formatted_results.append(
-                            f"  ... and {len(data) - MAX_DISPLAY_ROWS} more rows"
-                        )
+                    formatted_results.extend(map(format_row, data))
             else:
                 formatted_results.append(str(data))
                 
@@ -243,6 +506,8 @@ class CassandraService:
         self, result: Any, node_address: str
     ) -> str:
         """Format results from a single node query.
+
+        At most MAX_DISPLAY_ROWS rows are rendered.
         
         Args:
             result: Query result from the node
@@ -255,13 +520,16 @@ class CassandraService:
             return f"No results from node {node_address}"
             
         formatted_results = [f"=== Results from node {node_address} ==="]
-        rows = list(result) if result else []
-        
-        if not rows:
+        if result:
+            # Read at most one row past the cap: enough to note truncation
+            # without draining the rest of a large result
+            rows = list(islice(result, MAX_DISPLAY_ROWS + 1))
+            formatted_results.extend(map(str, rows[:MAX_DISPLAY_ROWS]))
+            if len(rows) > MAX_DISPLAY_ROWS:
+                formatted_results.append("... more rows not shown")
+
+        if len(formatted_results) == 1:
             formatted_results.append("No results")
-        else:
-            for row in rows:
-                formatted_results.append(str(row))
                 
         return "\n".join(formatted_results)
 
@@ -288,61 +556,92 @@ class CassandraService:
             )
 
         logger.info(
-            f"Querying {keyspace}.{table} on {'specified' if node_addresses else 'all'} nodes"
+            "Querying %s.%s on %s nodes",
+            keyspace,
+            table,
+            "specified" if node_addresses else "all",
         )
 
-        # Build query
-        query = f"SELECT * FROM {keyspace}.{table}"
-
         # Get hosts to query
-        all_hosts = self.connection.get_all_hosts()
-        if not all_hosts:
-            logger.warning("No hosts found in cluster")
-            return {}
-
-        # Filter hosts if specific nodes requested
         if node_addresses:
-            hosts_to_query = [h for h in all_hosts if h.address in node_addresses]
+            # Filter while iterating instead of materializing every host first;
+            # a set keeps each membership test O(1) for long address lists
+            requested = frozenset(node_addresses)
+            hosts_to_query = [
+                h for h in self.connection.iter_all_hosts() if h.address in requested
+            ]
             if not hosts_to_query:
                 logger.warning(
-                    f"None of the specified nodes {node_addresses} found in cluster"
+                    "None of the specified nodes %s found in cluster", node_addresses
                 )
                 return {}
         else:
-            hosts_to_query = all_hosts
+            hosts_to_query = self.connection.get_all_hosts()
+            if not hosts_to_query:
+                logger.warning("No hosts found in cluster")
+                return {}
 
-        results = {}
+        # Prepare once per table so repeat calls skip parsing on every node.
+        # The keyspace was validated above, so only real system tables are cached.
+        query = self._prepared_system_queries.get((keyspace, table))
+        if query is None:
+            try:
+                # Only MAX_DISPLAY_ROWS rows are ever shown; the extra row tells
+                # format_system_table_results that the output was truncated
+                query = await self.connection.prepare(
+                    f"SELECT * FROM {keyspace}.{table} LIMIT {MAX_DISPLAY_ROWS + 1}"
+                )
+            except Exception as e:
+                # e.g. a table missing on this version; report it per node as
+                # a failed query would be
+                logger.error("Failed to prepare query for %s.%s: %s", keyspace, table, e)
+                return {host.address: {"error": str(e)} for host in hosts_to_query}
+            # Some virtual tables ignore LIMIT; a matching page size still
+            # keeps each node to a single small page
+            query.fetch_size = MAX_DISPLAY_ROWS + 1
+            self._prepared_system_queries[(keyspace, table)] = query
+
+        # Cap in-flight queries; a slot frees as soon as any host answers
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
 
         # Execute query on each host concurrently
         async def query_host(host):
             host_address = host.address
             try:
-                logger.debug(f"Querying {keyspace}.{table} on host: {host_address}")
-                result = await self.connection.execute_on_host(host_address, query)
-                # Convert result to list to avoid iterator issues
-                return host_address, list(result) if result else []
+                logger.debug(
+                    "Querying %s.%s on host: %s", keyspace, table, host_address
+                )
+                async with semaphore:
+                    result = await self.connection.execute_on_host(host_address, query)
+                # Convert result to list to avoid iterator issues, stopping at
+                # the first page so later pages are never fetched
+                if not result:
+                    return host_address, []
+                return host_address, list(islice(result, MAX_DISPLAY_ROWS + 1))
             except Exception as e:
                 logger.error(
-                    f"Failed to query {keyspace}.{table} on host {host_address}: {e}"
+                    "Failed to query %s.%s on host %s: %s",
+                    keyspace,
+                    table,
+                    host_address,
+                    e,
                 )
                 return host_address, {"error": str(e)}
 
-        # Run queries concurrently with limit
-        # Process in batches to avoid overwhelming the cluster
-        batch_size = min(MAX_CONCURRENT_QUERIES, len(hosts_to_query))
-        query_results = []
-
-        for i in range(0, len(hosts_to_query), batch_size):
-            batch = hosts_to_query[i : i + batch_size]
-            tasks = [query_host(host) for host in batch]
-            batch_results = await asyncio.gather(*tasks, return_exceptions=False)
-            query_results.extend(batch_results)
-
-        # Build results dictionary
-        for host_address, result in query_results:
-            results[host_address] = result
+        if len(hosts_to_query) == 1:
+            # A single node needs no task scheduling; query it inline
+            results = dict([await query_host(hosts_to_query[0])])
+        else:
+            # Start every host up front; the semaphore keeps a slow node from
+            # holding back the rest the way fixed-size batches did. Each task
+            # returns a (host_address, result) pair, so dict() builds the map
+            results = dict(
+                await asyncio.gather(*(query_host(host) for host in hosts_to_query))
+            )
 
-        logger.info(f"Completed querying {keyspace}.{table} on {len(results)} nodes")
+        logger.info(
+            "Completed querying %s.%s on %s nodes", keyspace, table, len(results)
+        )
         return results
     
     async def get_cassandra_version(self) -> tuple:
@@ -351,68 +650,103 @@ class CassandraService:
         Returns:
             Tuple of (major, minor, patch) version numbers
         """
-        if self._cassandra_version:
-            return self._cassandra_version
+        # Nodes restart on upgrade, so a topology change may mean a new version
+        epoch = self.connection.topology_epoch
+        if self._cassandra_version and self._cassandra_version[0] == epoch:
+            return self._cassandra_version[1]
             
         try:
-            # Query system.local for version
-            result = await self.connection.execute_async(
-                "SELECT release_version FROM system.local"
-            )
-            if result:
-                row = result[0] if isinstance(result, list) else next(iter(result), None)
+            # The driver already read release_version for the control
+            # connection host; only query system.local if it is missing
+            version_str = self._control_host_release_version()
+            if version_str is None:
+                result = await self.connection.execute_async(
+                    self.connection.prepared_statements.get(
+                        "select_release_version",
+                        "SELECT release_version FROM system.local",
+                    )
+                )
+                row = None
+                if result:
+                    row = result[0] if isinstance(result, list) else next(iter(result), None)
                 if row and hasattr(row, 'release_version'):
                     version_str = row.release_version
-                    # Parse version like "4.0.11" or "5.0.0-SNAPSHOT"
-                    version_parts = version_str.split("-")[0].split(".")
-                    major = int(version_parts[0])
-                    minor = int(version_parts[1]) if len(version_parts) > 1 else 0
-                    patch = int(version_parts[2]) if len(version_parts) > 2 else 0
-                    self._cassandra_version = (major, minor, patch)
-                    logger.info(f"Detected Cassandra version: {major}.{minor}.{patch}")
-                    return self._cassandra_version
+            if version_str:
+                # Parse version like "4.0.11" or "5.0.0-SNAPSHOT"
+                version = CassandraVersion.from_string(version_str)
+                detected = (version.major, version.minor, version.patch)
+                self._cassandra_version = (epoch, detected)
+                logger.info("Detected Cassandra version: %s", version)
+                return detected
         except Exception as e:
-            logger.error(f"Failed to get Cassandra version: {e}")
+            logger.error("Failed to get Cassandra version: %s", e)
             
         # Default to assuming 4.0 if we can't determine
         logger.warning("Could not determine Cassandra version, assuming 4.0.0")
-        self._cassandra_version = (4, 0, 0)
-        return self._cassandra_version
+        self._cassandra_version = (epoch, (4, 0, 0))
+        return (4, 0, 0)
     
+    def _control_host_release_version(self) -> Optional[str]:
+        """Return the release_version the driver recorded for its control host."""
+        cluster = self.connection.cluster
+        control_connection = getattr(cluster, "control_connection", None)
+        if control_connection is None:
+            return None
+        host = control_connection.get_control_connection_host()
+        version = getattr(host, "release_version", None)
+        return version if isinstance(version, str) else None
+
     async def discover_system_tables(self) -> Dict[str, List[str]]:
         """Discover available system tables in the cluster.
         
         Returns:
             Dictionary mapping keyspace names to lists of table names
         """
-        if self._system_tables_cache:
-            return self._system_tables_cache
+        # Read the epoch before querying so a concurrent schema change invalidates
+        epoch = self.connection.schema_epoch
+        if self._system_tables_cache and self._system_tables_cache[0] == epoch:
+            return self._system_tables_cache[1]
             
         result = {}
-        
+
+        # Look up both keyspaces and the version concurrently rather than one
+        # round-trip after another; system_views is only kept on 4.0+
+        system_tables, version, system_views_tables = await asyncio.gather(
+            self.get_tables("system"),
+            self.get_cassandra_version(),
+            self.get_tables("system_views"),
+            return_exceptions=True,
+        )
+
         # Always available: system keyspace tables
-        try:
-            system_tables = await self.get_tables("system")
-            result["system"] = system_tables
-            logger.info(f"Found {len(system_tables)} tables in system keyspace")
-        except Exception as e:
-            logger.error(f"Failed to get system tables: {e}")
+        if isinstance(system_tables, Exception):
+            logger.error("Failed to get system tables: %s", system_tables)
             result["system"] = []
-        
-        # Check for system_views (Cassandra 4.0+)
-        version = await self.get_cassandra_version()
+        else:
+            result["system"] = system_tables
+            logger.info("Found %s tables in system keyspace", len(system_tables))
+
+        # get_cassandra_version falls back to 4.0 itself and doesn't raise
         if version[0] >= 4:
-            try:
-                system_views_tables = await self.get_tables("system_views")
-                result["system_views"] = system_views_tables
-                logger.info(f"Found {len(system_views_tables)} tables in system_views keyspace")
-            except Exception as e:
-                logger.warning(f"system_views keyspace not available: {e}")
+            if isinstance(system_views_tables, Exception):
+                logger.warning(
+                    "system_views keyspace not available: %s", system_views_tables
+                )
                 result["system_views"] = []
+            else:
+                result["system_views"] = system_views_tables
+                logger.info(
+                    "Found %s tables in system_views keyspace",
+                    len(system_views_tables),
+                )
         else:
-            logger.info(f"Cassandra {version[0]}.{version[1]} does not have system_views keyspace")
+            logger.info(
+                "Cassandra %s.%s does not have system_views keyspace",
+                version[0],
+                version[1],
+            )
             
-        self._system_tables_cache = result
+        self._system_tables_cache = (epoch, result)
         return result
     
     def generate_system_table_description(self, discovered_tables: Dict[str, List[str]]) -> str:
@@ -424,69 +758,8 @@ class CassandraService:
         Returns:
             Formatted description string for the MCP tool
         """
-        description_parts = ["Query database internal statistics from system keyspaces."]
-        
-        # Known table descriptions for common tables
-        system_table_docs = {
-            "system": {
-                "local": "Current node information (cluster name, DC, rack, tokens)",
-                "peers": "Information about other nodes in the cluster",
-                "peers_v2": "Extended peer information (Cassandra 4.0+)",
-                "size_estimates": "Table size estimates for each range",
-                "available_ranges": "Token ranges available on this node",
-                "transferred_ranges": "Token ranges being transferred",
-                "compaction_history": "History of completed compactions",
-                "sstable_activity": "Current SSTable activity",
-                "built_views": "Materialized views build status",
-                "view_builds_in_progress": "Currently building materialized views"
-            },
-            "system_views": {
-                "disk_usage": "Disk space usage per keyspace/table",
-                "local_read_latency": "Read latency statistics per table (count field shows number of reads)",
-                "local_write_latency": "Write latency statistics per table (count field shows number of writes)", 
-                "local_scan_latency": "Scan latency statistics per table (count field shows number of scans)",
-                "thread_pools": "Thread pool statistics and queue depths",
-                "sstable_tasks": "Active SSTable operations (compaction, cleanup, etc)",
-                "streaming": "Active streaming operations between nodes",
-                "clients": "Currently connected client sessions",
-                "caches": "Key cache, row cache, and counter cache statistics",
-                "settings": "Current database configuration settings",
-                "system_properties": "JVM system properties",
-                "internode_inbound": "Inbound internode messaging metrics",
-                "internode_outbound": "Outbound internode messaging metrics",
-                "coordinator_read_latency": "Coordinator read latency",
-                "coordinator_write_latency": "Coordinator write latency",
-                "coordinator_scan_latency": "Coordinator scan latency",
-                "tombstones_scanned": "Tombstone scan statistics",
-                "live_scanned": "Live cells scanned statistics",
-                "max_partition_size": "Maximum partition sizes per table",
-                "rows_per_partition": "Row count statistics per partition"
-            }
-        }
-        
-        # Add system tables section if available
-        if "system" in discovered_tables and discovered_tables["system"]:
-            description_parts.append("\nAVAILABLE SYSTEM TABLES (cluster metadata):")
-            for table in sorted(discovered_tables["system"]):
-                if table in system_table_docs["system"]:
-                    description_parts.append(f"  - {table}: {system_table_docs['system'][table]}")
-                else:
-                    # Only show tables we know are useful for operators
-                    if table not in ["IndexInfo", "batches", "paxos", "prepared_statements", 
-                                    "schema_aggregates", "schema_columnfamilies", "schema_columns",
-                                    "schema_functions", "schema_keyspaces", "schema_triggers",
-                                    "schema_types", "schema_usertypes"]:
-                        description_parts.append(f"  - {table}")
-        
-        # Add system_views section if available  
-        if "system_views" in discovered_tables and discovered_tables["system_views"]:
-            description_parts.append("\nAVAILABLE SYSTEM_VIEWS TABLES (performance metrics):")
-            for table in sorted(discovered_tables["system_views"]):
-                if table in system_table_docs["system_views"]:
-                    description_parts.append(f"  - {table}: {system_table_docs['system_views'][table]}")
-                else:
-                    description_parts.append(f"  - {table}")
-        
-        description_parts.append("\nAll tables return node-specific data. Use node_addresses parameter to query specific nodes.")
-        
-        return "\n".join(description_parts)
+        # Sorted tuples make the discovered tables a hashable cache key
+        return _render_system_table_description(
+            tuple(sorted(discovered_tables.get("system") or ())),
+            tuple(sorted(discovered_tables.get("system_views") or ())),
+        )
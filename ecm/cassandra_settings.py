@@ -7,17 +7,33 @@ version-specific naming differences.
 
 import logging
 import re
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from cassandra.cluster import Session
 
+from .cassandra_connection import await_all_pages, prepare_for_session
 from .cassandra_version import CassandraVersion
 
 logger = logging.getLogger(__name__)
 
+# Compiled once; checked against every setting value in _convert_value
+_DURATION_RE = re.compile(r'^\d+(?:\.\d+)?(?:ms|s|m|h|d)$')
+_SIZE_RE = re.compile(r'^\d+(?:\.\d+)?(?:B|KiB|MiB|GiB|TiB|KB|MB|GB|TB)$')
 
-@dataclass
+_BOOLEANS = {"true": True, "false": False}
+_INTEGER_KEY_SUFFIXES = ("_in_ms", "_in_kb", "_in_mb")
+# Last characters of duration (ms, s, m, h, d) and size (B, KiB, ...) units
+_UNIT_SUFFIX_CHARS = frozenset("smhdB")
+# Characters int() and float() accept at the start of a number
+_NUMBER_START_CHARS = frozenset("0123456789+-. \t\n")
+
+SETTINGS_QUERY = "SELECT name, value FROM system_views.settings"
+
+
+@dataclass(slots=True)
 class AuditLoggingOptions:
     """Audit logging configuration options."""
     allow_nodetool_archive_command: bool = False
@@ -39,7 +55,7 @@ class AuditLoggingOptions:
     roll_cycle: str = "HOURLY"
 
 
-@dataclass
+@dataclass(slots=True)
 class ClientEncryptionOptions:
     """Client encryption configuration options."""
     accepted_protocols: Optional[List[str]] = None
@@ -59,7 +75,7 @@ class ClientEncryptionOptions:
     truststore_password: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerEncryptionOptions:
     """Server encryption configuration options."""
     accepted_protocols: Optional[List[str]] = None
@@ -83,7 +99,7 @@ class ServerEncryptionOptions:
     truststore_password: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FullQueryLoggingOptions:
     """Full query logging configuration options."""
     allow_nodetool_archive_command: bool = False
@@ -96,7 +112,7 @@ class FullQueryLoggingOptions:
     roll_cycle: str = "HOURLY"
 
 
-@dataclass
+@dataclass(slots=True)
 class TransparentDataEncryptionOptions:
     """Transparent data encryption configuration options."""
     chunk_length_kb: int = 64
@@ -108,7 +124,7 @@ class TransparentDataEncryptionOptions:
     key_provider_parameters: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class RepairOptions:
     """Repair configuration options."""
     retries_enabled: bool = False
@@ -121,20 +137,90 @@ class RepairOptions:
     merkle_tree_response_max_sleep_time: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SaiOptions:
     """SAI (Storage Attached Indexing) configuration options."""
     prioritize_over_legacy_index: bool = False
     segment_write_buffer_size: str = "1024MiB"
 
 
-@dataclass
+@dataclass(slots=True)
 class ReplicaFilteringProtection:
     """Replica filtering protection configuration."""
     cached_rows_fail_threshold: int = 32000
     cached_rows_warn_threshold: int = 2000
 
 
+# Setting name prefix -> (CassandraSettings attribute, option group class)
+_NESTED_OPTION_GROUPS = {
+    "audit_logging_options": ("audit_logging_options", AuditLoggingOptions),
+    "client_encryption_options": ("client_encryption_options", ClientEncryptionOptions),
+    "server_encryption_options": ("server_encryption_options", ServerEncryptionOptions),
+    "full_query_logging_options": ("full_query_logging_options", FullQueryLoggingOptions),
+    "transparent_data_encryption_options": (
+        "transparent_data_encryption_options",
+        TransparentDataEncryptionOptions,
+    ),
+    "sai_options": ("sai_options", SaiOptions),
+    "replica_filtering_protection": ("replica_filtering_protection", ReplicaFilteringProtection),
+}
+
+
+@lru_cache(maxsize=1024)
+def _nested_setting_target(name: str) -> Optional[Tuple[str, str]]:
+    """Resolve a dotted setting name to (option group attribute, field name).
+
+    Nested path segments are joined with underscores, so both
+    "audit_logging_options.logger.class_name" and
+    "audit_logging_options.logger_class_name" resolve to logger_class_name.
+    The setting names come from a fixed server-side table, so each is
+    resolved once per process.
+
+    Args:
+        name: Nested setting name (e.g., "audit_logging_options.enabled")
+
+    Returns:
+        Tuple of (CassandraSettings attribute, field name), or None if the
+        setting has no matching field
+    """
+    prefix, _, rest = name.partition('.')
+
+    # Handle repair options
+    if prefix == "repair":
+        parts = rest.split('.')
+        if parts[0] != "retries":
+            return None
+        attr_name = "_".join(parts[1:]) if len(parts) > 1 else parts[0]
+        group_attr, group_cls = "repair_options", RepairOptions
+        field_name = f"retries_{attr_name}"
+    else:
+        group = _NESTED_OPTION_GROUPS.get(prefix)
+        if group is None:
+            return None
+        group_attr, group_cls = group
+        field_name = rest.replace('.', '_')
+
+    if field_name not in {f.name for f in fields(group_cls)}:
+        return None
+    return group_attr, field_name
+
+
+@lru_cache(maxsize=256)
+def _setting_getter(key: str) -> Callable[[Any], Any]:
+    """Return a cached attrgetter for a direct or dotted setting key."""
+    return attrgetter(key)
+
+
+@lru_cache(maxsize=None)
+def _public_properties(cls: type) -> Tuple[str, ...]:
+    """Return the names of a class's public properties, e.g. is_encryption_enabled."""
+    return tuple(
+        name
+        for name in dir(cls)
+        if not name.startswith('_') and isinstance(getattr(cls, name), property)
+    )
+
+
 class CassandraSettings:
     """Manages normalized Cassandra configuration settings across versions."""
 
@@ -265,17 +351,17 @@ class CassandraSettings:
         
         try:
             # Query system_views.settings
-            result = self.session.execute("SELECT name, value FROM system_views.settings")
+            prepared = await prepare_for_session(self.session, SETTINGS_QUERY)
+            rows = await await_all_pages(self.session.execute_async(prepared))
             
-            for row in result:
-                setting_name = row.name
-                setting_value = row.value
-                
-                # Process the setting
-                self._process_setting(setting_name, setting_value)
+            # Rows are (name, value) in SELECT order, so unpack them positionally
+            # rather than through two attribute lookups per row
+            process_setting = self._process_setting
+            for setting_name, setting_value in rows:
+                process_setting(setting_name, setting_value)
             
             self._loaded = True
-            logger.info(f"Loaded {result.current_rows} settings for Cassandra {self.version}")
+            logger.info(f"Loaded {len(rows)} settings for Cassandra {self.version}")
             
         except Exception as e:
             logger.error(f"Failed to load settings: {e}")
@@ -302,40 +388,11 @@ class CassandraSettings:
             name: Nested setting name (e.g., "audit_logging_options.enabled")
             value: Setting value as string
         """
-        parts = name.split('.')
-        
-        # Handle audit_logging_options
-        if parts[0] == "audit_logging_options":
-            self._set_nested_attribute(self.audit_logging_options, parts[1:], value)
-        
-        # Handle client_encryption_options
-        elif parts[0] == "client_encryption_options":
-            self._set_nested_attribute(self.client_encryption_options, parts[1:], value)
-        
-        # Handle server_encryption_options
-        elif parts[0] == "server_encryption_options":
-            self._set_nested_attribute(self.server_encryption_options, parts[1:], value)
-        
-        # Handle full_query_logging_options
-        elif parts[0] == "full_query_logging_options":
-            self._set_nested_attribute(self.full_query_logging_options, parts[1:], value)
-        
-        # Handle transparent_data_encryption_options
-        elif parts[0] == "transparent_data_encryption_options":
-            self._set_nested_attribute(self.transparent_data_encryption_options, parts[1:], value)
-        
-        # Handle repair options
-        elif parts[0] == "repair" and parts[1] == "retries":
-            attr_name = "_".join(parts[2:]) if len(parts) > 2 else parts[1]
-            self._set_nested_attribute(self.repair_options, [f"retries_{attr_name}"], value)
-        
-        # Handle sai_options
-        elif parts[0] == "sai_options":
-            self._set_nested_attribute(self.sai_options, parts[1:], value)
-        
-        # Handle replica_filtering_protection
-        elif parts[0] == "replica_filtering_protection":
-            self._set_nested_attribute(self.replica_filtering_protection, parts[1:], value)
+        target = _nested_setting_target(name)
+        if target is not None:
+            group_attr, field_name = target
+            converted_value = self._convert_value(field_name, value)
+            setattr(getattr(self, group_attr), field_name, converted_value)
 
     def _process_direct_setting(self, name: str, value: str) -> None:
         """Process a direct (non-nested) setting.
@@ -352,21 +409,6 @@ class CassandraSettings:
             converted_value = self._convert_value(attr_name, value)
             setattr(self, attr_name, converted_value)
 
-    def _set_nested_attribute(self, obj: Any, path: List[str], value: str) -> None:
-        """Set a nested attribute on an object.
-        
-        Args:
-            obj: Object to set attribute on
-            path: List of attribute names to traverse
-            value: Value to set
-        """
-        # Convert path elements to Python attribute names
-        attr_name = "_".join(path).replace(".", "_")
-        
-        if hasattr(obj, attr_name):
-            converted_value = self._convert_value(attr_name, value)
-            setattr(obj, attr_name, converted_value)
-
     def _convert_value(self, key: str, value: Optional[str]) -> Any:
         """Convert a string value to the appropriate Python type.
         
@@ -381,50 +423,52 @@ class CassandraSettings:
             return None
         
         # Boolean values
-        if value in ("true", "false"):
-            return value == "true"
+        if value in _BOOLEANS:
+            return _BOOLEANS[value]
         
         # Numeric values
-        if key.endswith("_in_ms") or key.endswith("_in_kb") or key.endswith("_in_mb"):
+        if key.endswith(_INTEGER_KEY_SUFFIXES):
             try:
                 return int(value)
             except ValueError:
                 return value
         
-        # Duration values (e.g., "10s", "5m", "3h")
-        if self._is_duration(value):
-            return value  # Keep as string for now, could convert to seconds
+        last = value[-1:]
+        
+        # Duration values (e.g., "10s", "5m", "3h") and size values (e.g.,
+        # "100MiB", "1KiB") end in a unit letter; skip the regexes otherwise
+        if last in _UNIT_SUFFIX_CHARS and (self._is_duration(value) or self._is_size(value)):
+            return value  # Keep as string for now, could convert to seconds/bytes
         
-        # Size values (e.g., "100MiB", "1KiB")
-        if self._is_size(value):
-            return value  # Keep as string for now, could convert to bytes
+        first = value[:1]
         
         # List values (enclosed in brackets)
-        if value.startswith("[") and value.endswith("]"):
+        if first == "[" and last == "]":
             return self._parse_list(value)
         
         # Dictionary values (enclosed in braces)
-        if value.startswith("{") and value.endswith("}"):
+        if first == "{" and last == "}":
             return self._parse_dict(value)
         
-        # Try to parse as number
-        try:
-            if "." in value:
-                return float(value)
-            return int(value)
-        except ValueError:
-            pass
+        # Try to parse as number, unless the first character rules it out
+        if first in _NUMBER_START_CHARS:
+            try:
+                if "." in value:
+                    return float(value)
+                return int(value)
+            except ValueError:
+                pass
         
         # Return as string
         return value
 
     def _is_duration(self, value: str) -> bool:
         """Check if a value is a duration string."""
-        return bool(re.match(r'^\d+(\.\d+)?(ms|s|m|h|d)$', value))
+        return _DURATION_RE.match(value) is not None
 
     def _is_size(self, value: str) -> bool:
         """Check if a value is a size string."""
-        return bool(re.match(r'^\d+(\.\d+)?(B|KiB|MiB|GiB|TiB|KB|MB|GB|TB)$', value))
+        return _SIZE_RE.match(value) is not None
 
     def _parse_list(self, value: str) -> List[str]:
         """Parse a list string into a Python list."""
@@ -464,19 +508,11 @@ class CassandraSettings:
         Returns:
             The setting value or default
         """
-        # Handle nested keys
-        if '.' in key:
-            parts = key.split('.')
-            obj = self
-            for part in parts:
-                if hasattr(obj, part):
-                    obj = getattr(obj, part)
-                else:
-                    return default
-            return obj
-        
-        # Direct attribute
-        return getattr(self, key, default)
+        # attrgetter resolves direct and dotted nested keys in one C-level call
+        try:
+            return _setting_getter(key)(self)
+        except AttributeError:
+            return default
 
     def get_all_settings(self) -> Dict[str, Any]:
         """Get all settings as a dictionary.
@@ -484,14 +520,18 @@ class CassandraSettings:
         Returns:
             Dictionary of all settings including nested ones
         """
-        result = {}
-        
-        # Add all direct attributes
-        for attr_name in dir(self):
-            if not attr_name.startswith('_') and not callable(getattr(self, attr_name)):
-                result[attr_name] = getattr(self, attr_name)
-        
-        return result
+        # Settings are instance attributes; convenience properties come from
+        # the class, so there is no need to walk dir() and every method
+        result = {
+            attr_name: value
+            for attr_name, value in vars(self).items()
+            if not attr_name.startswith('_') and not callable(value)
+        }
+        for attr_name in _public_properties(type(self)):
+            result[attr_name] = getattr(self, attr_name)
+        
+        # Keep the sorted key order dir() used to produce
+        return dict(sorted(result.items()))
 
     async def refresh_settings(self) -> None:
         """Force a refresh of settings from the cluster."""
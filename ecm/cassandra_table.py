@@ -17,6 +17,9 @@ class CassandraTable:
         self.keyspace = keyspace
         self.table = table
         self._metadata: Optional[TableMetadata] = None
+        # Parsed compaction strategy and the metadata.options dict it came from
+        self._compaction_strategy: Optional[Dict[str, Any]] = None
+        self._compaction_source: Optional[Dict[str, Any]] = None
 
     def _get_metadata(self) -> TableMetadata:
         """Get table metadata from cluster metadata."""
@@ -56,6 +59,14 @@ class CassandraTable:
         """
         metadata = self._get_metadata()
 
+        # The driver replaces metadata.options on schema changes, so an
+        # identity check is enough to tell whether the cached result is stale
+        if (
+            self._compaction_strategy is not None
+            and self._compaction_source is metadata.options
+        ):
+            return self._compaction_strategy
+
         # Extract compaction info from options
         compaction_options = metadata.options.get("compaction", {})
 
@@ -64,7 +75,8 @@ class CassandraTable:
                 "class", "SizeTieredCompactionStrategy"
             )
             # Remove 'class' from options to get just the strategy-specific options
-            options = {k: v for k, v in compaction_options.items() if k != "class"}
+            options = compaction_options.copy()
+            options.pop("class", None)
         else:
             # Fallback for older versions or different formats
             strategy_class = "SizeTieredCompactionStrategy"
@@ -74,7 +86,9 @@ class CassandraTable:
         if "." in strategy_class:
             strategy_class = strategy_class.split(".")[-1]
 
-        return {"class": strategy_class, "options": options}
+        self._compaction_strategy = {"class": strategy_class, "options": options}
+        self._compaction_source = metadata.options
+        return self._compaction_strategy
 
     async def get_create_statement(self) -> str:
         """Get the CREATE TABLE statement for this table."""
@@ -74,12 +74,8 @@ class CassandraUtility:
         """Parse version string into CassandraVersion object."""
         try:
             # Handle versions like "4.0.11" or "5.0.0-SNAPSHOT"
-            version_parts = version_str.split("-")[0].split(".")
-            major = int(version_parts[0])
-            minor = int(version_parts[1]) if len(version_parts) > 1 else 0
-            patch = int(version_parts[2]) if len(version_parts) > 2 else 0
-            return CassandraVersion(major, minor, patch)
-        except (ValueError, IndexError) as e:
+            return CassandraVersion.from_string(version_str)
+        except ValueError as e:
             logger.error(f"Failed to parse version '{version_str}': {e}")
             raise CassandraVersionError(
                 f"Invalid version format '{version_str}': {e}"
@@ -4,11 +4,21 @@ This module provides a CassandraVersion class for representing
 and comparing Cassandra version numbers.
 """
 
+import re
 from typing import Any
 
+# Leading "major[.minor[.patch]]" of a release version such as "5.0.0-SNAPSHOT"
+_VERSION_RE = re.compile(r"(\d+)(?:\.(\d+))?(?:\.(\d+))?")
+
 
 class CassandraVersion:
-    """Represents a Cassandra version with major, minor, and patch components."""
+    """Represents a Cassandra version with major, minor, and patch components.
+
+    Instances are treated as immutable: the comparison tuple and hash are
+    computed once at construction.
+    """
+
+    __slots__ = ("major", "minor", "patch", "_tuple", "_hash")
 
     def __init__(self, major: int, minor: int, patch: int) -> None:
         """Initialize a CassandraVersion.
@@ -21,6 +31,28 @@ class CassandraVersion:
         self.major = major
         self.minor = minor
         self.patch = patch
+        self._tuple = (major, minor, patch)
+        self._hash = hash(self._tuple)
+
+    @classmethod
+    def from_string(cls, version_str: str) -> "CassandraVersion":
+        """Parse a release version string such as "4.0.11" or "5.0.0-SNAPSHOT".
+
+        Missing minor or patch components default to 0.
+
+        Args:
+            version_str: Release version reported by Cassandra
+
+        Returns:
+            Parsed CassandraVersion
+
+        Raises:
+            ValueError: If the string does not start with a version number
+        """
+        match = _VERSION_RE.match(version_str)
+        if match is None:
+            raise ValueError(f"Invalid version format '{version_str}'")
+        return cls(int(match[1]), int(match[2] or 0), int(match[3] or 0))
 
     def __str__(self) -> str:
         """Return string representation of the version."""
@@ -32,53 +64,46 @@ class CassandraVersion:
 
     def __eq__(self, other: Any) -> bool:
         """Check if this version equals another."""
-        if not isinstance(other, (CassandraVersion, tuple)):
-            return False
-        
+        if isinstance(other, CassandraVersion):
+            return self._tuple == other._tuple
         if isinstance(other, tuple):
-            if len(other) != 3:
-                return False
-            return self.major == other[0] and self.minor == other[1] and self.patch == other[2]
-        
-        return self.major == other.major and self.minor == other.minor and self.patch == other.patch
+            return len(other) == 3 and self._tuple == other
+        return False
 
-    def __lt__(self, other: Any) -> bool:
-        """Check if this version is less than another."""
+    def _comparison_tuple(self, other: Any) -> tuple:
+        """Return other as a (major, minor, patch) tuple for ordering comparisons.
+
+        Raises:
+            ValueError: If other is a tuple without exactly three components
+            TypeError: If other is neither a CassandraVersion nor a tuple
+        """
+        if isinstance(other, CassandraVersion):
+            return other._tuple
         if isinstance(other, tuple):
             if len(other) != 3:
                 raise ValueError(f"Cannot compare CassandraVersion with tuple of length {len(other)}")
-            other_tuple = other
-        elif isinstance(other, CassandraVersion):
-            other_tuple = (other.major, other.minor, other.patch)
-        else:
-            raise TypeError(f"Cannot compare CassandraVersion with {type(other)}")
-        
-        return (self.major, self.minor, self.patch) < other_tuple
+            return other
+        raise TypeError(f"Cannot compare CassandraVersion with {type(other)}")
+
+    def __lt__(self, other: Any) -> bool:
+        """Check if this version is less than another."""
+        return self._tuple < self._comparison_tuple(other)
 
     def __le__(self, other: Any) -> bool:
         """Check if this version is less than or equal to another."""
-        return self == other or self < other
+        return self._tuple <= self._comparison_tuple(other)
 
     def __gt__(self, other: Any) -> bool:
         """Check if this version is greater than another."""
-        if isinstance(other, tuple):
-            if len(other) != 3:
-                raise ValueError(f"Cannot compare CassandraVersion with tuple of length {len(other)}")
-            other_tuple = other
-        elif isinstance(other, CassandraVersion):
-            other_tuple = (other.major, other.minor, other.patch)
-        else:
-            raise TypeError(f"Cannot compare CassandraVersion with {type(other)}")
-        
-        return (self.major, self.minor, self.patch) > other_tuple
+        return self._tuple > self._comparison_tuple(other)
 
     def __ge__(self, other: Any) -> bool:
         """Check if this version is greater than or equal to another."""
-        return self == other or self > other
+        return self._tuple >= self._comparison_tuple(other)
 
     def __hash__(self) -> int:
         """Return hash of the version for use in sets and dicts."""
-        return hash((self.major, self.minor, self.patch))
+        return self._hash
 
     def as_tuple(self) -> tuple[int, int, int]:
         """Return the version as a tuple for backwards compatibility.
@@ -1,4 +1,5 @@
 import logging
+from types import MappingProxyType
 from typing import List
 
 from .cassandra_table import CassandraTable
@@ -8,6 +9,25 @@ from .recommendation import Recommendation, RecommendationCategory, Recommendati
 
 logger = logging.getLogger(__name__)
 
+# Field values of the STCS -> UCS recommendation; formatted once at import
+_UCS_RECOMMENDATION = MappingProxyType({
+    "recommendation": f"Switch from {STCS_CLASS} (STCS) to {UCS_CLASS} (UCS) with scaling_parameters: T4",
+    "category": RecommendationCategory.COMPACTION_STRATEGY,
+    "priority": RecommendationPriority.MEDIUM,
+    "reason": (
+        "UCS with T4 scaling parameters provides better "
+        "performance and more predictable latencies "
+        "compared to STCS in Cassandra 5.0+"
+    ),
+    "current": f"{STCS_CLASS} (STCS)",
+    "suggested": f"{UCS_CLASS} (UCS) with scaling_parameters: T4",
+    "reference": (
+        "https://rustyrazorblade.com/post/2025/"
+        "07-compaction-strategies-and-performance/"
+    ),
+    "type": "compaction_strategy",
+})
+
 
 class CompactionAnalyzer:
     """Analyzes table compaction strategies and provides optimization recommendations."""
@@ -44,26 +64,14 @@ class CompactionAnalyzer:
 
     def _should_recommend_ucs(self, compaction_class: str) -> bool:
         """Check if UCS should be recommended based on current strategy and version."""
+        # Compare the simple class name so both short and fully qualified
+        # names match, without a substring search
         return (
-            STCS_CLASS in compaction_class and self.cassandra_version >= UCS_MIN_VERSION
+            compaction_class.rpartition(".")[2] == STCS_CLASS
+            and self.cassandra_version >= UCS_MIN_VERSION
         )
 
     def _create_ucs_recommendation(self) -> Recommendation:
         """Create a recommendation for switching to UCS."""
-        return Recommendation(
-            recommendation=f"Switch from {STCS_CLASS} (STCS) to {UCS_CLASS} (UCS) with scaling_parameters: T4",
-            category=RecommendationCategory.COMPACTION_STRATEGY,
-            priority=RecommendationPriority.MEDIUM,
-            reason=(
-                "UCS with T4 scaling parameters provides better "
-                "performance and more predictable latencies "
-                "compared to STCS in Cassandra 5.0+"
-            ),
-            current=f"{STCS_CLASS} (STCS)",
-            suggested=f"{UCS_CLASS} (UCS) with scaling_parameters: T4",
-            reference=(
-                "https://rustyrazorblade.com/post/2025/"
-                "07-compaction-strategies-and-performance/"
-            ),
-            type="compaction_strategy"
-        )
+        # Recommendations are mutable, so each caller gets a fresh instance
+        return Recommendation(**_UCS_RECOMMENDATION)
@@ -1,7 +1,8 @@
 import os
-from typing import List, Optional, Union
+from functools import cache
+from typing import Any, List, Optional, Tuple, Union
 
-from pydantic import ConfigDict, field_validator
+from pydantic import ConfigDict, field_validator, model_validator
 from pydantic_settings import BaseSettings
 
 from .constants import (DEFAULT_DATACENTER, DEFAULT_PORT,
@@ -13,8 +14,8 @@ class CassandraConfig(BaseSettings):
 
     model_config = ConfigDict(env_prefix="CASSANDRA_", env_file=".env", extra="ignore")
 
-    # Connection settings - support both single host and list
-    contact_points: Union[str, List[str]] = ["localhost"]
+    # Connection settings - support both single host and list, stored as a tuple
+    contact_points: Union[str, Tuple[str, ...]] = ("localhost",)
     host: Optional[str] = None  # Alternative to contact_points for Docker
     port: int = DEFAULT_PORT
     datacenter: str = DEFAULT_DATACENTER
@@ -30,22 +31,47 @@ class CassandraConfig(BaseSettings):
     @field_validator('contact_points', mode='before')
     @classmethod
     def parse_contact_points(cls, v):
-        """Parse contact points from string or list format."""
+        """Parse contact points from string or list format into a tuple."""
         if isinstance(v, str):
-            # Handle comma-separated string
-            return [point.strip() for point in v.split(',')]
+            # Handle comma-separated string, ignoring empty entries like a trailing comma
+            return tuple(point for point in map(str.strip, v.split(',')) if point)
+        if isinstance(v, list):
+            return tuple(v)
         return v
     
-    def __init__(self, **data):
-        """Initialize config with Docker-friendly environment variable support."""
-        # Support CASSANDRA_HOST as an alternative to CASSANDRA_CONTACT_POINTS
-        if 'host' not in data and os.getenv('CASSANDRA_HOST'):
-            data['contact_points'] = [os.getenv('CASSANDRA_HOST')]
-        super().__init__(**data)
-        
-        # Normalize contact_points to always be a list
-        if isinstance(self.contact_points, str):
-            self.contact_points = [self.contact_points]
-        elif self.host and not any(cp != 'localhost' for cp in self.contact_points):
+    @model_validator(mode='before')
+    @classmethod
+    def apply_host(cls, data: Any) -> Any:
+        """Derive contact_points from host, for Docker-friendly configuration.
+
+        CASSANDRA_HOST is an alternative to CASSANDRA_CONTACT_POINTS. An
+        explicitly passed host is only used while contact_points is still
+        the localhost default. Runs on the merged init/env values, so
+        pydantic validates everything in a single pass.
+        """
+        if not isinstance(data, dict):
+            return data
+        host = data.get('host')
+        if not host:
+            return data
+
+        env_host = os.getenv('CASSANDRA_HOST')
+        if host == env_host:
+            # host came from the environment
+            return {**data, 'contact_points': (env_host,)}
+
+        contact_points = cls.parse_contact_points(data.get('contact_points', ('localhost',)))
+        if not any(cp != 'localhost' for cp in contact_points):
             # Use host if contact_points is still default
-            self.contact_points = [self.host]
+            return {**data, 'contact_points': (host,)}
+        return data
+
+
+@cache
+def get_cassandra_config() -> CassandraConfig:
+    """Return the process-wide CassandraConfig, reading the environment and .env once.
+
+    Returns:
+        Shared CassandraConfig instance
+    """
+    return CassandraConfig()
@@ -13,6 +13,9 @@ DEFAULT_PROTOCOL_VERSION = 5
 CONNECTION_TIMEOUT = 30  # seconds
 QUERY_TIMEOUT = 10  # seconds
 MAX_QUERY_LOG_LENGTH = 100  # characters
+MAX_HOST_EXECUTION_PROFILES = 256  # per-host profiles kept before LRU eviction
+MAX_CACHED_BOUND_STATEMENTS = 1024  # pre-bound statements kept per connection
+BLOCKING_EXECUTOR_WORKERS = 4  # threads for blocking driver calls (connect, prepare)
 
 # System keyspaces
 SYSTEM_KEYSPACE = "system"
@@ -23,6 +26,7 @@ VALID_SYSTEM_KEYSPACES = [SYSTEM_KEYSPACE, SYSTEM_VIEWS_KEYSPACE]
 # Query limits
 MAX_DISPLAY_ROWS = 10
 MAX_CONCURRENT_QUERIES = 10
+BULK_QUERY_CONCURRENCY = 64  # in-flight requests for driver-side concurrent execution
 BATCH_SIZE = 100
 
 # Logging
@@ -30,6 +34,9 @@ LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
 # Cache settings
 VERSION_CACHE_TTL = 3600  # 1 hour in seconds
+THREAD_POOL_STATS_TTL = 30  # seconds before thread pool stats are queried again
+TABLES_CACHE_SIZE = 256  # keyspaces whose table lists are cached
+CREATE_TABLE_CACHE_SIZE = 1024  # tables whose CREATE TABLE statements are cached
 
 # Compaction strategies
 STCS_CLASS = "SizeTieredCompactionStrategy"
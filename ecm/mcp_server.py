@@ -24,6 +24,9 @@ async def create_mcp_server(service: CassandraService) -> FastMCP:
     # Create utility instance
     utility = CassandraUtility(service.connection.session)
     
+    # Shared across tool calls so recent statistics are reused within their TTL
+    thread_pool_stats = ThreadPoolStats(service.connection.session)
+    
     # Discover available system tables for dynamic descriptions
     try:
         discovered_tables = await service.discover_system_tables()
@@ -257,8 +260,7 @@ async def create_mcp_server(service: CassandraService) -> FastMCP:
             # Load settings from cluster
             await settings.load_settings()
             
-            # Create and load thread pool statistics
-            thread_pool_stats = ThreadPoolStats(service.connection.session)
+            # Load thread pool statistics unless they are still fresh
             await thread_pool_stats.load_stats()
             
             # Create analyzer with settings and thread pool stats
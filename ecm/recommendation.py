@@ -30,7 +30,7 @@ class RecommendationPriority(Enum):
     LOW = "low"
 
 
-@dataclass
+@dataclass(slots=True)
 class Recommendation:
     """Represents a configuration or performance recommendation.
     
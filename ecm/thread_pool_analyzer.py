@@ -5,20 +5,68 @@ for tuning thread pool configurations to optimize performance.
 """
 
 import logging
-from typing import List
+import sys
+from itertools import chain
+from typing import Iterator, List
 
 from .cassandra_settings import CassandraSettings
 from .recommendation import Recommendation, RecommendationCategory, RecommendationPriority
-from .thread_pool_stats import ThreadPoolStats, ThreadPoolStat
+from .thread_pool_stats import ThreadPoolStat, ThreadPoolStats
 
 logger = logging.getLogger(__name__)
 
+# Enum members bound once at import; attribute access on the enum class is
+# noticeably slower than a module global lookup
+_CAT_BACKPRESSURE = RecommendationCategory.BACKPRESSURE
+_CAT_CAPACITY = RecommendationCategory.CAPACITY
+_CAT_CONFIGURATION = RecommendationCategory.CONFIGURATION
+_CAT_PERFORMANCE = RecommendationCategory.PERFORMANCE
+_PRIORITY_HIGH = RecommendationPriority.HIGH
+_PRIORITY_MEDIUM = RecommendationPriority.MEDIUM
+
+# Pools with dedicated checks, skipped by the generic pending backlog check.
+# Interned to match the interned names ThreadPoolStats stores
+_DEDICATED_POOLS = frozenset(map(sys.intern, (
+    "Native-Transport-Requests",
+    "ReadStage",
+    "CompactionExecutor",
+    "MemtableFlushWriter",
+)))
+
+# Pending-task rules for pools tuned by a single setting:
+# (ThreadPoolStats attribute, pool name, setting key, tiers). Each tier is
+# (pending threshold, priority, recommendation, reason template, suggested value),
+# checked in order; the reason template receives the pool name and pending count.
+_PENDING_RULES = (
+    ("read_stage", "ReadStage", "concurrent_reads", (
+        (100, _PRIORITY_HIGH,
+         "Increase concurrent_reads to handle read backlog",
+         "{pool} has {pending} pending tasks, indicating read throughput bottleneck",
+         lambda current: min(current * 2, 128)),
+        (50, _PRIORITY_MEDIUM,
+         "Monitor read performance, consider increasing concurrent_reads",
+         "{pool} has {pending} pending tasks",
+         lambda current: min(int(current * 1.5), 96)),
+    )),
+    ("compaction_executor", "CompactionExecutor", "concurrent_compactors", (
+        (10, _PRIORITY_MEDIUM,
+         "Increase concurrent_compactors to reduce compaction backlog",
+         "{pool} has {pending} pending tasks, which may impact read performance",
+         lambda current: min(current + 1, 4)),
+    )),
+    ("memtable_flush_writer", "MemtableFlushWriter", "memtable_flush_writers", (
+        (5, _PRIORITY_HIGH,
+         "Increase memtable_flush_writers to handle write load",
+         "{pool} has {pending} pending flushes, which may cause write blocking",
+         lambda current: min(current + 1, 4)),
+    )),
+)
+
 
 class ThreadPoolAnalyzer:
     """Analyzes thread pool statistics and provides tuning recommendations."""
 
     # Thread pool thresholds for recommendations
-    BLOCKED_THRESHOLD = 0  # Any blocked tasks trigger a recommendation
     PENDING_HIGH_THRESHOLD = 100  # High pending tasks threshold
     PENDING_WARNING_THRESHOLD = 50  # Warning level for pending tasks
     CAPACITY_WARNING_RATIO = 0.8  # Warn when pool is at 80% capacity
@@ -47,32 +95,32 @@ class ThreadPoolAnalyzer:
             - suggested: Suggested configuration/action
             - pool_name: Name of the affected thread pool
         """
-        recommendations = []
-        
         # Ensure stats are loaded
         if not self.stats.is_loaded():
             await self.stats.load_stats()
         
-        # Analyze each type of thread pool
-        recommendations.extend(self._analyze_native_transport())
-        recommendations.extend(self._analyze_read_stage())
-        recommendations.extend(self._analyze_compaction())
-        recommendations.extend(self._analyze_memtable_flush())
-        recommendations.extend(self._analyze_blocked_pools())
-        recommendations.extend(self._analyze_pending_backlog())
+        # Classify every pool once for the cross-pool checks
+        blocked_pools, pools_with_pending = self.stats.get_blocked_and_pending_pools()
         
-        return recommendations
+        # Analyze each type of thread pool; each check yields its recommendations
+        # and they are collected into a single list
+        return list(chain(
+            self._analyze_native_transport(),
+            self._analyze_pending_rules(),
+            self._analyze_compaction_disabled(),
+            self._analyze_blocked_pools(blocked_pools),
+            self._analyze_pending_backlog(pools_with_pending),
+        ))
 
-    def _analyze_native_transport(self) -> List[Recommendation]:
+    def _analyze_native_transport(self) -> Iterator[Recommendation]:
         """Analyze Native-Transport-Requests thread pool.
         
         This pool handles client requests and is critical for request handling performance.
         """
-        recommendations = []
         pool = self.stats.native_transport_requests
         
         if not pool:
-            return recommendations
+            return
         
         # Check if at capacity
         if pool.active > 0:
@@ -80,226 +128,126 @@ class ThreadPoolAnalyzer:
             
             if utilization >= self.CAPACITY_CRITICAL_RATIO:
                 current_threads = self.settings.get_setting('native_transport_max_threads', pool.active_limit)
-                recommendations.append(Recommendation(
+                yield Recommendation(
                     recommendation="Increase native_transport_max_threads",
-                    category=RecommendationCategory.CAPACITY,
-                    priority=RecommendationPriority.HIGH,
+                    category=_CAT_CAPACITY,
+                    priority=_PRIORITY_HIGH,
                     reason=f"Native transport thread pool is at {utilization:.0%} capacity, which may cause request queueing and increased latency",
                     current=f"native_transport_max_threads: {current_threads}",
                     suggested=f"native_transport_max_threads: {current_threads * 2}",
                     pool_name="Native-Transport-Requests"
-                ))
+                )
             elif utilization >= self.CAPACITY_WARNING_RATIO:
                 current_threads = self.settings.get_setting('native_transport_max_threads', pool.active_limit)
-                recommendations.append(Recommendation(
+                yield Recommendation(
                     recommendation="Consider increasing native_transport_max_threads",
-                    category=RecommendationCategory.CAPACITY,
-                    priority=RecommendationPriority.MEDIUM,
+                    category=_CAT_CAPACITY,
+                    priority=_PRIORITY_MEDIUM,
                     reason=f"Native transport thread pool is at {utilization:.0%} capacity",
                     current=f"native_transport_max_threads: {current_threads}",
                     suggested=f"native_transport_max_threads: {int(current_threads * 1.5)}",
                     pool_name="Native-Transport-Requests"
-                ))
-        
-        return recommendations
+                )
 
-    def _analyze_read_stage(self) -> List[Recommendation]:
-        """Analyze ReadStage thread pool.
+    def _analyze_pending_rules(self) -> Iterator[Recommendation]:
+        """Apply the pending-task rules in _PENDING_RULES to their thread pools.
         
-        This pool handles read requests and directly impacts read latency.
+        ReadStage, CompactionExecutor and MemtableFlushWriter differ only in the
+        setting they tune and their thresholds, so they share one loop. The first
+        tier whose threshold the pool's pending count exceeds wins.
         """
-        recommendations = []
-        pool = self.stats.read_stage
-        
-        if not pool:
-            return recommendations
-        
-        # Check pending reads
-        current_reads = self.settings.get_setting('concurrent_reads', pool.active_limit)
-        if pool.pending > self.PENDING_HIGH_THRESHOLD:
-            recommendations.append(Recommendation(
-                recommendation="Increase concurrent_reads to handle read backlog",
-                category=RecommendationCategory.PERFORMANCE,
-                priority=RecommendationPriority.HIGH,
-                reason=f"ReadStage has {pool.pending} pending tasks, indicating read throughput bottleneck",
-                current=f"concurrent_reads: {current_reads}",
-                suggested=f"concurrent_reads: {min(current_reads * 2, 128)}",
-                pool_name="ReadStage"
-            ))
-        elif pool.pending > self.PENDING_WARNING_THRESHOLD:
-            recommendations.append(Recommendation(
-                recommendation="Monitor read performance, consider increasing concurrent_reads",
-                category=RecommendationCategory.PERFORMANCE,
-                priority=RecommendationPriority.MEDIUM,
-                reason=f"ReadStage has {pool.pending} pending tasks",
-                current=f"concurrent_reads: {current_reads}",
-                suggested=f"concurrent_reads: {min(int(current_reads * 1.5), 96)}",
-                pool_name="ReadStage"
-            ))
-        
-        return recommendations
-
-    def _analyze_compaction(self) -> List[Recommendation]:
-        """Analyze CompactionExecutor thread pool.
-        
-        This pool handles compaction tasks which are crucial for read performance.
+        for pool_attr, pool_name, setting_key, tiers in _PENDING_RULES:
+            pool = getattr(self.stats, pool_attr)
+            if not pool:
+                continue
+            
+            for threshold, priority, recommendation, reason, suggest in tiers:
+                if pool.pending > threshold:
+                    current = self.settings.get_setting(setting_key, pool.active_limit)
+                    yield Recommendation(
+                        recommendation=recommendation,
+                        category=_CAT_PERFORMANCE,
+                        priority=priority,
+                        reason=reason.format(pool=pool_name, pending=pool.pending),
+                        current=f"{setting_key}: {current}",
+                        suggested=f"{setting_key}: {suggest(current)}",
+                        pool_name=pool_name
+                    )
+                    break
+
+    def _analyze_compaction_disabled(self) -> Iterator[Recommendation]:
+        """Check whether the CompactionExecutor thread pool has any threads.
+        
+        Without compaction threads, SSTables accumulate and read performance degrades.
         """
-        recommendations = []
         pool = self.stats.compaction_executor
         
         if not pool:
-            return recommendations
-        
-        # Check for compaction backlog
-        current_compactors = self.settings.get_setting('concurrent_compactors', pool.active_limit)
-        if pool.pending > 10:
-            recommendations.append(Recommendation(
-                recommendation="Increase concurrent_compactors to reduce compaction backlog",
-                category=RecommendationCategory.PERFORMANCE,
-                priority=RecommendationPriority.MEDIUM,
-                reason=f"CompactionExecutor has {pool.pending} pending tasks, which may impact read performance",
-                current=f"concurrent_compactors: {current_compactors}",
-                suggested=f"concurrent_compactors: {min(current_compactors + 1, 4)}",
-                pool_name="CompactionExecutor"
-            ))
+            return
         
         # Check if compaction is disabled (limit = 0)
-        if current_compactors == 0:
-            recommendations.append(Recommendation(
+        if self.settings.get_setting('concurrent_compactors', pool.active_limit) == 0:
+            yield Recommendation(
                 recommendation="Compaction appears to be disabled",
-                category=RecommendationCategory.CONFIGURATION,
-                priority=RecommendationPriority.HIGH,
+                category=_CAT_CONFIGURATION,
+                priority=_PRIORITY_HIGH,
                 reason="CompactionExecutor has no threads allocated, compaction may be disabled",
                 current="concurrent_compactors: 0",
                 suggested="concurrent_compactors: 2",
                 pool_name="CompactionExecutor"
-            ))
-        
-        return recommendations
+            )
 
-    def _analyze_memtable_flush(self) -> List[Recommendation]:
-        """Analyze MemtableFlushWriter thread pool.
-        
-        This pool handles memtable flushes which impact write performance.
-        """
-        recommendations = []
-        pool = self.stats.memtable_flush_writer
-        
-        if not pool:
-            return recommendations
-        
-        # Check for flush backlog
-        current_flush_writers = self.settings.get_setting('memtable_flush_writers', pool.active_limit)
-        if pool.pending > 5:
-            recommendations.append(Recommendation(
-                recommendation="Increase memtable_flush_writers to handle write load",
-                category=RecommendationCategory.PERFORMANCE,
-                priority=RecommendationPriority.HIGH,
-                reason=f"MemtableFlushWriter has {pool.pending} pending flushes, which may cause write blocking",
-                current=f"memtable_flush_writers: {current_flush_writers}",
-                suggested=f"memtable_flush_writers: {min(current_flush_writers + 1, 4)}",
-                pool_name="MemtableFlushWriter"
-            ))
-        
-        return recommendations
-
-    def _analyze_blocked_pools(self) -> List[Recommendation]:
+    def _analyze_blocked_pools(self, blocked_pools: List[ThreadPoolStat]) -> Iterator[Recommendation]:
         """Analyze all thread pools for blocked tasks.
         
         Blocked tasks indicate serious performance issues that need immediate attention.
-        """
-        recommendations = []
-        blocked_pools = self.stats.get_blocked_pools()
+        Any blocked task triggers a recommendation.
         
+        Args:
+            blocked_pools: Pools with blocked tasks, as classified by ThreadPoolStats
+        """
         for pool in blocked_pools:
-            if pool.blocked > self.BLOCKED_THRESHOLD:
-                # Determine the pool name from the stats
-                pool_name = self._get_pool_name(pool)
-                
-                recommendations.append(Recommendation(
-                    recommendation=f"Investigate blocked tasks in {pool_name}",
-                    category=RecommendationCategory.BACKPRESSURE,
-                    priority=RecommendationPriority.HIGH,
-                    reason=f"{pool_name} has {pool.blocked} blocked tasks (total blocked all time: {pool.blocked_all_time}), indicating severe resource contention",
-                    current=f"Blocked tasks: {pool.blocked}",
-                    suggested="Review system resources (CPU, I/O), check for lock contention, consider increasing pool size",
-                    pool_name=pool_name
-                ))
-        
-        return recommendations
+            pool_name = pool.name
+            
+            yield Recommendation(
+                recommendation=f"Investigate blocked tasks in {pool_name}",
+                category=_CAT_BACKPRESSURE,
+                priority=_PRIORITY_HIGH,
+                reason=f"{pool_name} has {pool.blocked} blocked tasks (total blocked all time: {pool.blocked_all_time}), indicating severe resource contention",
+                current=f"Blocked tasks: {pool.blocked}",
+                suggested="Review system resources (CPU, I/O), check for lock contention, consider increasing pool size",
+                pool_name=pool_name
+            )
 
-    def _analyze_pending_backlog(self) -> List[Recommendation]:
+    def _analyze_pending_backlog(self, pools_with_pending: List[ThreadPoolStat]) -> Iterator[Recommendation]:
         """Analyze all thread pools for high pending task counts.
         
         High pending tasks indicate the system cannot keep up with the workload.
-        """
-        recommendations = []
-        pools_with_pending = self.stats.get_pools_with_pending()
-        
-        # We've already analyzed specific pools, so look for others
-        analyzed_pools = {
-            "Native-Transport-Requests",
-            "ReadStage",
-            "CompactionExecutor",
-            "MemtableFlushWriter"
-        }
         
+        Args:
+            pools_with_pending: Pools with pending tasks
+        """
         for pool in pools_with_pending:
-            pool_name = self._get_pool_name(pool)
+            # Most pools with pending tasks are below the warning level
+            if pool.pending <= self.PENDING_WARNING_THRESHOLD:
+                continue
             
-            # Skip if already analyzed
-            if pool_name in analyzed_pools:
+            # Skip pools with their own dedicated checks
+            pool_name = pool.name
+            if pool_name in _DEDICATED_POOLS:
                 continue
             
             if pool.pending > self.PENDING_HIGH_THRESHOLD:
-                priority = RecommendationPriority.HIGH
-            elif pool.pending > self.PENDING_WARNING_THRESHOLD:
-                priority = RecommendationPriority.MEDIUM
+                priority = _PRIORITY_HIGH
             else:
-                continue
+                priority = _PRIORITY_MEDIUM
             
-            recommendations.append(Recommendation(
+            yield Recommendation(
                 recommendation=f"High pending tasks in {pool_name}",
-                category=RecommendationCategory.PERFORMANCE,
+                category=_CAT_PERFORMANCE,
                 priority=priority,
                 reason=f"{pool_name} has {pool.pending} pending tasks, indicating processing backlog",
                 current=f"Pending tasks: {pool.pending}, Active limit: {pool.active_limit}",
                 suggested=f"Consider increasing thread pool size for {pool_name}",
                 pool_name=pool_name
-            ))
-        
-        return recommendations
-
-    def _get_pool_name(self, pool: ThreadPoolStat) -> str:
-        """Get the name of a thread pool from the stats.
-        
-        This is a helper method to find the pool name by comparing object references.
-        """
-        # Check each pool property to find which one matches
-        pool_mapping = {
-            "CacheCleanupExecutor": self.stats.cache_cleanup_executor,
-            "CompactionExecutor": self.stats.compaction_executor,
-            "GossipStage": self.stats.gossip_stage,
-            "HintsDispatcher": self.stats.hints_dispatcher,
-            "MemtableFlushWriter": self.stats.memtable_flush_writer,
-            "MemtablePostFlush": self.stats.memtable_post_flush,
-            "MemtableReclaimMemory": self.stats.memtable_reclaim_memory,
-            "MigrationStage": self.stats.migration_stage,
-            "Native-Transport-Auth-Requests": self.stats.native_transport_auth_requests,
-            "Native-Transport-Requests": self.stats.native_transport_requests,
-            "PendingRangeCalculator": self.stats.pending_range_calculator,
-            "PerDiskMemtableFlushWriter_0": self.stats.per_disk_memtable_flush_writer_0,
-            "ReadStage": self.stats.read_stage,
-            "Sampler": self.stats.sampler,
-            "SecondaryIndexExecutor": self.stats.secondary_index_executor,
-            "SecondaryIndexManagement": self.stats.secondary_index_management,
-            "StatusPropagationExecutor": self.stats.status_propagation_executor,
-            "ValidationExecutor": self.stats.validation_executor,
-            "ViewBuildExecutor": self.stats.view_build_executor,
-        }
-        
-        for name, stat in pool_mapping.items():
-            if stat is pool:
-                return name
-        
-        return "Unknown"
\ No newline at end of file
+            )
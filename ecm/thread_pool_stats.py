@@ -5,18 +5,31 @@ thread pool statistics from the system_views.thread_pools virtual table.
 """
 
 import logging
+import sys
+import time
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from cassandra.cluster import Session
 
+from .cassandra_connection import await_all_pages, prepare_for_session
+from .constants import THREAD_POOL_STATS_TTL
+
 logger = logging.getLogger(__name__)
 
+THREAD_POOLS_QUERY = """
+    SELECT name, active_tasks, active_tasks_limit,
+           blocked_tasks, blocked_tasks_all_time,
+           completed_tasks, pending_tasks
+    FROM system_views.thread_pools
+"""
+
 
-@dataclass
+@dataclass(slots=True)
 class ThreadPoolStat:
     """Statistics for a single thread pool."""
     
+    name: str = ""
     active: int = 0
     active_limit: int = 0
     blocked: int = 0
@@ -37,6 +50,7 @@ class ThreadPoolStats:
         self.session = session
         self._pools: Dict[str, ThreadPoolStat] = {}
         self._loaded = False
+        self._loaded_at = 0.0  # time.monotonic() of the last load
     
     # Properties for each thread pool
     @property
@@ -139,26 +153,24 @@ class ThreadPoolStats:
         
         This method queries the system_views.thread_pools table and populates
         all thread pool statistics. Statistics are aggregated across all nodes.
+        Statistics loaded less than THREAD_POOL_STATS_TTL seconds ago are reused.
         """
-        if self._loaded:
+        if self.is_loaded():
             return
         
         try:
-            # Query system_views.thread_pools
-            query = """
-                SELECT name, active_tasks, active_tasks_limit, 
-                       blocked_tasks, blocked_tasks_all_time,
-                       completed_tasks, pending_tasks
-                FROM system_views.thread_pools
-            """
-            result = self.session.execute(query)
+            # Query system_views.thread_pools without blocking the event loop
+            prepared = await prepare_for_session(self.session, THREAD_POOLS_QUERY)
+            result = await await_all_pages(self.session.execute_async(prepared))
             
             # Clear existing pools
             self._pools.clear()
             
             # Process each row
             for row in result:
-                pool_name = row.name
+                # Interned so dict lookups and set membership checks against
+                # the pool name constants can match by identity
+                pool_name = sys.intern(row.name)
                 
                 # Create or update the pool statistics
                 if pool_name in self._pools:
@@ -177,6 +189,7 @@ class ThreadPoolStats:
                 else:
                     # Create new pool statistics
                     self._pools[pool_name] = ThreadPoolStat(
+                        name=pool_name,
                         active=row.active_tasks,
                         active_limit=row.active_tasks_limit,
                         blocked=row.blocked_tasks,
@@ -185,12 +198,13 @@ class ThreadPoolStats:
                         pending=row.pending_tasks
                     )
             
-            self._loaded = True
+            self._mark_loaded()
             logger.info(f"Loaded statistics for {len(self._pools)} thread pools")
             
         except Exception as e:
             logger.error(f"Failed to load thread pool statistics: {e}")
-            self._loaded = True  # Prevent repeated failures
+            # Leave the stats unloaded so the next call retries the query
+            self._loaded = False
             raise
     
     async def load_stats_for_node(self, node_address: str) -> None:
@@ -202,23 +216,19 @@ class ThreadPoolStats:
         try:
             # This would require node-specific execution similar to CassandraService
             # For now, we'll use a simplified approach
-            query = """
-                SELECT name, active_tasks, active_tasks_limit, 
-                       blocked_tasks, blocked_tasks_all_time,
-                       completed_tasks, pending_tasks
-                FROM system_views.thread_pools
-            """
-            
             # Note: In a real implementation, we'd use ExecutionProfile
             # to target a specific node, similar to CassandraService
-            result = self.session.execute(query)
+            prepared = await prepare_for_session(self.session, THREAD_POOLS_QUERY)
+            result = await await_all_pages(self.session.execute_async(prepared))
             
             # Clear existing pools
             self._pools.clear()
             
             # Process each row
             for row in result:
-                self._pools[row.name] = ThreadPoolStat(
+                pool_name = sys.intern(row.name)
+                self._pools[pool_name] = ThreadPoolStat(
+                    name=pool_name,
                     active=row.active_tasks,
                     active_limit=row.active_tasks_limit,
                     blocked=row.blocked_tasks,
@@ -227,7 +237,7 @@ class ThreadPoolStats:
                     pending=row.pending_tasks
                 )
             
-            self._loaded = True
+            self._mark_loaded()
             logger.info(f"Loaded statistics for {len(self._pools)} thread pools from node {node_address}")
             
         except Exception as e:
@@ -258,13 +268,19 @@ class ThreadPoolStats:
         self._loaded = False
         await self.load_stats()
     
+    def _mark_loaded(self) -> None:
+        """Record that statistics were just loaded."""
+        self._loaded = True
+        self._loaded_at = time.monotonic()
+    
     def is_loaded(self) -> bool:
-        """Check if statistics have been loaded.
+        """Check if statistics have been loaded and are still fresh.
         
         Returns:
-            True if statistics have been loaded, False otherwise
+            True if statistics were loaded within the last THREAD_POOL_STATS_TTL
+            seconds, False otherwise
         """
-        return self._loaded
+        return self._loaded and time.monotonic() - self._loaded_at < THREAD_POOL_STATS_TTL
     
     def get_high_activity_pools(self, threshold: int = 10) -> List[ThreadPoolStat]:
         """Get thread pools with high activity.
@@ -302,6 +318,21 @@ class ThreadPoolStats:
             if pool.pending > 0
         ]
     
+    def get_blocked_and_pending_pools(self) -> Tuple[List[ThreadPoolStat], List[ThreadPoolStat]]:
+        """Get pools with blocked tasks and pools with pending tasks in one pass.
+        
+        Returns:
+            Tuple of (pools with blocked_tasks > 0, pools with pending_tasks > 0)
+        """
+        blocked = []
+        pending = []
+        for pool in self._pools.values():
+            if pool.blocked > 0:
+                blocked.append(pool)
+            if pool.pending > 0:
+                pending.append(pool)
+        return blocked, pending
+    
     def get_pool_summary(self) -> Dict[str, Dict[str, int]]:
         """Get a summary of all thread pool statistics.
         
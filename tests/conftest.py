@@ -1,18 +1,20 @@
 import asyncio
 import os
+from unittest.mock import Mock
 
 import pytest
 import pytest_asyncio
+from cassandra.cluster import _NOT_SET
 
 from ecm.cassandra_connection import CassandraConnection
 from ecm.cassandra_service import CassandraService
-from ecm.config import CassandraConfig
+from ecm.config import get_cassandra_config
 
 
 @pytest.fixture(scope="session")
 def test_config():
     """Load test configuration from environment."""
-    config = CassandraConfig()
+    config = get_cassandra_config()
     # Override with test-specific settings if provided
     return {
         "contact_points": config.test_contact_points or config.contact_points,
@@ -24,6 +26,39 @@ def test_config():
     }
 
 
+@pytest.fixture
+def response_future():
+    """Factory for mock driver ResponseFutures.
+
+    response_future(page1, page2, ...) has already completed with page1; each
+    start_fetching_next_page() puts the next page in flight and delivers it
+    through the registered callback, as the driver does. With no pages the
+    request is still in flight, and final_exception marks it as failed.
+    """
+
+    def _make(*pages, final_exception=None):
+        future = Mock()
+        remaining = list(pages[1:])
+        future._final_result = pages[0] if pages else _NOT_SET
+        future._final_exception = final_exception
+        future.has_more_pages = bool(remaining)
+
+        def start_fetching_next_page():
+            future._final_result = _NOT_SET
+
+        def add_callbacks(callback, errback, callback_args=(), errback_args=()):
+            page = remaining.pop(0)
+            future.has_more_pages = bool(remaining)
+            callback(page, *callback_args)
+
+        future.start_fetching_next_page = Mock(side_effect=start_fetching_next_page)
+        if remaining:
+            future.add_callbacks = add_callbacks
+        return future
+
+    return _make
+
+
 @pytest.fixture(scope="session")
 def event_loop():
     """Create an instance of the default event loop for the test session."""
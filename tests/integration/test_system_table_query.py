@@ -5,7 +5,7 @@ import logging
 
 from ecm.cassandra_connection import CassandraConnection
 from ecm.cassandra_service import CassandraService
-from ecm.config import CassandraConfig
+from ecm.config import get_cassandra_config
 
 logging.basicConfig(level=logging.INFO)
 
@@ -13,7 +13,7 @@ logging.basicConfig(level=logging.INFO)
 async def test_system_table_queries():
     """Test the new system table query functionality."""
     # Setup
-    config = CassandraConfig()
+    config = get_cassandra_config()
     connection = CassandraConnection(
         contact_points=config.contact_points,
         port=config.port,
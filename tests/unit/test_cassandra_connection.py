@@ -5,11 +5,17 @@ timeout handling, and query execution functionality.
 """
 
 import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from cassandra import OperationTimedOut
 
-from ecm.cassandra_connection import CassandraConnection
+from ecm.cassandra_connection import (CassandraConnection, _session_executors,
+                                      await_all_pages, prepare_for_session)
+from ecm.constants import QUERY_TIMEOUT
 from ecm.exceptions import CassandraConnectionError, CassandraQueryError
 
 
@@ -55,7 +61,7 @@ class TestCassandraConnection:
         """Test connect when already connected."""
         connection._is_connected = True
         
-        with patch("ecm.cassandra_connection.asyncio.get_event_loop") as mock_get_loop:
+        with patch("ecm.cassandra_connection.asyncio.get_running_loop") as mock_get_loop:
             await connection.connect()
             # Should not attempt to connect again
             mock_get_loop.assert_not_called()
@@ -63,7 +69,7 @@ class TestCassandraConnection:
     @pytest.mark.asyncio
     async def test_connect_timeout(self, connection):
         """Test connection timeout handling."""
-        with patch("ecm.cassandra_connection.asyncio.get_event_loop") as mock_get_loop:
+        with patch("ecm.cassandra_connection.asyncio.get_running_loop") as mock_get_loop:
             mock_loop = Mock()
             mock_get_loop.return_value = mock_loop
             
@@ -86,24 +92,28 @@ class TestCassandraConnection:
         assert "Not connected to Cassandra" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_execute_async_timeout(self, connection):
+    async def test_execute_async_timeout(self, connection, response_future):
         """Test query execution timeout."""
         connection._is_connected = True
         connection.session = Mock()
         
-        # Create a mock ResponseFuture that doesn't trigger callbacks
-        mock_response_future = Mock()
-        mock_response_future.add_callback = Mock()
-        mock_response_future.add_errback = Mock()
+        # Create a mock ResponseFuture whose driver-side timer fires
+        mock_response_future = response_future()
+
+        def mock_add_callbacks(callback, errback, callback_args=(), errback_args=()):
+            errback(OperationTimedOut("Client request timeout"), *errback_args)
+
+        mock_response_future.add_callbacks = mock_add_callbacks
         connection.session.execute_async.return_value = mock_response_future
         
-        with patch("ecm.cassandra_connection.asyncio.wait_for") as mock_wait_for:
-            mock_wait_for.side_effect = asyncio.TimeoutError()
-            
-            with pytest.raises(CassandraQueryError) as exc_info:
-                await connection.execute_async("SELECT * FROM test")
-            
-            assert "Query timeout" in str(exc_info.value)
+        with pytest.raises(CassandraQueryError) as exc_info:
+            await connection.execute_async("SELECT * FROM test")
+        
+        assert "Query timeout" in str(exc_info.value)
+        # The timeout is delegated to the driver
+        connection.session.execute_async.assert_called_once_with(
+            "SELECT * FROM test", None, timeout=QUERY_TIMEOUT
+        )
 
     @pytest.mark.asyncio
     async def test_prepare_statements_error_handling(self, connection):
@@ -111,16 +121,225 @@ class TestCassandraConnection:
         connection.session = Mock()
         mock_prepare = Mock(side_effect=Exception("Prepare failed"))
         
-        with patch("ecm.cassandra_connection.asyncio.get_event_loop") as mock_get_loop:
-            mock_loop = Mock()
-            mock_get_loop.return_value = mock_loop
-            mock_loop.run_in_executor = AsyncMock(side_effect=Exception("Prepare failed"))
-            
-            # Should not raise, just log warning
-            await connection._prepare_statements()
-            
-            # Prepared statements dict should be empty due to failures
-            assert len(connection.prepared_statements) == 0
+        mock_loop = Mock()
+        mock_loop.run_in_executor = AsyncMock(side_effect=Exception("Prepare failed"))
+        connection._loop = mock_loop
+        
+        # Should not raise, just log warning
+        await connection._prepare_statements()
+        
+        # Prepared statements dict should be empty due to failures
+        assert len(connection.prepared_statements) == 0
+
+    @pytest.mark.asyncio
+    async def test_prepare_statements_partial_failure(self, connection):
+        """Test one failed prepare does not discard the statements that succeeded."""
+        connection.session = Mock()
+
+        def mock_prepare(query):
+            if "system_schema.columns" in query:
+                raise Exception("Prepare failed")
+            return Mock(query_string=query)
+
+        connection.session.prepare = mock_prepare
+
+        await connection._prepare_statements()
+
+        assert set(connection.prepared_statements) == {
+            "select_tables",
+            "select_release_version",
+        }
+        assert connection.stmts.select_tables is connection.prepared_statements["select_tables"]
+        assert not hasattr(connection.stmts, "select_columns")
+        assert "system_schema.tables" in connection.prepared_statements["select_tables"].query_string
+
+    def test_bound_statement_binds_once(self, connection):
+        """Test bound_statement reuses the BoundStatement for repeated parameters."""
+        mock_prepared = Mock()
+        mock_prepared.bind.side_effect = lambda params: Mock(values=params)
+        connection.prepared_statements = {"select_tables": mock_prepared}
+
+        first = connection.bound_statement("select_tables", ("ks1",))
+        again = connection.bound_statement("select_tables", ("ks1",))
+        other = connection.bound_statement("select_tables", ("ks2",))
+
+        assert first is again
+        assert other is not first
+        assert mock_prepared.bind.call_count == 2
+
+    def test_bound_statement_evicts_least_recently_used(self, connection):
+        """Test a full bind cache keeps caching new binds by evicting the stalest."""
+        mock_prepared = Mock()
+        mock_prepared.bind.side_effect = lambda params: Mock(values=params)
+        connection.prepared_statements = {"select_tables": mock_prepared}
+
+        with patch("ecm.cassandra_connection.MAX_CACHED_BOUND_STATEMENTS", 2):
+            ks1 = connection.bound_statement("select_tables", ("ks1",))
+            connection.bound_statement("select_tables", ("ks2",))
+            # Touch ks1 so ks2 becomes the least recently used
+            connection.bound_statement("select_tables", ("ks1",))
+            ks3 = connection.bound_statement("select_tables", ("ks3",))
+
+            assert list(connection._bound_statements) == [
+                ("select_tables", ("ks1",)),
+                ("select_tables", ("ks3",)),
+            ]
+            assert connection.bound_statement("select_tables", ("ks1",)) is ks1
+            assert connection.bound_statement("select_tables", ("ks3",)) is ks3
+        assert mock_prepared.bind.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_connect_caches_running_loop(self, connection):
+        """Test connect captures the running loop for reuse on the query path."""
+        with patch("ecm.cassandra_connection.Cluster") as mock_cluster_cls:
+            mock_cluster_cls.return_value.connect.return_value = Mock()
+            with patch.object(connection, "_prepare_statements", new_callable=AsyncMock):
+                await connection.connect()
+
+        assert connection._loop is asyncio.get_running_loop()
+        assert connection._executor is not None
+        # Host pools are opened eagerly during connect
+        mock_cluster_cls.return_value.connect.assert_called_once_with(
+            wait_for_all_pools=True
+        )
+
+        connection.disconnect()
+        assert connection._loop is None
+        assert connection._executor is None
+
+    @pytest.mark.asyncio
+    async def test_connections_share_cluster(self):
+        """Test connections with identical parameters share one Cluster and Session."""
+        first = CassandraConnection(contact_points=["10.9.9.9"])
+        second = CassandraConnection(contact_points=["10.9.9.9"])
+
+        with patch("ecm.cassandra_connection.Cluster") as mock_cluster_cls:
+            mock_cluster = mock_cluster_cls.return_value
+            mock_cluster.connect.side_effect = lambda **kwargs: Mock()
+            with patch.object(CassandraConnection, "_prepare_statements", new_callable=AsyncMock):
+                await first.connect()
+                await second.connect()
+
+        # One Cluster and one Session shared by both connections
+        mock_cluster_cls.assert_called_once()
+        mock_cluster.connect.assert_called_once()
+        assert first.cluster is second.cluster
+        assert first.session is second.session
+        assert first._execution_profiles is second._execution_profiles
+
+        # The shared Cluster and Session outlive the first disconnect
+        first.disconnect()
+        mock_cluster.shutdown.assert_not_called()
+        first.session.shutdown.assert_not_called()
+        second.disconnect()
+        mock_cluster.shutdown.assert_called_once()
+        second.session.shutdown.assert_called_once()
+
+    def test_cluster_key_omits_plaintext_password(self):
+        """Test the shared cluster key tells credentials apart without holding the password."""
+        connection = CassandraConnection(
+            contact_points=["10.9.9.7"], username="admin", password="s3cret"
+        )
+        same = CassandraConnection(
+            contact_points=["10.9.9.7"], username="admin", password="s3cret"
+        )
+        other = CassandraConnection(
+            contact_points=["10.9.9.7"], username="admin", password="other"
+        )
+
+        key = connection._cluster_key_for_params()
+
+        assert "s3cret" not in key
+        assert key == same._cluster_key_for_params()
+        assert key != other._cluster_key_for_params()
+
+    @pytest.mark.asyncio
+    async def test_session_executor_outlives_any_one_connection(self):
+        """Test a shared session keeps its executor until the last connection leaves."""
+        first = CassandraConnection(contact_points=["10.9.9.8"])
+        second = CassandraConnection(contact_points=["10.9.9.8"])
+
+        with patch("ecm.cassandra_connection.Cluster") as mock_cluster_cls:
+            mock_cluster_cls.return_value.connect.side_effect = lambda **kwargs: Mock()
+            with patch.object(CassandraConnection, "_prepare_statements", new_callable=AsyncMock):
+                await first.connect()
+                await second.connect()
+
+        session = first.session
+        executor = _session_executors[session]
+        assert executor not in (first._executor, second._executor)
+
+        # Either connection leaving first must not strand the other's session
+        second.disconnect()
+        assert _session_executors[session] is executor
+        await prepare_for_session(session, "SELECT * FROM system.local")
+        session.prepare.assert_called_once_with("SELECT * FROM system.local")
+
+        first.disconnect()
+        assert session not in _session_executors
+        assert executor._shutdown
+
+    @pytest.mark.asyncio
+    async def test_schema_epoch_bumps_on_metadata_refresh(self):
+        """Test the shared cluster's schema epoch moves with every schema refresh."""
+        connection = CassandraConnection(contact_points=["10.8.8.8"])
+
+        with patch("ecm.cassandra_connection.Cluster") as mock_cluster_cls:
+            mock_metadata = mock_cluster_cls.return_value.metadata
+            original_refresh = mock_metadata.refresh
+            with patch.object(CassandraConnection, "_prepare_statements", new_callable=AsyncMock):
+                await connection.connect()
+
+        epoch = connection.schema_epoch
+        # Driver thread refreshing schema after a SCHEMA_CHANGE event
+        mock_metadata.refresh(Mock(), 10, target_type="TABLE", keyspace="ks", table="t")
+
+        original_refresh.assert_called_once()
+        assert connection.schema_epoch == epoch + 1
+
+        connection.disconnect()
+        assert connection.schema_epoch == 0
+
+    @pytest.mark.asyncio
+    async def test_topology_epoch_bumps_on_host_events(self):
+        """Test the shared cluster's topology epoch moves with host state changes."""
+        connection = CassandraConnection(contact_points=["10.8.8.9"])
+
+        with patch("ecm.cassandra_connection.Cluster") as mock_cluster_cls:
+            with patch.object(CassandraConnection, "_prepare_statements", new_callable=AsyncMock):
+                await connection.connect()
+
+        listener = mock_cluster_cls.return_value.register_listener.call_args[0][0]
+        epoch = connection.topology_epoch
+        # Driver threads reporting a node restart
+        listener.on_down(Mock())
+        listener.on_up(Mock())
+
+        assert connection.topology_epoch == epoch + 2
+
+        connection.disconnect()
+        assert connection.topology_epoch == 0
+
+    @pytest.mark.asyncio
+    async def test_prepare(self, connection):
+        """Test prepare runs the driver's blocking prepare off the event loop."""
+        connection._is_connected = True
+        connection.session = Mock()
+        prepared = Mock()
+        connection.session.prepare.return_value = prepared
+
+        result = await connection.prepare("SELECT * FROM system.local")
+
+        assert result is prepared
+        connection.session.prepare.assert_called_once_with("SELECT * FROM system.local")
+
+    @pytest.mark.asyncio
+    async def test_prepare_not_connected(self, connection):
+        """Test prepare fails fast when not connected."""
+        connection._is_connected = False
+
+        with pytest.raises(CassandraQueryError):
+            await connection.prepare("SELECT * FROM system.local")
 
     def test_get_all_hosts_not_connected(self, connection):
         """Test get_all_hosts when not connected."""
@@ -144,6 +363,19 @@ class TestCassandraConnection:
         assert mock_host1 in hosts
         assert mock_host2 in hosts
 
+    def test_iter_all_hosts_returns_driver_snapshot(self, connection):
+        """Test iter_all_hosts and get_all_hosts reuse the driver's host list."""
+        connection._is_connected = True
+        connection.cluster = Mock()
+        driver_hosts = [Mock(address="192.168.1.1")]
+        connection.cluster.metadata.all_hosts.return_value = driver_hosts
+
+        assert connection.iter_all_hosts() is driver_hosts
+        assert connection.get_all_hosts() is driver_hosts
+
+        connection._is_connected = False
+        assert list(connection.iter_all_hosts()) == []
+
     def test_disconnect_not_connected(self, connection):
         """Test disconnect when not connected."""
         connection._is_connected = False
@@ -167,65 +399,234 @@ class TestCassandraConnection:
         assert not connection._is_connected
 
     @pytest.mark.asyncio
-    async def test_execute_on_host_profile_creation(self, connection):
+    async def test_execute_on_host_profile_creation(self, connection, response_future):
         """Test execution profile creation for specific host."""
         connection._is_connected = True
         connection.cluster = Mock()
         connection.session = Mock()
-        connection._execution_profiles = set()
+        connection._execution_profiles = OrderedDict()
         
         # Mock the profile manager
         connection.cluster.profile_manager.profiles = {}
         
-        # Create a mock ResponseFuture that immediately triggers success callback
-        mock_response_future = Mock()
+        # Create a mock ResponseFuture that has already completed
         mock_result = Mock()
+        connection.session.execute_async.return_value = response_future(mock_result)
         
-        def mock_add_callback(callback):
-            # Immediately call the callback with a result
-            callback(mock_result)
-        
-        mock_response_future.add_callback = mock_add_callback
-        mock_response_future.add_errback = Mock()
-        connection.session.execute_async.return_value = mock_response_future
+        result = await connection.execute_on_host("192.168.1.1", "SELECT * FROM test")
         
-        # Mock wait_for to return the result immediately
-        with patch("ecm.cassandra_connection.asyncio.wait_for") as mock_wait_for:
-            mock_wait_for.return_value = mock_result
-            
-            result = await connection.execute_on_host("192.168.1.1", "SELECT * FROM test")
-            
-            # Should have created a profile
-            assert "host_192_168_1_1" in connection._execution_profiles
-            connection.cluster.add_execution_profile.assert_called_once()
-            assert result == mock_result
+        # Should have created a profile
+        assert connection._execution_profiles["192.168.1.1"] == "host_192_168_1_1"
+        connection.cluster.add_execution_profile.assert_called_once()
+        assert result == mock_result
 
     @pytest.mark.asyncio
-    async def test_execute_on_host_existing_profile(self, connection):
+    async def test_execute_on_host_existing_profile(self, connection, response_future):
         """Test execution with existing profile."""
         connection._is_connected = True
         connection.cluster = Mock()
         connection.session = Mock()
-        connection._execution_profiles = {"host_192_168_1_1"}
+        connection._execution_profiles = OrderedDict({"192.168.1.1": "host_192_168_1_1"})
         
-        # Create a mock ResponseFuture that immediately triggers success callback
-        mock_response_future = Mock()
+        # Create a mock ResponseFuture that has already completed
         mock_result = Mock()
+        connection.session.execute_async.return_value = response_future(mock_result)
         
-        def mock_add_callback(callback):
-            # Immediately call the callback with a result
-            callback(mock_result)
+        result = await connection.execute_on_host("192.168.1.1", "SELECT * FROM test")
         
-        mock_response_future.add_callback = mock_add_callback
-        mock_response_future.add_errback = Mock()
+        # Should not create a new profile
+        connection.cluster.add_execution_profile.assert_not_called()
+        assert result == mock_result
+        connection.session.execute_async.assert_called_once_with(
+            "SELECT * FROM test", None, execution_profile="host_192_168_1_1"
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_on_host_evicts_least_recently_used_profile(self, connection, response_future):
+        """Test per-host profiles are capped and the least recently used is evicted."""
+        connection._is_connected = True
+        connection.cluster = Mock()
+        connection.cluster.profile_manager.profiles = {}
+        connection.cluster.add_execution_profile.side_effect = (
+            lambda name, profile: connection.cluster.profile_manager.profiles.__setitem__(name, profile)
+        )
+        connection.session = Mock()
+        connection.session.execute_async.return_value = response_future([])
+
+        with patch("ecm.cassandra_connection.MAX_HOST_EXECUTION_PROFILES", 2):
+            await connection.execute_on_host("10.0.0.1", "SELECT * FROM system.local")
+            await connection.execute_on_host("10.0.0.2", "SELECT * FROM system.local")
+            # Touch the first host so the second becomes least recently used
+            await connection.execute_on_host("10.0.0.1", "SELECT * FROM system.local")
+            await connection.execute_on_host("10.0.0.3", "SELECT * FROM system.local")
+
+        assert list(connection._execution_profiles.values()) == ["host_10_0_0_1", "host_10_0_0_3"]
+        assert set(connection.cluster.profile_manager.profiles) == {"host_10_0_0_1", "host_10_0_0_3"}
+
+    @pytest.mark.asyncio
+    async def test_execute_on_host_prepared_statement(self, connection, response_future):
+        """Test execute_on_host accepts prepared statements as well as raw CQL."""
+        connection._is_connected = True
+        connection.cluster = Mock()
+        connection.session = Mock()
+        mock_result = Mock()
+        connection.session.execute_async.return_value = response_future(mock_result)
+        prepared = Mock(spec=["query_string"], query_string="SELECT * FROM system.local")
+
+        result = await connection.execute_on_host("192.168.1.1", prepared, ["a"])
+
+        assert result == mock_result
+        connection.session.execute_async.assert_called_once_with(
+            prepared, ["a"], execution_profile="host_192_168_1_1"
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_async_pending_result_via_callback(self, connection, response_future):
+        """Test a pending ResponseFuture is resolved through the driver callback."""
+        connection._is_connected = True
+        connection.session = Mock()
+        mock_response_future = response_future()
+        mock_result = [Mock()]
+
+        def mock_add_callbacks(callback, errback, callback_args=(), errback_args=()):
+            # Simulate the driver IO thread delivering the rows later
+            callback(mock_result, *callback_args)
+
+        mock_response_future.add_callbacks = mock_add_callbacks
         connection.session.execute_async.return_value = mock_response_future
-        
-        # Mock wait_for to return the result immediately
-        with patch("ecm.cassandra_connection.asyncio.wait_for") as mock_wait_for:
-            mock_wait_for.return_value = mock_result
-            
-            result = await connection.execute_on_host("192.168.1.1", "SELECT * FROM test")
-            
-            # Should not create a new profile
-            connection.cluster.add_execution_profile.assert_not_called()
-            assert result == mock_result
\ No newline at end of file
+
+        result = await connection.execute_async("SELECT * FROM test")
+        assert result is mock_result
+
+    @pytest.mark.asyncio
+    async def test_callback_on_loop_thread_skips_threadsafe_wakeup(self, connection, response_future):
+        """Test callbacks delivered on the loop thread resolve the future directly."""
+        connection._loop = Mock(wraps=asyncio.get_running_loop())
+        connection._loop_thread_id = threading.get_ident()
+        mock_response_future = response_future()
+        mock_result = [Mock()]
+
+        def mock_add_callbacks(callback, errback, callback_args=(), errback_args=()):
+            callback(mock_result, *callback_args)
+
+        mock_response_future.add_callbacks = mock_add_callbacks
+
+        future = connection._wrap_response_future(mock_response_future)
+
+        assert future.done()
+        assert future.result() is mock_result
+        connection._loop.call_soon_threadsafe.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_async_pending_error_via_errback(self, connection, response_future):
+        """Test a failing pending ResponseFuture surfaces as CassandraQueryError."""
+        connection._is_connected = True
+        connection.session = Mock()
+        mock_response_future = response_future()
+
+        def mock_add_callbacks(callback, errback, callback_args=(), errback_args=()):
+            errback(Exception("Read timeout"), *errback_args)
+
+        mock_response_future.add_callbacks = mock_add_callbacks
+        connection.session.execute_async.return_value = mock_response_future
+
+        with pytest.raises(CassandraQueryError) as exc_info:
+            await connection.execute_async("SELECT * FROM test")
+        assert "Read timeout" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_execute_paged_fetches_all_pages(self, connection, response_future):
+        """Test execute_paged yields rows from every page via the driver callbacks."""
+        connection._is_connected = True
+        connection.session = Mock()
+        mock_response_future = response_future(["row1", "row2"], ["row3"])
+        connection.session.execute_async.return_value = mock_response_future
+
+        rows = [row async for row in connection.execute_paged("SELECT * FROM test")]
+
+        assert rows == ["row1", "row2", "row3"]
+        mock_response_future.clear_callbacks.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_await_all_pages_collects_every_page(self, response_future):
+        """Test await_all_pages gathers rows from every page of a bare ResponseFuture."""
+        pages = [["row1", "row2"], ["row3"]]
+        mock_response_future = response_future(*pages)
+
+        rows = await await_all_pages(mock_response_future)
+
+        assert rows == ["row1", "row2", "row3"]
+        assert pages[0] == ["row1", "row2"]  # first page is not mutated
+        mock_response_future.clear_callbacks.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_prepare_for_session_caches_per_session_and_query(self):
+        """Test prepare_for_session prepares each query once per session on its executor."""
+        session = Mock()
+        session.prepare.side_effect = lambda query: Mock(query_string=query)
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cassandra-blocking")
+        _session_executors[session] = executor
+        try:
+            with patch.object(executor, "submit", wraps=executor.submit) as mock_submit:
+                first = await prepare_for_session(session, "SELECT a FROM t")
+                again = await prepare_for_session(session, "SELECT a FROM t")
+                other = await prepare_for_session(session, "SELECT b FROM t")
+        finally:
+            executor.shutdown()
+
+        assert first is again
+        assert other.query_string == "SELECT b FROM t"
+        assert session.prepare.call_count == 2
+        assert mock_submit.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_paged_not_connected(self, connection):
+        """Test execute_paged when not connected."""
+        connection._is_connected = False
+
+        with pytest.raises(CassandraQueryError):
+            async for _ in connection.execute_paged("SELECT * FROM test"):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_execute_concurrent_materializes_rows(self, connection):
+        """Test execute_concurrent returns row lists in parameter order."""
+        connection._is_connected = True
+        connection.session = Mock()
+        results = [(True, iter(["a", "b"])), (True, iter([]))]
+
+        with patch(
+            "ecm.cassandra_connection.execute_concurrent_with_args", return_value=results
+        ) as mock_execute_concurrent:
+            rows = await connection.execute_concurrent("SELECT", [("ks1",), ("ks2",)])
+
+        assert rows == [["a", "b"], []]
+        mock_execute_concurrent.assert_called_once_with(
+            connection.session, "SELECT", [("ks1",), ("ks2",)], concurrency=64
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_concurrent_error(self, connection):
+        """Test execute_concurrent wraps driver failures in CassandraQueryError."""
+        connection._is_connected = True
+        connection.session = Mock()
+
+        with patch(
+            "ecm.cassandra_connection.execute_concurrent_with_args",
+            side_effect=Exception("Unavailable"),
+        ):
+            with pytest.raises(CassandraQueryError, match="Unavailable"):
+                await connection.execute_concurrent("SELECT", [("ks1",)])
+
+    @pytest.mark.asyncio
+    async def test_execute_async_already_failed(self, connection, response_future):
+        """Test an already-failed ResponseFuture raises without registering callbacks."""
+        connection._is_connected = True
+        connection.session = Mock()
+        mock_response_future = response_future(final_exception=Exception("Unavailable"))
+        connection.session.execute_async.return_value = mock_response_future
+
+        with pytest.raises(CassandraQueryError) as exc_info:
+            await connection.execute_async("SELECT * FROM test")
+        assert "Unavailable" in str(exc_info.value)
+        mock_response_future.add_callbacks.assert_not_called()
\ No newline at end of file
@@ -4,12 +4,33 @@ This module contains unit tests for the CassandraService class,
 focusing on async operations and proper mocking of database connections.
 """
 
-from unittest.mock import AsyncMock, Mock
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from cassandra.metadata import ReplicationStrategy
 
 from ecm.cassandra_connection import CassandraConnection
 from ecm.cassandra_service import CassandraService
+from ecm.constants import MAX_CONCURRENT_QUERIES, MAX_DISPLAY_ROWS
+from ecm.exceptions import CassandraMetadataError
+
+
+def _paged_rows(rows):
+    """Build a Mock for CassandraConnection.execute_paged yielding the given rows."""
+
+    async def _generator(*args, **kwargs):
+        for row in rows:
+            yield row
+
+    return Mock(side_effect=_generator)
+
+
+def _keyspace_metadata(replication, durable_writes=True):
+    """Build a Mock KeyspaceMetadata with a driver strategy for the given options."""
+    options = {k: v for k, v in replication.items() if k != 'class'}
+    strategy = ReplicationStrategy.create(replication['class'], options)
+    return Mock(replication_strategy=strategy, durable_writes=durable_writes)
 
 
 class TestCassandraServiceUnit:
@@ -27,15 +48,15 @@ class TestCassandraServiceUnit:
         """Test get_keyspaces including system keyspaces."""
         # Create mock connection
         mock_connection = Mock(spec=CassandraConnection)
-        mock_connection.prepared_statements = {"select_keyspaces": Mock()}
+        mock_connection.cluster = Mock()
+        mock_connection.execute_async = AsyncMock()
         
-        # Mock keyspaces result
-        mock_result = [
-            Mock(keyspace_name="system", replication={'class': 'LocalStrategy'}, durable_writes=True),
-            Mock(keyspace_name="system_schema", replication={'class': 'LocalStrategy'}, durable_writes=True),
-            Mock(keyspace_name="my_app", replication={'class': 'SimpleStrategy', 'replication_factor': '3'}, durable_writes=True),
-        ]
-        mock_connection.execute_async = AsyncMock(return_value=mock_result)
+        # Mock keyspace metadata
+        mock_connection.cluster.metadata.keyspaces = {
+            "system": _keyspace_metadata({'class': 'LocalStrategy'}),
+            "system_schema": _keyspace_metadata({'class': 'LocalStrategy'}),
+            "my_app": _keyspace_metadata({'class': 'SimpleStrategy', 'replication_factor': '3'}),
+        }
         
         # Create service and test
         service = CassandraService(mock_connection)
@@ -49,22 +70,28 @@ class TestCassandraServiceUnit:
         # Check my_app keyspace has correct replication
         my_app = next(ks for ks in keyspaces if ks['name'] == 'my_app')
         assert my_app['replication']['replication_factor'] == '3'
+        # Class names are fully qualified, as in system_schema.keyspaces
+        assert my_app['replication']['class'] == 'org.apache.cassandra.locator.SimpleStrategy'
+        
+        # Metadata is already in memory, so no query is issued
+        mock_connection.execute_async.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_get_keyspaces_without_system(self):
         """Test get_keyspaces excluding system keyspaces."""
         # Create mock connection
         mock_connection = Mock(spec=CassandraConnection)
-        mock_connection.prepared_statements = {"select_keyspaces": Mock()}
-        
-        # Mock keyspaces result
-        mock_result = [
-            Mock(keyspace_name="system", replication={'class': 'LocalStrategy'}, durable_writes=True),
-            Mock(keyspace_name="system_schema", replication={'class': 'LocalStrategy'}, durable_writes=True),
-            Mock(keyspace_name="my_app", replication={'class': 'SimpleStrategy', 'replication_factor': '3'}, durable_writes=True),
-            Mock(keyspace_name="another_app", replication={'class': 'NetworkTopologyStrategy', 'dc1': '3', 'dc2': '2'}, durable_writes=False),
-        ]
-        mock_connection.execute_async = AsyncMock(return_value=mock_result)
+        mock_connection.cluster = Mock()
+        
+        # Mock keyspace metadata
+        mock_connection.cluster.metadata.keyspaces = {
+            "system": _keyspace_metadata({'class': 'LocalStrategy'}),
+            "system_schema": _keyspace_metadata({'class': 'LocalStrategy'}),
+            "my_app": _keyspace_metadata({'class': 'SimpleStrategy', 'replication_factor': '3'}),
+            "another_app": _keyspace_metadata(
+                {'class': 'NetworkTopologyStrategy', 'dc1': '3', 'dc2': '2'}, durable_writes=False
+            ),
+        }
         
         # Create service and test
         service = CassandraService(mock_connection)
@@ -76,23 +103,25 @@ class TestCassandraServiceUnit:
         assert any(ks['name'] == 'my_app' for ks in keyspaces)
         assert any(ks['name'] == 'another_app' for ks in keyspaces)
         
-        # Check another_app has durable_writes=False
+        # Check another_app has durable_writes=False and its DC factors
         another_app = next(ks for ks in keyspaces if ks['name'] == 'another_app')
         assert another_app['durable_writes'] == False
+        assert another_app['replication'] == {
+            'class': 'org.apache.cassandra.locator.NetworkTopologyStrategy', 'dc1': '3', 'dc2': '2'
+        }
     
     @pytest.mark.asyncio
     async def test_get_keyspaces_empty(self):
         """Test get_keyspaces with no user keyspaces."""
         # Create mock connection
         mock_connection = Mock(spec=CassandraConnection)
-        mock_connection.prepared_statements = {"select_keyspaces": Mock()}
+        mock_connection.cluster = Mock()
         
-        # Mock only system keyspaces
-        mock_result = [
-            Mock(keyspace_name="system", replication={'class': 'LocalStrategy'}, durable_writes=True),
-            Mock(keyspace_name="system_schema", replication={'class': 'LocalStrategy'}, durable_writes=True),
-        ]
-        mock_connection.execute_async = AsyncMock(return_value=mock_result)
+        # Mock only system keyspaces; virtual keyspaces have no strategy
+        mock_connection.cluster.metadata.keyspaces = {
+            "system": _keyspace_metadata({'class': 'LocalStrategy'}),
+            "system_views": Mock(replication_strategy=None, durable_writes=True),
+        }
         
         # Create service and test
         service = CassandraService(mock_connection)
@@ -100,7 +129,49 @@ class TestCassandraServiceUnit:
         
         # Verify no user keyspaces returned
         assert len(keyspaces) == 0
-    
+
+    @pytest.mark.asyncio
+    async def test_get_keyspaces_virtual_keyspace(self):
+        """Test get_keyspaces reports empty replication for virtual keyspaces."""
+        mock_connection = Mock(spec=CassandraConnection)
+        mock_connection.cluster = Mock()
+        mock_connection.cluster.metadata.keyspaces = {
+            "system_views": Mock(replication_strategy=None, durable_writes=True),
+        }
+
+        service = CassandraService(mock_connection)
+        keyspaces = await service.get_keyspaces(include_system=True)
+
+        assert keyspaces == [{'name': 'system_views', 'replication': {}, 'durable_writes': True}]
+
+    @pytest.mark.asyncio
+    async def test_get_keyspaces_unknown_strategy(self):
+        """Test get_keyspaces passes through options of strategies the driver doesn't model."""
+        mock_connection = Mock(spec=CassandraConnection)
+        mock_connection.cluster = Mock()
+        mock_connection.cluster.metadata.keyspaces = {
+            "custom": _keyspace_metadata({'class': 'com.example.CustomStrategy', 'dc1': '2'}),
+            "everywhere": _keyspace_metadata(
+                {'class': 'org.apache.cassandra.locator.EverywhereStrategy'}
+            ),
+        }
+
+        service = CassandraService(mock_connection)
+        keyspaces = await service.get_keyspaces(include_system=False)
+
+        assert keyspaces == [
+            {
+                'name': 'custom',
+                'replication': {'class': 'com.example.CustomStrategy', 'dc1': '2'},
+                'durable_writes': True,
+            },
+            {
+                'name': 'everywhere',
+                'replication': {'class': 'org.apache.cassandra.locator.EverywhereStrategy'},
+                'durable_writes': True,
+            },
+        ]
+
     @pytest.mark.asyncio
     async def test_get_tables_with_mock(self):
         """Test get_tables with mocked connection."""
@@ -108,13 +179,13 @@ class TestCassandraServiceUnit:
         mock_connection = Mock(spec=CassandraConnection)
         mock_connection.prepared_statements = {"select_tables": Mock()}
 
-        # Mock the execute_async result
+        # Mock the execute_paged rows
         mock_result = [
             Mock(table_name="table1"),
             Mock(table_name="table2"),
             Mock(table_name="table3"),
         ]
-        mock_connection.execute_async = AsyncMock(return_value=mock_result)
+        mock_connection.execute_paged = _paged_rows(mock_result)
 
         # Create service and test
         service = CassandraService(mock_connection)
@@ -126,9 +197,12 @@ class TestCassandraServiceUnit:
         assert "table2" in tables
         assert "table3" in tables
 
-        # Verify the prepared statement was used
-        mock_connection.execute_async.assert_called_once_with(
-            mock_connection.prepared_statements["select_tables"], ["test_keyspace"]
+        # Verify the prepared statement was bound and executed
+        mock_connection.bound_statement.assert_called_once_with(
+            "select_tables", ("test_keyspace",)
+        )
+        mock_connection.execute_paged.assert_called_once_with(
+            mock_connection.bound_statement.return_value
         )
 
     @pytest.mark.asyncio
@@ -139,7 +213,7 @@ class TestCassandraServiceUnit:
         mock_connection.prepared_statements = {"select_tables": Mock()}
 
         # Mock empty result
-        mock_connection.execute_async = AsyncMock(return_value=[])
+        mock_connection.execute_paged = _paged_rows([])
 
         # Create service and test
         service = CassandraService(mock_connection)
@@ -147,6 +221,126 @@ class TestCassandraServiceUnit:
 
         assert tables == []
 
+    @pytest.mark.asyncio
+    async def test_get_tables_cached_until_schema_change(self):
+        """Test get_tables serves repeat calls from cache until the schema epoch moves."""
+        mock_connection = Mock(spec=CassandraConnection)
+        mock_connection.schema_epoch = 1
+        mock_connection.execute_paged = _paged_rows([Mock(table_name="users")])
+
+        service = CassandraService(mock_connection)
+        assert await service.get_tables("app") == ["users"]
+        assert await service.get_tables("app") == ["users"]
+        assert mock_connection.execute_paged.call_count == 1
+
+        # A schema refresh invalidates the cached entry
+        mock_connection.schema_epoch = 2
+        assert await service.get_tables("app") == ["users"]
+        assert mock_connection.execute_paged.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_tables_coalesces_concurrent_calls(self):
+        """Test concurrent get_tables calls for one keyspace share a single query."""
+        mock_connection = Mock(spec=CassandraConnection)
+        mock_connection.schema_epoch = 1
+        mock_connection.execute_paged = _paged_rows([Mock(table_name="users")])
+
+        service = CassandraService(mock_connection)
+        first, second = await asyncio.gather(
+            service.get_tables("app"), service.get_tables("app")
+        )
+
+        assert first == second == ["users"]
+        assert first is not second
+        assert mock_connection.execute_paged.call_count == 1
+        assert service._tables_inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_get_tables_does_not_join_fetch_from_older_epoch(self):
+        """Test a caller that saw a schema change doesn't get an in-flight pre-change result."""
+        mock_connection = Mock(spec=CassandraConnection)
+        mock_connection.schema_epoch = 1
+        release_old = asyncio.Event()
+
+        async def rows(names, gate=None):
+            if gate is not None:
+                await gate.wait()
+            for name in names:
+                yield Mock(table_name=name)
+
+        # The schema as of the epoch current when each query is sent
+        mock_connection.execute_paged = Mock(
+            side_effect=lambda statement: (
+                rows(["users"], release_old)
+                if mock_connection.schema_epoch == 1
+                else rows(["users", "orders"])
+            )
+        )
+
+        service = CassandraService(mock_connection)
+        old = asyncio.ensure_future(service.get_tables("app"))
+        while not mock_connection.execute_paged.called:
+            await asyncio.sleep(0)
+
+        # e.g. right after a CREATE TABLE
+        mock_connection.schema_epoch = 2
+        # Joining the pre-change fetch would block on it; fail instead of hanging
+        fresh = await asyncio.wait_for(service.get_tables("app"), timeout=1)
+        assert fresh == ["users", "orders"]
+
+        release_old.set()
+        assert await old == ["users"]
+        assert mock_connection.execute_paged.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_create_table_from_metadata(self):
+        """Test get_create_table reads the driver's schema metadata without querying."""
+        mock_connection = Mock(spec=CassandraConnection)
+        mock_connection.cluster = Mock()
+        mock_table = Mock()
+        mock_table.export_as_string.return_value = "CREATE TABLE ks.t (id int PRIMARY KEY)"
+        mock_connection.cluster.metadata.keyspaces = {"ks": Mock(tables={"t": mock_table})}
+        mock_connection.execute_async = AsyncMock()
+
+        service = CassandraService(mock_connection)
+        create_statement = await service.get_create_table("ks", "t")
+
+        assert create_statement == "CREATE TABLE ks.t (id int PRIMARY KEY)"
+        mock_connection.execute_async.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_create_table_cached_until_schema_change(self):
+        """Test the rendered CREATE TABLE is reused until the schema epoch moves."""
+        mock_connection = Mock(spec=CassandraConnection)
+        mock_connection.schema_epoch = 1
+        mock_connection.cluster = Mock()
+        mock_table = Mock()
+        mock_table.export_as_string.return_value = "CREATE TABLE ks.t (id int PRIMARY KEY)"
+        mock_connection.cluster.metadata.keyspaces = {"ks": Mock(tables={"t": mock_table})}
+
+        service = CassandraService(mock_connection)
+        await service.get_create_table("ks", "t")
+        await service.get_create_table("ks", "t")
+        assert mock_table.export_as_string.call_count == 1
+
+        # A schema refresh invalidates the cached statement
+        mock_connection.schema_epoch = 2
+        await service.get_create_table("ks", "t")
+        assert mock_table.export_as_string.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_create_table_not_found(self):
+        """Test get_create_table raises for unknown keyspaces and tables."""
+        mock_connection = Mock(spec=CassandraConnection)
+        mock_connection.cluster = Mock()
+        mock_connection.cluster.metadata.keyspaces = {"ks": Mock(tables={})}
+
+        service = CassandraService(mock_connection)
+        with pytest.raises(CassandraMetadataError, match="Keyspace missing not found"):
+            await service.get_create_table("missing", "t")
+        with pytest.raises(CassandraMetadataError, match="Table ks.t not found"):
+            await service.get_create_table("ks", "t")
+
     @pytest.mark.asyncio
     async def test_execute_query_with_parameters(self):
         """Test execute_query passes parameters correctly."""
@@ -180,6 +374,266 @@ class TestCassandraServiceUnit:
         # Verify call
         mock_connection.execute_async.assert_called_once_with(query, None)
     
+    @pytest.mark.asyncio
+    async def test_execute_on_all_nodes_bounded_concurrency(self):
+        """Test a slow node holds one slot without stalling the other hosts."""
+        mock_connection = Mock(spec=CassandraConnection)
+        hosts = [Mock(address=f"10.0.0.{i}") for i in range(MAX_CONCURRENT_QUERIES + 5)]
+        mock_connection.get_all_hosts.return_value = hosts
+
+        slow_node = asyncio.Event()
+        in_flight = 0
+        peak = 0
+        completed = []
+
+        async def execute_on_host(host_address, query, parameters=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            if host_address == "10.0.0.0":
+                await slow_node.wait()
+            else:
+                await asyncio.sleep(0)
+            in_flight -= 1
+            completed.append(host_address)
+            if len(completed) == len(hosts) - 1:
+                slow_node.set()
+            return [Mock(value=host_address)]
+
+        mock_connection.execute_on_host = AsyncMock(side_effect=execute_on_host)
+
+        service = CassandraService(mock_connection)
+        results = await service.execute_on_all_nodes("SELECT * FROM system.local")
+
+        assert set(results) == {host.address for host in hosts}
+        assert peak == MAX_CONCURRENT_QUERIES
+        # Every other host finished while the slow node held its slot
+        assert completed[-1] == "10.0.0.0"
+
+    @pytest.mark.asyncio
+    async def test_execute_on_all_nodes_iter_yields_in_completion_order(self):
+        """Test fast nodes are yielded first and min_responses cancels the rest."""
+        mock_connection = Mock(spec=CassandraConnection)
+        hosts = [Mock(address="10.0.0.1"), Mock(address="10.0.0.2"), Mock(address="10.0.0.3")]
+        mock_connection.get_all_hosts.return_value = hosts
+        cancelled = []
+
+        async def execute_on_host(host_address, query, parameters=None):
+            if host_address == "10.0.0.1":
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.append(host_address)
+                    raise
+            return [host_address]
+
+        mock_connection.execute_on_host = AsyncMock(side_effect=execute_on_host)
+
+        service = CassandraService(mock_connection)
+        received = [
+            item
+            async for item in service.execute_on_all_nodes_iter(
+                "SELECT * FROM system.local", min_responses=2
+            )
+        ]
+        # Let the cancelled task unwind
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert received == [("10.0.0.2", ["10.0.0.2"]), ("10.0.0.3", ["10.0.0.3"])]
+        assert cancelled == ["10.0.0.1"]
+
+    @pytest.mark.asyncio
+    async def test_execute_on_all_nodes_iter_times_out_slow_node(self):
+        """Test a node that never answers is reported as a timeout error."""
+        mock_connection = Mock(spec=CassandraConnection)
+        mock_connection.get_all_hosts.return_value = [Mock(address="10.0.0.1")]
+
+        async def never_answers(host_address, query, parameters=None):
+            await asyncio.Event().wait()
+
+        mock_connection.execute_on_host = AsyncMock(side_effect=never_answers)
+
+        service = CassandraService(mock_connection)
+        received = [
+            item
+            async for item in service.execute_on_all_nodes_iter(
+                "SELECT * FROM system.local", timeout=0.01
+            )
+        ]
+
+        assert received == [("10.0.0.1", {"error": "Timed out after 0.01 seconds"})]
+
+    @pytest.mark.asyncio
+    async def test_single_node_queries_skip_task_scheduling(self):
+        """Test a single host is queried inline without gather or tasks."""
+        mock_connection = Mock(spec=CassandraConnection)
+        mock_connection.get_all_hosts.return_value = [Mock(address="10.0.0.1")]
+        mock_connection.prepare = AsyncMock(return_value=Mock())
+        mock_connection.execute_on_host = AsyncMock(return_value=["row"])
+
+        service = CassandraService(mock_connection)
+        with patch("ecm.cassandra_service.asyncio.gather") as mock_gather, patch(
+            "ecm.cassandra_service.asyncio.ensure_future"
+        ) as mock_ensure_future:
+            all_nodes = await service.execute_on_all_nodes("SELECT * FROM system.local")
+            system_table = await service.query_system_table_on_nodes("system", "local")
+
+        assert all_nodes == {"10.0.0.1": ["row"]}
+        assert system_table == {"10.0.0.1": ["row"]}
+        mock_gather.assert_not_called()
+        mock_ensure_future.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_on_all_nodes_keys_results_in_host_order(self):
+        """Test results follow cluster host order even when later nodes answer first."""
+        mock_connection = Mock(spec=CassandraConnection)
+        hosts = [Mock(address="10.0.0.1"), Mock(address="10.0.0.2"), Mock(address="10.0.0.3")]
+        mock_connection.get_all_hosts.return_value = hosts
+
+        async def execute_on_host(host_address, query, parameters=None):
+            if host_address == "10.0.0.1":
+                await asyncio.sleep(0.01)
+            return [host_address]
+
+        mock_connection.execute_on_host = AsyncMock(side_effect=execute_on_host)
+
+        service = CassandraService(mock_connection)
+        results = await service.execute_on_all_nodes("SELECT * FROM system.local")
+
+        assert list(results) == ["10.0.0.1", "10.0.0.2", "10.0.0.3"]
+
+    @pytest.mark.asyncio
+    async def test_execute_on_all_nodes_passes_row_lists_through(self):
+        """Test row lists from the driver are returned without being copied."""
+        mock_connection = Mock(spec=CassandraConnection)
+        mock_connection.get_all_hosts.return_value = [Mock(address="10.0.0.1")]
+        rows = [Mock(), Mock()]
+        mock_connection.execute_on_host = AsyncMock(return_value=rows)
+
+        service = CassandraService(mock_connection)
+        results = await service.execute_on_all_nodes("SELECT * FROM system.peers")
+
+        assert results["10.0.0.1"] is rows
+
+    @pytest.mark.asyncio
+    async def test_query_system_table_on_nodes_prepare_failure_reported_per_node(self):
+        """Test a failed prepare becomes an error entry for every requested node."""
+        mock_connection = Mock(spec=CassandraConnection)
+        mock_connection.get_all_hosts.return_value = [
+            Mock(address="10.0.0.1"),
+            Mock(address="10.0.0.2"),
+        ]
+        mock_connection.prepare = AsyncMock(side_effect=Exception("unconfigured table"))
+
+        service = CassandraService(mock_connection)
+        results = await service.query_system_table_on_nodes("system_views", "missing")
+
+        assert results == {
+            "10.0.0.1": {"error": "unconfigured table"},
+            "10.0.0.2": {"error": "unconfigured table"},
+        }
+        mock_connection.execute_on_host.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_query_system_table_on_nodes_no_hosts_skips_prepare(self):
+        """Test no hosts returns an empty result without preparing the query."""
+        mock_connection = Mock(spec=CassandraConnection)
+        mock_connection.get_all_hosts.return_value = []
+        mock_connection.prepare = AsyncMock()
+
+        service = CassandraService(mock_connection)
+        results = await service.query_system_table_on_nodes("system", "local")
+
+        assert results == {}
+        mock_connection.prepare.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_query_system_table_on_nodes_reuses_prepared_statement(self):
+        """Test the system table SELECT is prepared once and sent to every node."""
+        mock_connection = Mock(spec=CassandraConnection)
+        hosts = [Mock(address="10.0.0.1"), Mock(address="10.0.0.2")]
+        mock_connection.get_all_hosts.return_value = hosts
+        prepared = Mock()
+        mock_connection.prepare = AsyncMock(return_value=prepared)
+        mock_connection.execute_on_host = AsyncMock(return_value=[Mock()])
+
+        service = CassandraService(mock_connection)
+        await service.query_system_table_on_nodes("system", "local")
+        results = await service.query_system_table_on_nodes("system", "local")
+
+        mock_connection.prepare.assert_called_once_with(
+            f"SELECT * FROM system.local LIMIT {MAX_DISPLAY_ROWS + 1}"
+        )
+        assert set(results) == {"10.0.0.1", "10.0.0.2"}
+        for call in mock_connection.execute_on_host.call_args_list:
+            assert call.args[1] is prepared
+        assert prepared.fetch_size == MAX_DISPLAY_ROWS + 1
+
+    @pytest.mark.asyncio
+    async def test_query_system_table_on_nodes_stops_after_limit(self):
+        """Test rows past the display limit are not pulled from the result."""
+        mock_connection = Mock(spec=CassandraConnection)
+        mock_connection.get_all_hosts.return_value = [Mock(address="10.0.0.1")]
+        mock_connection.prepare = AsyncMock(return_value=Mock())
+        rows = iter(range(100))
+        mock_connection.execute_on_host = AsyncMock(return_value=rows)
+
+        service = CassandraService(mock_connection)
+        results = await service.query_system_table_on_nodes("system_views", "settings")
+
+        assert results["10.0.0.1"] == list(range(MAX_DISPLAY_ROWS + 1))
+        assert next(rows) == MAX_DISPLAY_ROWS + 1
+
+    @pytest.mark.asyncio
+    async def test_query_system_table_on_nodes_filters_requested_nodes(self):
+        """Test only the requested node addresses are queried."""
+        mock_connection = Mock(spec=CassandraConnection)
+        hosts = [Mock(address=f"10.0.0.{i}") for i in range(1, 6)]
+        mock_connection.iter_all_hosts.return_value = hosts
+        mock_connection.prepare = AsyncMock(return_value=Mock())
+        mock_connection.execute_on_host = AsyncMock(return_value=[Mock()])
+
+        service = CassandraService(mock_connection)
+        results = await service.query_system_table_on_nodes(
+            "system", "local", ["10.0.0.2", "10.0.0.4", "10.9.9.9"]
+        )
+
+        assert set(results) == {"10.0.0.2", "10.0.0.4"}
+        mock_connection.get_all_hosts.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_query_system_table_on_nodes_rejects_keyspace_before_prepare(self):
+        """Test invalid keyspaces are rejected without preparing anything."""
+        mock_connection = Mock(spec=CassandraConnection)
+        mock_connection.prepare = AsyncMock()
+
+        service = CassandraService(mock_connection)
+        with pytest.raises(ValueError):
+            await service.query_system_table_on_nodes("my_app", "users")
+
+        mock_connection.prepare.assert_not_called()
+        assert service._prepared_system_queries == {}
+
+    @pytest.mark.asyncio
+    async def test_execute_query_stream(self):
+        """Test execute_query_stream yields rows from the paged connection API."""
+        mock_connection = Mock(spec=CassandraConnection)
+        mock_connection.execute_paged = _paged_rows(["row1", "row2"])
+
+        service = CassandraService(mock_connection)
+        rows = [
+            row
+            async for row in service.execute_query_stream(
+                "SELECT * FROM test WHERE id = ?", (1,)
+            )
+        ]
+
+        assert rows == ["row1", "row2"]
+        mock_connection.execute_paged.assert_called_once_with(
+            "SELECT * FROM test WHERE id = ?", (1,)
+        )
+
     def test_format_node_results_empty(self):
         """Test formatting empty node results."""
         service = CassandraService(Mock())
@@ -221,6 +675,16 @@ class TestCassandraServiceUnit:
         assert "Error: Connection timeout" in formatted
         assert "{'data': 'ok'}" in formatted
     
+    def test_format_node_results_caps_rows(self):
+        """Test node results beyond MAX_DISPLAY_ROWS are summarized."""
+        service = CassandraService(Mock())
+        results = {"192.168.1.1": [{"id": i} for i in range(MAX_DISPLAY_ROWS + 5)]}
+
+        formatted = service.format_node_results(results)
+        assert f"{{'id': {MAX_DISPLAY_ROWS - 1}}}" in formatted
+        assert f"{{'id': {MAX_DISPLAY_ROWS}}}" not in formatted
+        assert "... and 5 more rows" in formatted
+
     def test_format_system_table_results(self):
         """Test formatting system table results with row limiting."""
         service = CassandraService(Mock())
@@ -235,9 +699,18 @@ class TestCassandraServiceUnit:
         formatted = service.format_system_table_results(results, "system", "local")
         assert "=== Query: SELECT * FROM system.local ===" in formatted
         assert "--- Node: 192.168.1.1 ---" in formatted
-        assert "Returned 15 rows" in formatted
-        assert "... and 5 more rows" in formatted  # MAX_DISPLAY_ROWS is 10
+        assert "Returned more than 10 rows" in formatted  # MAX_DISPLAY_ROWS is 10
+        assert "{'id': 9}" in formatted
+        assert "{'id': 10}" not in formatted
+        assert "... more rows not shown" in formatted
         assert "--- Node: 192.168.1.2 ---" in formatted
+
+        # Results that fit are shown in full with their exact count
+        formatted = service.format_system_table_results(
+            {"192.168.1.1": many_rows[:3]}, "system", "local"
+        )
+        assert "Returned 3 rows" in formatted
+        assert "not shown" not in formatted
     
     def test_format_single_node_results(self):
         """Test formatting single node results."""
@@ -258,6 +731,13 @@ class TestCassandraServiceUnit:
         formatted = service.format_single_node_results([], "192.168.1.1")
         assert "=== Results from node 192.168.1.1 ===" in formatted
         assert "No results" in formatted
+
+        # Large results are capped without draining the iterator
+        rows = iter([{"id": i} for i in range(MAX_DISPLAY_ROWS + 5)])
+        formatted = service.format_single_node_results(rows, "192.168.1.1")
+        assert f"{{'id': {MAX_DISPLAY_ROWS}}}" not in formatted
+        assert "... more rows not shown" in formatted
+        assert len(list(rows)) == 4
     
     @pytest.mark.asyncio
     async def test_get_cassandra_version(self):
@@ -291,6 +771,71 @@ class TestCassandraServiceUnit:
         version = await service.get_cassandra_version()
         assert version == (5, 0, 0)
     
+    @pytest.mark.asyncio
+    async def test_get_cassandra_version_from_control_host(self):
+        """Test the version known to the driver is used without querying."""
+        service = CassandraService(Mock())
+        control_host = Mock(release_version="4.1.3")
+        service.connection.cluster.control_connection.get_control_connection_host.return_value = (
+            control_host
+        )
+        service.connection.execute_async = AsyncMock()
+
+        version = await service.get_cassandra_version()
+
+        assert version == (4, 1, 3)
+        service.connection.execute_async.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_cassandra_version_uses_prepared_statement(self):
+        """Test the system.local fallback runs the prepared version query."""
+        service = CassandraService(Mock())
+        service.connection.cluster = None
+        prepared = Mock()
+        service.connection.prepared_statements = {"select_release_version": prepared}
+        service.connection.execute_async = AsyncMock(
+            return_value=[Mock(release_version="5.0.2")]
+        )
+
+        assert await service.get_cassandra_version() == (5, 0, 2)
+        service.connection.execute_async.assert_called_once_with(prepared)
+
+    @pytest.mark.asyncio
+    async def test_get_cassandra_version_refreshed_after_topology_change(self):
+        """Test the cached version is re-read once a host goes down or up."""
+        service = CassandraService(Mock())
+        service.connection.topology_epoch = 1
+        service._control_host_release_version = Mock(return_value="4.1.3")
+
+        assert await service.get_cassandra_version() == (4, 1, 3)
+        assert await service.get_cassandra_version() == (4, 1, 3)
+        service._control_host_release_version.assert_called_once()
+
+        # Rolling upgrade: the node restarts on the new version
+        service.connection.topology_epoch = 2
+        service._control_host_release_version.return_value = "5.0.2"
+
+        assert await service.get_cassandra_version() == (5, 0, 2)
+
+    @pytest.mark.asyncio
+    async def test_discover_system_tables_refreshed_after_schema_change(self):
+        """Test discovered system tables are cached until the schema epoch moves."""
+        service = CassandraService(Mock())
+        service.connection.schema_epoch = 1
+        service.get_cassandra_version = AsyncMock(return_value=(3, 11, 0))
+        service.get_tables = AsyncMock(return_value=["local"])
+
+        await service.discover_system_tables()
+        await service.discover_system_tables()
+        assert service.get_cassandra_version.await_count == 1
+
+        service.connection.schema_epoch = 2
+        service.get_tables = AsyncMock(return_value=["local", "peers_v2"])
+
+        discovered = await service.discover_system_tables()
+
+        assert discovered == {"system": ["local", "peers_v2"]}
+
     @pytest.mark.asyncio
     async def test_discover_system_tables_cassandra_4(self):
         """Test discovering system tables for Cassandra 4.x."""
@@ -334,9 +879,38 @@ class TestCassandraServiceUnit:
         assert "system_views" not in discovered
         assert "local" in discovered["system"]
         
-        # Verify get_tables was only called for system keyspace
-        service.get_tables.assert_called_once_with("system")
+        # system_views is looked up concurrently but dropped for 3.x
+        service.get_tables.assert_any_call("system")
     
+    @pytest.mark.asyncio
+    async def test_discover_system_tables_runs_lookups_concurrently(self):
+        """Test table and version lookups are in flight at the same time."""
+        service = CassandraService(Mock())
+        started = []
+        release = asyncio.Event()
+
+        async def get_tables(keyspace):
+            started.append(keyspace)
+            await release.wait()
+            if keyspace == "system_views":
+                raise Exception("keyspace missing")
+            return ["local"]
+
+        async def get_cassandra_version():
+            started.append("version")
+            # The table lookups can only finish once the version lookup has
+            # started, so sequential awaits would never complete
+            release.set()
+            return (4, 0, 11)
+
+        service.get_tables = get_tables
+        service.get_cassandra_version = get_cassandra_version
+
+        discovered = await asyncio.wait_for(service.discover_system_tables(), timeout=1)
+
+        assert sorted(started) == ["system", "system_views", "version"]
+        assert discovered == {"system": ["local"], "system_views": []}
+
     def test_generate_system_table_description(self):
         """Test generating dynamic description for system tables."""
         service = CassandraService(Mock())
@@ -361,6 +935,21 @@ class TestCassandraServiceUnit:
         # Check that unknown_table is included (but not schema tables)
         assert "unknown_table" in description
     
+    def test_generate_system_table_description_memoized(self):
+        """Test the same discovered tables reuse the rendered description."""
+        service = CassandraService(Mock())
+
+        first = service.generate_system_table_description(
+            {"system": ["peers", "local", "paxos"], "system_views": ["caches"]}
+        )
+        second = service.generate_system_table_description(
+            {"system": ["local", "paxos", "peers"], "system_views": ["caches"]}
+        )
+
+        # Table order doesn't matter, and hidden legacy tables are left out
+        assert first is second
+        assert "paxos" not in first
+
     def test_generate_system_table_description_empty(self):
         """Test generating description with no discovered tables."""
         service = CassandraService(Mock())
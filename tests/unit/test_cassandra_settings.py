@@ -3,11 +3,13 @@
 Tests settings normalization and retrieval across Cassandra versions.
 """
 
+from collections import namedtuple
 from unittest.mock import Mock
 
 import pytest
 
 from ecm.cassandra_settings import (
+    SETTINGS_QUERY,
     AuditLoggingOptions,
     CassandraSettings,
     ClientEncryptionOptions,
@@ -56,25 +58,22 @@ class TestCassandraSettings:
         assert settings.storage_port == 7000
 
     @pytest.mark.asyncio
-    async def test_load_settings_only_once(self, settings_v5, mock_session):
+    async def test_load_settings_only_once(self, settings_v5, mock_session, response_future):
         """Test that load_settings only loads once."""
-        # Mock the query result
-        mock_result = Mock()
-        mock_result.current_rows = 0
-        mock_result.__iter__ = Mock(return_value=iter([]))
-        mock_session.execute = Mock(return_value=mock_result)
+        # Mock the query response
+        mock_session.execute_async = Mock(return_value=response_future([]))
         
         # First load
         await settings_v5.load_settings()
         assert settings_v5._loaded is True
-        mock_session.execute.assert_called_once()
+        mock_session.execute_async.assert_called_once()
         
         # Reset mock
-        mock_session.execute.reset_mock()
+        mock_session.execute_async.reset_mock()
         
         # Second load should not query again
         await settings_v5.load_settings()
-        mock_session.execute.assert_not_called()
+        mock_session.execute_async.assert_not_called()
 
     def test_get_setting_default(self, settings_v5):
         """Test get_setting returns default when key not found."""
@@ -94,6 +93,11 @@ class TestCassandraSettings:
         result = settings_v5.get_setting("audit_logging_options.enabled")
         assert result is True
 
+    def test_get_setting_nested_default(self, settings_v5):
+        """Test get_setting returns default when a nested part is missing."""
+        assert settings_v5.get_setting("audit_logging_options.missing", 5) == 5
+        assert settings_v5.get_setting("missing_options.enabled", 5) == 5
+
     def test_value_conversion_bool(self, settings_v5):
         """Test boolean value conversion."""
         assert settings_v5._convert_value("enabled", "true") is True
@@ -165,13 +169,10 @@ class TestCassandraSettings:
         assert settings_v5.is_audit_logging_enabled is True
 
     @pytest.mark.asyncio
-    async def test_refresh_settings(self, settings_v5, mock_session):
+    async def test_refresh_settings(self, settings_v5, mock_session, response_future):
         """Test refresh_settings clears cache and reloads."""
-        # Mock the query result
-        mock_result = Mock()
-        mock_result.current_rows = 0
-        mock_result.__iter__ = Mock(return_value=iter([]))
-        settings_v5.session.execute = Mock(return_value=mock_result)
+        # Mock the query response
+        settings_v5.session.execute_async = Mock(return_value=response_future([]))
         
         # Set initial state
         settings_v5._loaded = True
@@ -183,19 +184,16 @@ class TestCassandraSettings:
         # Check state was reset and reloaded
         assert settings_v5._loaded is True
         # Should have queried the database
-        settings_v5.session.execute.assert_called_once()
+        settings_v5.session.execute_async.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_load_settings_with_data(self, mock_session):
+    async def test_load_settings_with_data(self, mock_session, response_future):
         """Test loading settings from database."""
         version = CassandraVersion(5, 0, 0)
         settings = CassandraSettings(mock_session, version)
         
-        # Create proper mock rows
-        class MockRow:
-            def __init__(self, name, value):
-                self.name = name
-                self.value = value
+        # Rows are named tuples, as with the driver's default row factory
+        MockRow = namedtuple("MockRow", ["name", "value"])
         
         # Mock query result with some sample settings
         mock_rows = [
@@ -205,11 +203,7 @@ class TestCassandraSettings:
             MockRow("audit_logging_options.enabled", "true"),
             MockRow("client_encryption_options.enabled", "false"),
         ]
-        mock_result = Mock()
-        mock_result.current_rows = len(mock_rows)
-        # Make result iterable
-        mock_result.__iter__ = lambda self: iter(mock_rows)
-        mock_session.execute = Mock(return_value=mock_result)
+        mock_session.execute_async = Mock(return_value=response_future(mock_rows))
         
         await settings.load_settings()
         
@@ -220,6 +214,65 @@ class TestCassandraSettings:
         assert settings.audit_logging_options.enabled is True
         assert settings.client_encryption_options.enabled is False
 
+    @pytest.mark.asyncio
+    async def test_settings_query_prepared_once_per_session(self, mock_session, response_future):
+        """Test the settings query is prepared once and reused across instances."""
+        mock_session.execute_async = Mock(return_value=response_future([]))
+        version = CassandraVersion(5, 0, 0)
+
+        await CassandraSettings(mock_session, version).load_settings()
+        await CassandraSettings(mock_session, version).load_settings()
+
+        mock_session.prepare.assert_called_once_with(SETTINGS_QUERY)
+        assert mock_session.execute_async.call_count == 2
+        mock_session.execute_async.assert_called_with(mock_session.prepare.return_value)
+
+    @pytest.mark.asyncio
+    async def test_load_settings_awaits_pending_response(self, settings_v5, response_future):
+        """Test load_settings awaits the driver callbacks when rows aren't ready yet."""
+        pending = response_future()
+        pending.add_callbacks.side_effect = (
+            lambda callback, errback, callback_args, errback_args: callback(
+                [("cluster_name", "Pending Cluster")],
+                *callback_args,
+            )
+        )
+        settings_v5.session.execute_async = Mock(return_value=pending)
+
+        await settings_v5.load_settings()
+
+        assert settings_v5.cluster_name == "Pending Cluster"
+        pending.add_callbacks.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_load_settings_reads_every_page(self, settings_v5, response_future):
+        """Test load_settings processes rows from every result page, not just the first."""
+        paged = response_future(
+            [("cluster_name", "Paged Cluster")],
+            [("native_transport_port", "9043")],
+        )
+        settings_v5.session.execute_async = Mock(return_value=paged)
+
+        await settings_v5.load_settings()
+
+        assert settings_v5.cluster_name == "Paged Cluster"
+        assert settings_v5.native_transport_port == 9043
+        paged.start_fetching_next_page.assert_called_once()
+
+    def test_process_nested_settings(self, settings_v5):
+        """Test nested settings are routed to their option groups."""
+        settings_v5._process_setting("sai_options.segment_write_buffer_size", "512MiB")
+        settings_v5._process_setting("repair.retries.max_attempts", "5")
+        settings_v5._process_setting("repair.retries", "true")
+        settings_v5._process_setting("unknown_group.enabled", "true")
+        settings_v5._process_setting("audit_logging_options.logger.class_name", "FileAuditLogger")
+        settings_v5._process_setting("audit_logging_options.no_such_field", "true")
+
+        assert settings_v5.sai_options.segment_write_buffer_size == "512MiB"
+        assert settings_v5.repair_options.retries_max_attempts == 5
+        assert settings_v5.repair_options.retries_enabled is False
+        assert settings_v5.audit_logging_options.logger_class_name == "FileAuditLogger"
+
     @pytest.mark.asyncio
     async def test_version_compatibility(self, mock_session):
         """Test handling of older Cassandra versions."""
@@ -230,7 +283,7 @@ class TestCassandraSettings:
         await settings.load_settings()
         
         # Should not have queried
-        mock_session.execute.assert_not_called()
+        mock_session.execute_async.assert_not_called()
         assert settings._loaded is True
 
     def test_version_specific_settings(self, mock_session):
@@ -113,6 +113,29 @@ class TestCassandraTable:
             assert strategy["class"] == "SizeTieredCompactionStrategy"
             assert strategy["options"] == {}
 
+    @pytest.mark.asyncio
+    async def test_get_compaction_strategy_cached_until_options_change(self, table):
+        """Test the parsed strategy is reused until metadata.options is replaced."""
+        mock_metadata = Mock()
+        mock_metadata.options = {
+            "compaction": {"class": "LeveledCompactionStrategy", "sstable_size_in_mb": "160"}
+        }
+
+        with patch.object(table, "_get_metadata", return_value=mock_metadata):
+            first = await table.get_compaction_strategy()
+            second = await table.get_compaction_strategy()
+            assert second is first
+            assert "class" in mock_metadata.options["compaction"]
+
+            # A schema change swaps in a new options dict
+            mock_metadata.options = {
+                "compaction": {"class": "SizeTieredCompactionStrategy"}
+            }
+            third = await table.get_compaction_strategy()
+
+            assert third["class"] == "SizeTieredCompactionStrategy"
+            assert third["options"] == {}
+
     @pytest.mark.asyncio
     async def test_get_create_statement(self, table):
         """Test getting CREATE TABLE statement."""
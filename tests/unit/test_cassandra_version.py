@@ -18,6 +18,16 @@ class TestCassandraVersion:
         assert version.minor == 0
         assert version.patch == 1
 
+    def test_from_string(self):
+        """Test parsing release version strings."""
+        assert CassandraVersion.from_string("4.0.11") == CassandraVersion(4, 0, 11)
+        assert CassandraVersion.from_string("5.0.0-SNAPSHOT") == CassandraVersion(5, 0, 0)
+        assert CassandraVersion.from_string("4.1") == CassandraVersion(4, 1, 0)
+        assert CassandraVersion.from_string("5") == CassandraVersion(5, 0, 0)
+
+        with pytest.raises(ValueError):
+            CassandraVersion.from_string("a.b.c")
+
     def test_string_representation(self):
         """Test string representation of CassandraVersion."""
         version = CassandraVersion(4, 0, 11)
@@ -41,6 +41,9 @@ def mock_thread_pool_stats():
     # Default empty lists for get methods
     stats.get_blocked_pools = Mock(return_value=[])
     stats.get_pools_with_pending = Mock(return_value=[])
+    stats.get_blocked_and_pending_pools = Mock(
+        side_effect=lambda: (stats.get_blocked_pools(), stats.get_pools_with_pending())
+    )
     
     return stats
 
@@ -278,6 +281,7 @@ class TestThreadPoolAnalyzer:
         """Test detection of blocked tasks."""
         # Create a pool with blocked tasks
         blocked_pool = ThreadPoolStat(
+            name="ReadStage",
             active=10,
             active_limit=10,
             blocked=5,  # Blocked tasks
@@ -300,12 +304,14 @@ class TestThreadPoolAnalyzer:
         assert rec.priority == RecommendationPriority.HIGH
         assert "5 blocked tasks" in rec.reason
         assert "resource contention" in rec.reason
+        assert rec.pool_name == "ReadStage"
     
     @pytest.mark.asyncio
     async def test_other_pools_with_high_pending(self, mock_thread_pool_stats, mock_cassandra_settings):
         """Test detection of high pending in other pools."""
         # Create a pool with high pending tasks
         pending_pool = ThreadPoolStat(
+            name="MigrationStage",
             active=1,
             active_limit=1,
             blocked=0,
@@ -402,26 +408,3 @@ class TestThreadPoolAnalyzer:
         assert RecommendationCategory.CAPACITY in categories
         assert RecommendationCategory.PERFORMANCE in categories
         assert RecommendationCategory.CONFIGURATION in categories
-    
-    def test_get_pool_name(self, mock_thread_pool_stats, mock_cassandra_settings):
-        """Test _get_pool_name helper method."""
-        # Create a pool and assign it to a property
-        test_pool = ThreadPoolStat(
-            active=1, active_limit=2, blocked=0,
-            blocked_all_time=0, completed=10, pending=0
-        )
-        mock_thread_pool_stats.compaction_executor = test_pool
-        
-        analyzer = ThreadPoolAnalyzer(mock_thread_pool_stats, mock_cassandra_settings)
-        
-        # Should identify the pool name correctly
-        name = analyzer._get_pool_name(test_pool)
-        assert name == "CompactionExecutor"
-        
-        # Unknown pool should return "Unknown"
-        unknown_pool = ThreadPoolStat(
-            active=0, active_limit=0, blocked=0,
-            blocked_all_time=0, completed=0, pending=0
-        )
-        name = analyzer._get_pool_name(unknown_pool)
-        assert name == "Unknown"
\ No newline at end of file
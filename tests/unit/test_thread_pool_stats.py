@@ -3,11 +3,12 @@
 Tests thread pool statistics retrieval and management.
 """
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
-from ecm.thread_pool_stats import ThreadPoolStat, ThreadPoolStats
+from ecm.constants import THREAD_POOL_STATS_TTL
+from ecm.thread_pool_stats import THREAD_POOLS_QUERY, ThreadPoolStat, ThreadPoolStats
 
 
 class TestThreadPoolStats:
@@ -72,20 +73,19 @@ class TestThreadPoolStats:
         assert thread_pool_stats._loaded is False
     
     @pytest.mark.asyncio
-    async def test_load_stats(self, thread_pool_stats, mock_session, sample_thread_pool_data):
+    async def test_load_stats(self, thread_pool_stats, mock_session, sample_thread_pool_data, response_future):
         """Test loading thread pool statistics."""
         # Mock the query result
-        mock_result = Mock()
-        mock_result.__iter__ = Mock(return_value=iter(sample_thread_pool_data))
-        mock_session.execute = Mock(return_value=mock_result)
+        mock_session.execute_async = Mock(return_value=response_future(sample_thread_pool_data))
         
         # Load statistics
         await thread_pool_stats.load_stats()
         
         # Verify the query was executed
-        mock_session.execute.assert_called_once()
-        query = mock_session.execute.call_args[0][0]
-        assert "system_views.thread_pools" in query
+        mock_session.execute_async.assert_called_once()
+        mock_session.prepare.assert_called_once_with(THREAD_POOLS_QUERY)
+        mock_session.execute_async.assert_called_once_with(mock_session.prepare.return_value)
+        assert "system_views.thread_pools" in THREAD_POOLS_QUERY
         
         # Verify pools were loaded
         assert thread_pool_stats._loaded is True
@@ -94,22 +94,21 @@ class TestThreadPoolStats:
         # Verify specific pool data
         compaction = thread_pool_stats.get_pool("CompactionExecutor")
         assert compaction is not None
+        assert compaction.name == "CompactionExecutor"
         assert compaction.active == 0
         assert compaction.active_limit == 2
         assert compaction.completed == 139
         
         # Test that second load doesn't query again
-        mock_session.execute.reset_mock()
+        mock_session.execute_async.reset_mock()
         await thread_pool_stats.load_stats()
-        mock_session.execute.assert_not_called()
+        mock_session.execute_async.assert_not_called()
     
     @pytest.mark.asyncio
-    async def test_properties_access(self, thread_pool_stats, mock_session, sample_thread_pool_data):
+    async def test_properties_access(self, thread_pool_stats, mock_session, sample_thread_pool_data, response_future):
         """Test accessing thread pools via properties."""
         # Mock and load data
-        mock_result = Mock()
-        mock_result.__iter__ = Mock(return_value=iter(sample_thread_pool_data))
-        mock_session.execute = Mock(return_value=mock_result)
+        mock_session.execute_async = Mock(return_value=response_future(sample_thread_pool_data))
         
         await thread_pool_stats.load_stats()
         
@@ -130,12 +129,10 @@ class TestThreadPoolStats:
         assert thread_pool_stats.read_stage.completed == 13
     
     @pytest.mark.asyncio
-    async def test_get_pool(self, thread_pool_stats, mock_session, sample_thread_pool_data):
+    async def test_get_pool(self, thread_pool_stats, mock_session, sample_thread_pool_data, response_future):
         """Test getting pools by name."""
         # Mock and load data
-        mock_result = Mock()
-        mock_result.__iter__ = Mock(return_value=iter(sample_thread_pool_data))
-        mock_session.execute = Mock(return_value=mock_result)
+        mock_session.execute_async = Mock(return_value=response_future(sample_thread_pool_data))
         
         await thread_pool_stats.load_stats()
         
@@ -149,12 +146,10 @@ class TestThreadPoolStats:
         assert pool is None
     
     @pytest.mark.asyncio
-    async def test_get_all_pools(self, thread_pool_stats, mock_session, sample_thread_pool_data):
+    async def test_get_all_pools(self, thread_pool_stats, mock_session, sample_thread_pool_data, response_future):
         """Test getting all pools."""
         # Mock and load data
-        mock_result = Mock()
-        mock_result.__iter__ = Mock(return_value=iter(sample_thread_pool_data))
-        mock_session.execute = Mock(return_value=mock_result)
+        mock_session.execute_async = Mock(return_value=response_future(sample_thread_pool_data))
         
         await thread_pool_stats.load_stats()
         
@@ -165,26 +160,25 @@ class TestThreadPoolStats:
         assert "Native-Transport-Requests" in all_pools
     
     @pytest.mark.asyncio
-    async def test_refresh(self, thread_pool_stats, mock_session, sample_thread_pool_data):
+    async def test_refresh(self, thread_pool_stats, mock_session, sample_thread_pool_data, response_future):
         """Test refreshing statistics."""
         # Mock and load data
-        mock_result = Mock()
-        mock_result.__iter__ = Mock(return_value=iter(sample_thread_pool_data))
-        mock_session.execute = Mock(return_value=mock_result)
+        mock_session.execute_async = Mock(return_value=response_future(sample_thread_pool_data))
         
         await thread_pool_stats.load_stats()
         assert thread_pool_stats._loaded is True
         
         # Reset mock and refresh
-        mock_session.execute.reset_mock()
+        mock_session.execute_async.reset_mock()
         await thread_pool_stats.refresh()
         
-        # Should query again
-        mock_session.execute.assert_called_once()
+        # Should query again, reusing the statement prepared on the first load
+        mock_session.execute_async.assert_called_once()
+        mock_session.prepare.assert_called_once_with(THREAD_POOLS_QUERY)
         assert thread_pool_stats._loaded is True
     
     @pytest.mark.asyncio
-    async def test_get_high_activity_pools(self, thread_pool_stats, mock_session):
+    async def test_get_high_activity_pools(self, thread_pool_stats, mock_session, response_future):
         """Test getting high activity pools."""
         # Create data with some active tasks
         rows = []
@@ -199,9 +193,7 @@ class TestThreadPoolStats:
             row.pending_tasks = 0
             rows.append(row)
         
-        mock_result = Mock()
-        mock_result.__iter__ = Mock(return_value=iter(rows))
-        mock_session.execute = Mock(return_value=mock_result)
+        mock_session.execute_async = Mock(return_value=response_future(rows))
         
         await thread_pool_stats.load_stats()
         
@@ -216,7 +208,7 @@ class TestThreadPoolStats:
         # Only Pool3 has 20 active
     
     @pytest.mark.asyncio
-    async def test_get_blocked_pools(self, thread_pool_stats, mock_session):
+    async def test_get_blocked_pools(self, thread_pool_stats, mock_session, response_future):
         """Test getting pools with blocked tasks."""
         # Create data with some blocked tasks
         rows = []
@@ -231,9 +223,7 @@ class TestThreadPoolStats:
             row.pending_tasks = 0
             rows.append(row)
         
-        mock_result = Mock()
-        mock_result.__iter__ = Mock(return_value=iter(rows))
-        mock_session.execute = Mock(return_value=mock_result)
+        mock_session.execute_async = Mock(return_value=response_future(rows))
         
         await thread_pool_stats.load_stats()
         
@@ -242,7 +232,7 @@ class TestThreadPoolStats:
         # Pool2 and Pool3 have blocked tasks
     
     @pytest.mark.asyncio
-    async def test_get_pools_with_pending(self, thread_pool_stats, mock_session):
+    async def test_get_pools_with_pending(self, thread_pool_stats, mock_session, response_future):
         """Test getting pools with pending tasks."""
         # Create data with some pending tasks
         rows = []
@@ -257,9 +247,7 @@ class TestThreadPoolStats:
             row.pending_tasks = pending
             rows.append(row)
         
-        mock_result = Mock()
-        mock_result.__iter__ = Mock(return_value=iter(rows))
-        mock_session.execute = Mock(return_value=mock_result)
+        mock_session.execute_async = Mock(return_value=response_future(rows))
         
         await thread_pool_stats.load_stats()
         
@@ -268,12 +256,35 @@ class TestThreadPoolStats:
         # Pool2 and Pool3 have pending tasks
     
     @pytest.mark.asyncio
-    async def test_get_pool_summary(self, thread_pool_stats, mock_session, sample_thread_pool_data):
+    async def test_get_blocked_and_pending_pools(self, thread_pool_stats, mock_session, response_future):
+        """Test classifying blocked and pending pools in one pass."""
+        rows = []
+        for name, blocked, pending in [("Pool1", 0, 0), ("Pool2", 5, 0), ("Pool3", 2, 7), ("Pool4", 0, 3)]:
+            row = Mock()
+            row.name = name
+            row.active_tasks = 0
+            row.active_tasks_limit = 100
+            row.blocked_tasks = blocked
+            row.blocked_tasks_all_time = blocked
+            row.completed_tasks = 0
+            row.pending_tasks = pending
+            rows.append(row)
+        
+        mock_session.execute_async = Mock(return_value=response_future(rows))
+        
+        await thread_pool_stats.load_stats()
+        
+        blocked, pending = thread_pool_stats.get_blocked_and_pending_pools()
+        assert blocked == thread_pool_stats.get_blocked_pools()
+        assert pending == thread_pool_stats.get_pools_with_pending()
+        assert [pool.name for pool in blocked] == ["Pool2", "Pool3"]
+        assert [pool.name for pool in pending] == ["Pool3", "Pool4"]
+    
+    @pytest.mark.asyncio
+    async def test_get_pool_summary(self, thread_pool_stats, mock_session, sample_thread_pool_data, response_future):
         """Test getting pool summary."""
         # Mock and load data
-        mock_result = Mock()
-        mock_result.__iter__ = Mock(return_value=iter(sample_thread_pool_data))
-        mock_session.execute = Mock(return_value=mock_result)
+        mock_session.execute_async = Mock(return_value=response_future(sample_thread_pool_data))
         
         await thread_pool_stats.load_stats()
         
@@ -294,21 +305,58 @@ class TestThreadPoolStats:
     async def test_error_handling(self, thread_pool_stats, mock_session):
         """Test error handling during load."""
         # Mock execute to raise an exception
-        mock_session.execute = Mock(side_effect=Exception("Connection error"))
+        mock_session.execute_async = Mock(side_effect=Exception("Connection error"))
         
-        # Should raise and still mark as loaded to prevent repeated failures
+        # Should raise and leave the stats unloaded
         with pytest.raises(Exception, match="Connection error"):
             await thread_pool_stats.load_stats()
         
-        assert thread_pool_stats._loaded is True
+        assert thread_pool_stats._loaded is False
+        assert thread_pool_stats.is_loaded() is False
+    
+    @pytest.mark.asyncio
+    async def test_failed_load_is_retried(self, thread_pool_stats, mock_session, sample_thread_pool_data, response_future):
+        """Test that a failed load queries again on the next call instead of caching the failure."""
+        mock_session.execute_async = Mock(
+            side_effect=[Exception("Connection error"), response_future(sample_thread_pool_data)]
+        )
+        
+        with pytest.raises(Exception, match="Connection error"):
+            await thread_pool_stats.load_stats()
+        
+        await thread_pool_stats.load_stats()
+        
+        assert mock_session.execute_async.call_count == 2
+        assert thread_pool_stats.is_loaded() is True
+        assert len(thread_pool_stats.get_all_pools()) == 19
     
     def test_is_loaded(self, thread_pool_stats):
         """Test checking if statistics are loaded."""
         assert thread_pool_stats.is_loaded() is False
         
-        thread_pool_stats._loaded = True
+        thread_pool_stats._mark_loaded()
         assert thread_pool_stats.is_loaded() is True
     
+    @pytest.mark.asyncio
+    async def test_load_stats_reloads_after_ttl(self, thread_pool_stats, mock_session, sample_thread_pool_data, response_future):
+        """Test that statistics older than the TTL are queried again."""
+        mock_session.execute_async = Mock(return_value=response_future(sample_thread_pool_data))
+        
+        with patch("ecm.thread_pool_stats.time.monotonic", return_value=1000.0):
+            await thread_pool_stats.load_stats()
+        
+        # Still fresh just inside the TTL
+        with patch("ecm.thread_pool_stats.time.monotonic", return_value=1000.0 + THREAD_POOL_STATS_TTL - 1):
+            assert thread_pool_stats.is_loaded() is True
+            await thread_pool_stats.load_stats()
+        mock_session.execute_async.assert_called_once()
+        
+        # Expired once the TTL has passed
+        with patch("ecm.thread_pool_stats.time.monotonic", return_value=1000.0 + THREAD_POOL_STATS_TTL):
+            assert thread_pool_stats.is_loaded() is False
+            await thread_pool_stats.load_stats()
+        assert mock_session.execute_async.call_count == 2
+    
     def test_thread_pool_stat_dataclass(self):
         """Test ThreadPoolStat dataclass."""
         pool = ThreadPoolStat(